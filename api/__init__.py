@@ -0,0 +1 @@
+"""Inter-Sight API Module"""
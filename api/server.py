@@ -0,0 +1,477 @@
+"""Inter-Sight HTTP Service - upload CVs, run match jobs, fetch and stream results
+
+Usage:
+    python -m api.server [--host 127.0.0.1] [--port 8080]
+
+Endpoints:
+    GET    /health
+    POST   /cvs                      multipart files/archives, or {"cvs": [...]} -> {"upload_id", ...}
+    POST   /jobs                     {"company": {...}, "upload_id" | "cvs", options} -> 202 {"job_id", ...}
+                                     options: analysis_mode, shortlist_size, shortlist_min_score, dedup,
+                                     dedup_threshold, llm_provider ("mock" offline), feedback
+    GET    /jobs                     jobs in memory, newest first
+    GET    /jobs/{job_id}            status and progress
+    GET    /jobs/{job_id}/results    ranked results (partial while running), ?offset=&limit=
+    GET    /jobs/{job_id}/stream     NDJSON: one line per finished analysis, then an "end" line
+    GET    /jobs/{job_id}/results/{rank}/feedback
+                                     feedback letter of one result (generated on first request)
+    DELETE /jobs/{job_id}            cancel
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from core.config import settings
+from core.llm_provider import PROVIDERS
+from processors.archive_ingest import expand_archives
+from processors.bulk_ingest import parse_many
+from processors.job_runner import CANCELLED, DONE, FAILED, RUNNING, Job, load_job, persist_job, plain_result
+from processors.simple_matcher import ANALYSIS_MODES, MatchResult, amatch_candidates
+from utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_UPLOADS = 64
+
+# Job options accepted from clients, passed to amatch_candidates
+JOB_OPTIONS = ("analysis_mode", "shortlist_size", "shortlist_min_score", "dedup", "dedup_threshold", "llm_provider")
+
+
+class MatchService:
+    """
+    Job state of the HTTP service
+
+    Jobs run as tasks on the server's event loop. Every job for the same
+    provider shares one semaphore, so however many jobs are queued, at
+    most provider_concurrency candidates are in LLM analysis per provider
+    at a time. Uploaded CVs are kept (LRU) until a job references them.
+    """
+
+    def __init__(self, provider_concurrency: int = 8, persist_dir: Optional[str] = None,
+                 max_jobs: int = 64):
+        self.provider_concurrency = max(1, provider_concurrency)
+        self.persist_dir = persist_dir
+        self.max_jobs = max_jobs
+        self.uploads = LRUCache(max_entries=MAX_UPLOADS)
+        self.jobs: Dict[str, Job] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._listeners: Dict[str, List[asyncio.Queue]] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        # One thread, so a job's status writes land in order
+        self._persist_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-persist")
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    def semaphore(self, provider: Optional[str] = None) -> asyncio.Semaphore:
+        provider = provider or settings.llm_provider
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = self._semaphores[provider] = asyncio.Semaphore(self.provider_concurrency)
+        return semaphore
+
+    async def parse_uploads(self, uploads: List) -> Dict:
+        """Parse (file_name, bytes) uploads on the ingest pool; returns the upload record"""
+        def parse() -> List:
+            return list(parse_many(expand_archives(uploads), max_workers=settings.ingest_workers or None,
+                                   timeout=settings.ingest_timeout_seconds))
+
+        results = await asyncio.get_running_loop().run_in_executor(None, parse)
+        cvs, files, errors = [], [], []
+        for result in results:
+            if result.ok and "name" in result.data:
+                files.append({"index": len(cvs), "file": result.name, "name": result.data.get("name", "Unknown")})
+                cvs.append(result.data)
+            else:
+                errors.append({"file": result.name, "error": result.error or "Could not parse"})
+        return self.add_upload(cvs, files, errors)
+
+    def add_upload(self, cvs: List[Dict], files: List[Dict], errors: Optional[List[Dict]] = None) -> Dict:
+        upload_id = uuid.uuid4().hex
+        self.uploads.set(upload_id, cvs)
+        return {"upload_id": upload_id, "count": len(cvs), "cvs": files, "errors": errors or []}
+
+    def submit(self, company_profile: Dict, candidates: List[Dict], options: Dict) -> Job:
+        job = Job(uuid.uuid4().hex, company_profile, candidates, options)
+        self.jobs[job.id] = job
+        self._listeners[job.id] = []
+        self._trim()
+        self.persist(job)
+        self._tasks[job.id] = asyncio.ensure_future(self._run(job))
+        logger.info(f"Job {job.id}: queued {job.submitted} candidates")
+        return job
+
+    def get(self, job_id: str):
+        job = self.jobs.get(job_id)
+        return job if job is not None else load_job(self.persist_dir, job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        task = self._tasks.get(job_id)
+        if job is None or job.finished or task is None:
+            return False
+        job.request_cancel()
+        task.cancel()
+        if job.started_at is None:
+            # Never started, so _run won't get to record it
+            self._finish(job, CANCELLED)
+        return True
+
+    def cancel_all(self):
+        for job_id in list(self._tasks):
+            self.cancel(job_id)
+
+    def subscribe(self, job: Job) -> asyncio.Queue:
+        """Queue of (position, analysis) events; None marks the end"""
+        queue = asyncio.Queue()
+        if job.finished:
+            queue.put_nowait(None)
+        else:
+            self._listeners.setdefault(job.id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, job: Job, queue: asyncio.Queue):
+        listeners = self._listeners.get(job.id)
+        if listeners and queue in listeners:
+            listeners.remove(queue)
+
+    def persist(self, job: Job):
+        """Write the job to persist_dir on the persistence thread (JSON of all results is slow)"""
+        if self.persist_dir:
+            self._persist_executor.submit(persist_job, self.persist_dir, job)
+
+    def close(self):
+        """Cancel running jobs and flush pending writes"""
+        self.cancel_all()
+        self._persist_executor.shutdown(wait=True)
+
+    async def _run(self, job: Job):
+
+        def on_result(position: int, analysis: Dict, expected: int):
+            job.record_result(position, analysis, expected)
+            for queue in self._listeners.get(job.id, ()):
+                queue.put_nowait((position, analysis))
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            results = await amatch_candidates(job.company_profile, job.candidates, on_result=on_result,
+                                              semaphore=self.semaphore(job.options.get("llm_provider")),
+                                              **job.options)
+        except asyncio.CancelledError:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            self._finish(job, FAILED)
+        else:
+            job.complete(results)
+            self._finish(job, DONE)
+
+    def _finish(self, job: Job, status: str):
+        job.status = status
+        job.finished_at = time.time()
+        job.candidates = []
+        self._tasks.pop(job.id, None)
+        for queue in self._listeners.pop(job.id, ()):
+            queue.put_nowait(None)
+        self.persist(job)
+        elapsed = job.finished_at - (job.started_at or job.created_at)
+        logger.info(f"Job {job.id}: {status} after {elapsed:.1f}s")
+
+    def _trim(self):
+        """Forget the oldest finished jobs beyond max_jobs (they stay on disk)"""
+        finished = sorted((job for job in self.jobs.values() if job.finished), key=lambda j: j.created_at)
+        for job in finished[:max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[job.id]
+
+
+def _error(status: int, message: str) -> web.Response:
+    return web.json_response({"error": message}, status=status)
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    return web.json_response(data, status=status, dumps=_dumps)
+
+
+def _as_bool(value) -> bool:
+    if isinstance(value, str):
+        if value.lower() in ("1", "true", "yes", "on"):
+            return True
+        if value.lower() in ("0", "false", "no", "off", ""):
+            return False
+        raise ValueError(f"Expected a boolean, got {value!r}")
+    return bool(value)
+
+
+def _job_options(body: Dict) -> Dict:
+    """match options from a job request (ValueError on bad input)"""
+    options = {key: body[key] for key in JOB_OPTIONS if body.get(key) is not None}
+    options.setdefault("analysis_mode", settings.analysis_mode)
+    options.setdefault("dedup", settings.dedup_enabled)
+    options.setdefault("dedup_threshold", settings.dedup_threshold)
+    if options["analysis_mode"] not in ANALYSIS_MODES:
+        raise ValueError(f"analysis_mode must be one of {', '.join(ANALYSIS_MODES)}")
+    if options.get("llm_provider", settings.llm_provider) not in PROVIDERS:
+        raise ValueError(f"llm_provider must be one of {', '.join(PROVIDERS)}")
+    if "shortlist_size" in options:
+        options["shortlist_size"] = int(options["shortlist_size"])
+        if options["shortlist_size"] < 1:
+            raise ValueError("shortlist_size must be at least 1")
+    if "shortlist_min_score" in options:
+        options["shortlist_min_score"] = float(options["shortlist_min_score"])
+    options["dedup"] = _as_bool(options["dedup"])
+    options["dedup_threshold"] = float(options["dedup_threshold"])
+    if not 0.0 <= options["dedup_threshold"] <= 1.0:
+        raise ValueError("dedup_threshold must be between 0 and 1")
+    # Letters cost one LLM call each: generated up front only on request,
+    # otherwise per result through the feedback endpoint
+    options["lazy_feedback"] = not _as_bool(body.get("feedback", False))
+    return options
+
+
+async def health(request: web.Request) -> web.Response:
+    service: MatchService = request.app["service"]
+    running = sum(1 for job in service.jobs.values() if not job.finished)
+    return _json_response({"status": "ok", "jobs_running": running, "provider": settings.llm_provider})
+
+
+async def upload_cvs(request: web.Request) -> web.Response:
+    service: MatchService = request.app["service"]
+
+    if request.content_type == "application/json":
+        try:
+            body = await request.json()
+            cvs = body["cvs"]
+        except (ValueError, KeyError, TypeError):
+            return _error(400, 'Expected {"cvs": [...]}')
+        if not isinstance(cvs, list) or not all(isinstance(cv, dict) for cv in cvs):
+            return _error(400, '"cvs" must be a list of CV objects')
+        files = [{"index": idx, "file": None, "name": cv.get("name", "Unknown")} for idx, cv in enumerate(cvs)]
+        return _json_response(service.add_upload(cvs, files), status=201)
+
+    if not request.content_type.startswith("multipart/"):
+        return _error(415, "Send multipart/form-data files or a JSON body")
+
+    # client_max_size doesn't cover multipart streams, so the total is enforced here
+    limit = settings.api_max_upload_bytes
+    total = 0
+    uploads = []
+    reader = await request.multipart()
+    async for part in reader:
+        if not part.filename:
+            continue
+        chunks = []
+        while True:
+            chunk = await part.read_chunk()
+            if not chunk:
+                break
+            total += len(chunk)
+            if limit and total > limit:
+                return _error(413, f"Upload exceeds {limit} bytes")
+            chunks.append(chunk)
+        uploads.append((part.filename, b"".join(chunks)))
+    if not uploads:
+        return _error(400, "No files in the upload")
+    return _json_response(await service.parse_uploads(uploads), status=201)
+
+
+async def submit_job(request: web.Request) -> web.Response:
+    service: MatchService = request.app["service"]
+    try:
+        body = await request.json()
+    except ValueError:
+        return _error(400, "Invalid JSON body")
+
+    company = body.get("company") if isinstance(body, dict) else None
+    if not isinstance(company, dict):
+        return _error(400, '"company" profile is required')
+
+    if body.get("upload_id"):
+        candidates = service.uploads.get(body["upload_id"])
+        if candidates is None:
+            return _error(404, "Unknown or expired upload_id")
+    elif "cvs" in body:
+        candidates = body["cvs"]
+        if not isinstance(candidates, list) or not all(isinstance(cv, dict) for cv in candidates):
+            return _error(400, '"cvs" must be a list of CV objects')
+    else:
+        return _error(400, 'Provide "upload_id" or "cvs"')
+    if not candidates:
+        return _error(400, "No CVs to match")
+
+    try:
+        options = _job_options(body)
+    except (ValueError, TypeError) as e:
+        return _error(400, str(e))
+
+    job = service.submit(company, candidates, options)
+    return _json_response(job.status_dict(), status=202)
+
+
+async def list_jobs(request: web.Request) -> web.Response:
+    service: MatchService = request.app["service"]
+    jobs = sorted(service.jobs.values(), key=lambda j: j.created_at, reverse=True)
+    return _json_response({"jobs": [job.status_dict() for job in jobs]})
+
+
+def _get_job(request: web.Request):
+    job = request.app["service"].get(request.match_info["job_id"])
+    if job is None:
+        raise web.HTTPNotFound(text=_dumps({"error": "Unknown job"}), content_type="application/json")
+    return job
+
+
+async def job_status(request: web.Request) -> web.Response:
+    return _json_response(_get_job(request).status_dict())
+
+
+async def job_results(request: web.Request) -> web.Response:
+    job = _get_job(request)
+    try:
+        offset = max(0, int(request.query.get("offset", 0)))
+        limit = min(MAX_PAGE_SIZE, max(1, int(request.query.get("limit", DEFAULT_PAGE_SIZE))))
+    except ValueError:
+        return _error(400, "offset and limit must be integers")
+
+    ranked = job.ranked()
+    page = ranked[offset:offset + limit]
+    return _json_response({
+        "job_id": job.id,
+        "status": job.status,
+        "partial": not job.finished,
+        "total": len(ranked),
+        "offset": offset,
+        "limit": limit,
+        "results": [plain_result(result) for result in page],
+    })
+
+
+async def result_feedback(request: web.Request) -> web.Response:
+    """Feedback letter of the result at {rank} in the job's current ranking"""
+    job = _get_job(request)
+    try:
+        rank = int(request.match_info["rank"])
+    except ValueError:
+        return _error(400, "rank must be an integer")
+
+    ranked = job.ranked()
+    if not 1 <= rank <= len(ranked):
+        return _error(404, "No result at that rank")
+    result = ranked[rank - 1]
+
+    if isinstance(result, MatchResult) and not result.feedback_ready:
+        # One LLM call: off the event loop, under the provider's concurrency cap
+        service: MatchService = request.app["service"]
+        async with service.semaphore(job.options.get("llm_provider")):
+            feedback = await asyncio.to_thread(result.resolve_feedback)
+    else:
+        feedback = result.get("feedback")
+    if feedback is None:
+        return _error(404, 'Feedback was not generated for this job (submit with "feedback": true)')
+    return _json_response({"job_id": job.id, "rank": rank, "name": result.get("name"), "feedback": feedback})
+
+
+async def stream_results(request: web.Request) -> web.StreamResponse:
+    """NDJSON stream: results already finished, then each new one as it lands"""
+    service: MatchService = request.app["service"]
+    job = _get_job(request)
+
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+    await response.prepare(request)
+
+    async def send(data: Dict):
+        await response.write((_dumps(data) + "\n").encode("utf-8"))
+
+    # Snapshot and subscribe with no await in between, so no result is missed or repeated
+    if job.finished:
+        backlog = [(None, result) for result in job.ranked()]
+    else:
+        backlog = job.partial_results()
+    queue = service.subscribe(job)
+    try:
+        for position, result in backlog:
+            await send({"event": "result", "position": position, "result": plain_result(result)})
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            position, result = item
+            await send({"event": "result", "position": position, "result": plain_result(result)})
+        await send({"event": "end", **job.status_dict()})
+    finally:
+        service.unsubscribe(job, queue)
+    await response.write_eof()
+    return response
+
+
+async def cancel_job(request: web.Request) -> web.Response:
+    service: MatchService = request.app["service"]
+    job = _get_job(request)
+    if not service.cancel(job.id):
+        return _error(409, f"Job is {job.status}")
+    return _json_response({"job_id": job.id, "status": "cancelling"}, status=202)
+
+
+def create_app(service: Optional[MatchService] = None) -> web.Application:
+    """aiohttp application (service defaults to one built from settings)"""
+    if service is None:
+        service = MatchService(
+            provider_concurrency=settings.api_provider_concurrency,
+            persist_dir=settings.jobs_path or None,
+            max_jobs=settings.job_memory_limit
+        )
+
+    app = web.Application(client_max_size=settings.api_max_upload_bytes)
+    app["service"] = service
+    app.add_routes([
+        web.get("/health", health),
+        web.post("/cvs", upload_cvs),
+        web.post("/jobs", submit_job),
+        web.get("/jobs", list_jobs),
+        web.get("/jobs/{job_id}", job_status),
+        web.get("/jobs/{job_id}/results", job_results),
+        web.get("/jobs/{job_id}/stream", stream_results),
+        web.get("/jobs/{job_id}/results/{rank}/feedback", result_feedback),
+        web.delete("/jobs/{job_id}", cancel_job),
+    ])
+
+    async def cancel_running(app: web.Application):
+        service.cancel_all()
+
+    async def close_service(app: web.Application):
+        await asyncio.to_thread(service.close)
+
+    app.on_shutdown.append(cancel_running)
+    app.on_cleanup.append(close_service)
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inter-Sight matching service")
+    parser.add_argument("--host", default=settings.api_host)
+    parser.add_argument("--port", type=int, default=settings.api_port)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    web.run_app(create_app(), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 """Inter-Sight Core Module"""
 
 from .config import settings
-from .llm_provider import get_llm, LLMProvider
+from .llm_provider import get_llm, clear_llm_registry, LLMProvider
 
-__all__ = ["settings", "get_llm", "LLMProvider"]
+__all__ = ["settings", "get_llm", "clear_llm_registry", "LLMProvider"]
@@ -14,10 +14,54 @@ class Settings(BaseSettings):
     claude_api_key: Optional[str] = None
     openai_api_key: Optional[str] = None
     
+    # Mock Provider (LLM_PROVIDER=mock): offline, deterministic responses for tests and load runs
+    mock_latency_distribution: str = "lognormal"  # none, fixed, uniform, normal, lognormal, exponential
+    mock_latency_ms: float = 0.0  # median latency per call
+    mock_latency_jitter: float = 0.5  # spread (relative; sigma for lognormal)
+    mock_error_rate: float = 0.0  # share of calls failing with MockLLMError
+    mock_rate_limit_rate: float = 0.0  # share of calls rejected with MockRateLimitError
+    mock_seed: int = 0
+    
+    # LLM Response Cache
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ".cache/llm_responses.sqlite"
+    llm_cache_ttl_seconds: int = 7 * 24 * 3600
+    llm_cache_max_entries: int = 20000
+    llm_cache_memory_entries: int = 512
+    
+    # CV Ingestion
+    ingest_workers: int = 0  # parser processes (0 = one per CPU)
+    ingest_timeout_seconds: int = 60  # per-file parse budget
+    cv_cache_enabled: bool = True
+    cv_cache_path: str = ".cache/parsed_cvs.sqlite"
+    cv_cache_max_bytes: int = 512 * 1024 * 1024
+    talent_pool_enabled: bool = True  # keep parsed CVs in a persistent Parquet pool
+    talent_pool_path: str = ".cache/talent_pool"
+    watch_manifest_path: str = ".cache/watch_manifest.sqlite"
+    watch_interval_seconds: int = 30
+    archive_max_member_bytes: int = 25 * 1024 * 1024  # larger files inside ZIP/TAR uploads are skipped
+    pdf_backend: str = "pypdf2"  # "pypdf2" or "pdfplumber" (python -m processors.pdf_benchmark to compare)
+    pdf_max_pages: int = 30  # pages extracted per PDF (0 = all)
+    pdf_max_chars: int = 200_000  # characters extracted per PDF (0 = all)
+    
     # App Configuration
     app_debug: bool = False
     max_batch_cvs: int = 20
     feedback_mode: str = "hybrid"
+    analysis_mode: str = "multi"  # "multi" (one call per stage) or "fused" (single call)
+    lazy_feedback: bool = True  # generate feedback letters only when first viewed
+    shortlist_size: int = 0  # >0: only the top N locally-scored CVs get LLM analysis
+    dedup_enabled: bool = True  # analyze one CV per near-duplicate cluster
+    dedup_threshold: float = 0.8  # MinHash similarity at which CVs count as duplicates
+    job_workers: int = 2  # matching jobs run at once in the background
+    jobs_path: str = ".cache/jobs"  # finished job results, fetchable by id after a restart
+    job_memory_limit: int = 64  # jobs kept in memory; older finished ones are read from disk
+    
+    # HTTP Service (python -m api.server)
+    api_host: str = "127.0.0.1"
+    api_port: int = 8080
+    api_provider_concurrency: int = 8  # candidates in LLM analysis at once per provider, across all jobs
+    api_max_upload_bytes: int = 100 * 1024 * 1024
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,202 @@
+"""LLM Response Cache - content-addressed, two-tier (memory LRU + SQLite)"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from utils.cache import LRUCache, SQLiteCache
+from .llm_provider import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache for LLM responses
+
+    Keys are derived from (provider, model, max_tokens, prompt hash), so a
+    byte-identical prompt against the same model is answered locally.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, memory_entries: int = 512):
+        self.memory = LRUCache(max_entries=memory_entries, ttl_seconds=ttl_seconds)
+        self.disk = SQLiteCache(path, ttl_seconds=ttl_seconds, max_entries=max_entries) if path else None
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+
+    @staticmethod
+    def make_key(provider: LLMProvider, kind: str, prompt: str, schema: Optional[Dict] = None) -> str:
+        """Content-addressed key for a provider call"""
+        digest = hashlib.sha256()
+        digest.update(kind.encode("utf-8"))
+        digest.update(b"\0")
+        if schema:
+            digest.update(json.dumps(schema, sort_keys=True).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return f"{provider.provider_name}:{provider.model}:{provider.max_tokens}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self.disk is not None:
+            try:
+                value = self.disk.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                value = None
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        self._write_disk(key, value)
+        self._count("writes")
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() that keeps SQLite reads off the event loop"""
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+        if self.disk is None:
+            self._count("misses")
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Any):
+        """set() that keeps SQLite writes off the event loop"""
+        self.memory.set(key, value)
+        if self.disk is not None:
+            await asyncio.to_thread(self._write_disk, key, value)
+        self._count("writes")
+
+    def _write_disk(self, key: str, value: Any):
+        if self.disk is None:
+            return
+        try:
+            self.disk.set(key, value)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict:
+        """Hit/miss counters plus tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        stats["evictions"] = self.memory.evictions + (self.disk.evictions if self.disk else 0)
+        if self.disk is not None:
+            stats["disk_entries"] = self.disk.info()["entries"]
+        return stats
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+
+class CachedLLMProvider(LLMProvider):
+    """LLMProvider wrapper that answers repeated prompts from an LLMResponseCache"""
+
+    def __init__(self, provider: LLMProvider, cache: LLMResponseCache):
+        self.provider = provider
+        self.cache = cache
+        self.provider_name = provider.provider_name
+        self.model = provider.model
+        self.max_tokens = provider.max_tokens
+
+    def __getattr__(self, name: str):
+        # Provider extras (e.g. MockProvider.stats) pass through
+        return getattr(self.provider, name)
+
+    def generate_text(self, prompt: str) -> str:
+        key = self.cache.make_key(self.provider, "text", prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.provider.generate_text(prompt)
+        if response:
+            self.cache.set(key, response)
+        return response
+
+    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        key = self.cache.make_key(self.provider, "json", prompt, schema)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.provider.extract_json(prompt, schema)
+        # Empty dicts mean the provider failed to parse - don't pin them
+        if response:
+            self.cache.set(key, response)
+        return response
+
+    async def agenerate_text(self, prompt: str) -> str:
+        key = self.cache.make_key(self.provider, "text", prompt)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.agenerate_text(prompt)
+        if response:
+            await self.cache.aset(key, response)
+        return response
+
+    async def aextract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        key = self.cache.make_key(self.provider, "json", prompt, schema)
+        cached = await self.cache.aget(key)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.aextract_json(prompt, schema)
+        if response:
+            await self.cache.aset(key, response)
+        return response
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Process-wide response cache configured from settings"""
+    global _llm_cache
+
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            from .config import settings
+
+            path = settings.llm_cache_path or None
+            try:
+                _llm_cache = LLMResponseCache(
+                    path=path,
+                    ttl_seconds=settings.llm_cache_ttl_seconds or None,
+                    max_entries=settings.llm_cache_max_entries or None,
+                    memory_entries=settings.llm_cache_memory_entries
+                )
+            except Exception as e:
+                logger.warning(f"Disk LLM cache unavailable, using memory only: {e}")
+                _llm_cache = LLMResponseCache(
+                    ttl_seconds=settings.llm_cache_ttl_seconds or None,
+                    memory_entries=settings.llm_cache_memory_entries
+                )
+        return _llm_cache
@@ -1,16 +1,30 @@
-"""LLM Provider Abstraction - Supports Mistral, Claude, OpenAI"""
+"""LLM Provider Abstraction - Supports Mistral, Claude, OpenAI, Gemini and an offline mock"""
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, List, Tuple
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import re
+import threading
+import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
+_async_clients_lock = threading.Lock()
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers"""
     
+    provider_name = ""
+    model = ""
+    max_tokens = 1000
+    json_instruction = "Return ONLY valid JSON."
+    
     @abstractmethod
     def generate_text(self, prompt: str) -> str:
         """Generate text from prompt"""
@@ -20,15 +34,74 @@ class LLMProvider(ABC):
     def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
         """Generate structured JSON output"""
         pass
+    
+    async def agenerate_text(self, prompt: str) -> str:
+        """Generate text without blocking the event loop
+        
+        Providers with a native async SDK override this; the default
+        runs the blocking call in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate_text, prompt)
+    
+    async def aextract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        """Generate structured JSON output without blocking the event loop"""
+        response = await self.agenerate_text(self._json_prompt(prompt, schema))
+        return self._parse_json(response)
+    
+    def _json_prompt(self, prompt: str, schema: Optional[Dict] = None) -> str:
+        """Append the JSON-only instruction (and schema) to a prompt"""
+        return f"""{prompt}
+
+{self.json_instruction}
+{f"Schema: {json.dumps(schema, indent=2)}" if schema else ""}"""
+    
+    def _parse_json(self, response: str) -> Dict:
+        """Parse a JSON response, tolerating markdown code fences"""
+        try:
+            response = (response or "").strip()
+            if response.startswith("```"):
+                response = response.split("```")[1]
+                if response.startswith("json"):
+                    response = response[4:]
+            return json.loads(response.strip())
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parsing failed: {e}")
+            return {}
+    
+    def _create_async_client(self):
+        """Build the provider's async SDK client (None if not supported)"""
+        return None
+    
+    def _get_async_client(self):
+        """Async SDK client bound to the running event loop
+        
+        SDK async clients hold connection pools tied to the loop that
+        created them, so one client is kept per live loop. Blocking entry
+        points all run on utils.event_loop's long-lived loop, so in
+        practice each provider builds its async client once.
+        """
+        loop = asyncio.get_running_loop()
+        with _async_clients_lock:
+            if "_async_clients" not in self.__dict__:
+                self._async_clients = weakref.WeakKeyDictionary()
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._create_async_client()
+                self._async_clients[loop] = client
+        return client
 
 
 class MistralProvider(LLMProvider):
     """Mistral AI - FREE tier available"""
     
+    provider_name = "mistral"
+    json_instruction = "You MUST return ONLY valid JSON. No markdown, no extra text."
+    
     def __init__(self, api_key: str, model: str = "mistral-large"):
         try:
             from mistralai.client import MistralClient
             self.client = MistralClient(api_key=api_key)
+            self.api_key = api_key
             self.model = model
         except Exception as e:
             logger.error(f"Failed to initialize Mistral: {e}")
@@ -43,40 +116,50 @@ class MistralProvider(LLMProvider):
             response = self.client.chat(
                 model=self.model,
                 messages=messages,
-                max_tokens=1000
+                max_tokens=self.max_tokens
             )
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Mistral generation failed: {e}")
             raise
     
+    async def agenerate_text(self, prompt: str) -> str:
+        """Generate text using Mistral's async client"""
+        try:
+            from mistralai.models.chat_message import ChatMessage
+            
+            messages = [ChatMessage(role="user", content=prompt)]
+            response = await self._get_async_client().chat(
+                model=self.model,
+                messages=messages,
+                max_tokens=self.max_tokens
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Mistral async generation failed: {e}")
+            raise
+    
     def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
         """Generate JSON response from Mistral"""
-        json_prompt = f"""{prompt}
-
-You MUST return ONLY valid JSON. No markdown, no extra text.
-{f"Schema: {json.dumps(schema, indent=2)}" if schema else ""}"""
-        
-        try:
-            response = self.generate_text(json_prompt)
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            return json.loads(response.strip())
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {e}")
-            return {}
+        response = self.generate_text(self._json_prompt(prompt, schema))
+        return self._parse_json(response)
+    
+    def _create_async_client(self):
+        from mistralai.async_client import MistralAsyncClient
+        return MistralAsyncClient(api_key=self.api_key)
 
 
 class ClaudeProvider(LLMProvider):
     """Claude API - Anthropic"""
     
-    def __init__(self, api_key: str):
+    provider_name = "claude"
+    
+    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022"):
         try:
             from anthropic import Anthropic
             self.client = Anthropic(api_key=api_key)
+            self.api_key = api_key
+            self.model = model
         except Exception as e:
             logger.error(f"Failed to initialize Claude: {e}")
             raise
@@ -84,8 +167,8 @@ class ClaudeProvider(LLMProvider):
     def generate_text(self, prompt: str) -> str:
         try:
             response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=1000,
+                model=self.model,
+                max_tokens=self.max_tokens,
                 messages=[{"role": "user", "content": prompt}]
             )
             return response.content[0].text
@@ -93,27 +176,38 @@ class ClaudeProvider(LLMProvider):
             logger.error(f"Claude generation failed: {e}")
             raise
     
-    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
-        json_prompt = f"""{prompt}
-
-Return ONLY valid JSON.
-{f"Schema: {json.dumps(schema, indent=2)}" if schema else ""}"""
-        
-        response = self.generate_text(json_prompt)
+    async def agenerate_text(self, prompt: str) -> str:
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {e}")
-            return {}
+            response = await self._get_async_client().messages.create(
+                model=self.model,
+                max_tokens=self.max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return response.content[0].text
+        except Exception as e:
+            logger.error(f"Claude async generation failed: {e}")
+            raise
+    
+    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        response = self.generate_text(self._json_prompt(prompt, schema))
+        return self._parse_json(response)
+    
+    def _create_async_client(self):
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(api_key=self.api_key)
 
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT API"""
     
-    def __init__(self, api_key: str):
+    provider_name = "openai"
+    
+    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
         try:
             from openai import OpenAI
             self.client = OpenAI(api_key=api_key)
+            self.api_key = api_key
+            self.model = model
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI: {e}")
             raise
@@ -121,37 +215,48 @@ class OpenAIProvider(LLMProvider):
     def generate_text(self, prompt: str) -> str:
         try:
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000
+                max_tokens=self.max_tokens
             )
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI generation failed: {e}")
             raise
     
-    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
-        json_prompt = f"""{prompt}
-
-Return ONLY valid JSON.
-{f"Schema: {json.dumps(schema, indent=2)}" if schema else ""}"""
-        
-        response = self.generate_text(json_prompt)
+    async def agenerate_text(self, prompt: str) -> str:
         try:
-            return json.loads(response)
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {e}")
-            return {}
+            response = await self._get_async_client().chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=self.max_tokens
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"OpenAI async generation failed: {e}")
+            raise
+    
+    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        response = self.generate_text(self._json_prompt(prompt, schema))
+        return self._parse_json(response)
+    
+    def _create_async_client(self):
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=self.api_key)
 
 
 class GeminiProvider(LLMProvider):
     """Google Gemini API"""
     
-    def __init__(self, api_key: str):
+    provider_name = "gemini"
+    json_instruction = "You MUST return ONLY valid JSON. No markdown, no extra text."
+    
+    def __init__(self, api_key: str, model: str = "gemini-1.5-flash"):
         try:
             import google.generativeai as genai
             genai.configure(api_key=api_key)
-            self.client = genai.GenerativeModel('gemini-1.5-flash')
+            self.client = genai.GenerativeModel(model)
+            self.model = model
         except Exception as e:
             logger.error(f"Failed to initialize Gemini: {e}")
             raise
@@ -164,38 +269,304 @@ class GeminiProvider(LLMProvider):
             logger.error(f"Gemini generation failed: {e}")
             raise
     
+    async def agenerate_text(self, prompt: str) -> str:
+        try:
+            response = await self.client.generate_content_async(prompt)
+            return response.text
+        except Exception as e:
+            logger.error(f"Gemini async generation failed: {e}")
+            raise
+    
     def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
-        json_prompt = f"""{prompt}
+        response = self.generate_text(self._json_prompt(prompt, schema))
+        return self._parse_json(response)
 
-You MUST return ONLY valid JSON. No markdown, no extra text.
-{f"Schema: {json.dumps(schema, indent=2)}" if schema else ""}"""
+
+class MockLLMError(Exception):
+    """Failure injected by MockProvider"""
+
+
+class MockRateLimitError(MockLLMError):
+    """Rate-limit (429) response injected by MockProvider"""
+    
+    def __init__(self, message: str = "Rate limit exceeded (mock)", retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MockProvider(LLMProvider):
+    """Offline provider for tests and load runs - no network, no API key
+    
+    Responses are derived from a hash of the prompt, so the same prompt
+    always gets the same answer. extract_json follows the schema when one
+    is given, otherwise the "- field: description" list in the prompt
+    (lists, N-M scores, a/b/c choices, booleans, text).
+    
+    Latency is drawn from latency_distribution ("none", "fixed",
+    "uniform", "normal", "lognormal" or "exponential") around latency_ms,
+    and a share of calls fail with MockRateLimitError / MockLLMError.
+    Those draws come from a seeded RNG: reproducible for a given call
+    order. Token usage is estimated at ~4 characters per token (stats()).
+    """
+    
+    provider_name = "mock"
+    
+    CHARS_PER_TOKEN = 4
+    LATENCY_DISTRIBUTIONS = ("none", "fixed", "uniform", "normal", "lognormal", "exponential")
+    FIELD_PATTERN = re.compile(r"^\s*-\s*([A-Za-z_]+):\s*(.*)$", re.MULTILINE)
+    RANGE_PATTERN = re.compile(r"\b(\d+)\s*-\s*(\d+)\b")
+    CHOICE_PATTERN = re.compile(r"\b[a-z]+(?:/[a-z]+)+\b")
+    COUNT_PATTERN = re.compile(r"\b(\d+)\b")
+    WORDS_PATTERN = re.compile(r"\((\d+) words\)")
+    FIELDS_MARKER = re.compile(r"JSON with:", re.IGNORECASE)
+    LIST_LINE_PATTERN = re.compile(r"^[^:\n]*:\s*([^\n]*,[^\n]*)$", re.MULTILINE)
+    FALLBACK_PHRASES = ("Collaboration", "Problem-Solving", "Communication", "Ownership", "Python", "Leadership")
+    
+    def __init__(self, api_key: Optional[str] = None, model: str = "mock-1",
+                 latency_distribution: Optional[str] = None, latency_ms: Optional[float] = None,
+                 latency_jitter: Optional[float] = None, error_rate: Optional[float] = None,
+                 rate_limit_rate: Optional[float] = None, seed: Optional[int] = None):
+        from .config import settings
         
-        try:
-            response = self.generate_text(json_prompt)
-            response = response.strip()
-            if response.startswith("```"):
-                response = response.split("```")[1]
-                if response.startswith("json"):
-                    response = response[4:]
-            return json.loads(response.strip())
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {e}")
-            return {}
+        self.model = model
+        self.latency_distribution = latency_distribution or settings.mock_latency_distribution
+        if self.latency_distribution not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.latency_distribution}")
+        self.latency_ms = settings.mock_latency_ms if latency_ms is None else latency_ms
+        self.latency_jitter = settings.mock_latency_jitter if latency_jitter is None else latency_jitter
+        self.error_rate = settings.mock_error_rate if error_rate is None else error_rate
+        self.rate_limit_rate = settings.mock_rate_limit_rate if rate_limit_rate is None else rate_limit_rate
+        self._rng = random.Random(settings.mock_seed if seed is None else seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+    
+    def generate_text(self, prompt: str) -> str:
+        latency, fault = self._draw()
+        time.sleep(latency)
+        return self._complete(prompt, lambda: self._text(prompt), latency, fault)
+    
+    async def agenerate_text(self, prompt: str) -> str:
+        latency, fault = self._draw()
+        await asyncio.sleep(latency)
+        return self._complete(prompt, lambda: self._text(prompt), latency, fault)
+    
+    def extract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        latency, fault = self._draw()
+        time.sleep(latency)
+        return self._parse_json(self._complete(prompt, lambda: self._json(prompt, schema), latency, fault))
+    
+    async def aextract_json(self, prompt: str, schema: Optional[Dict] = None) -> Dict:
+        latency, fault = self._draw()
+        await asyncio.sleep(latency)
+        return self._parse_json(self._complete(prompt, lambda: self._json(prompt, schema), latency, fault))
+    
+    def stats(self) -> Dict:
+        """Calls, injected failures, estimated tokens and latency so far"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["total_tokens"] = stats["prompt_tokens"] + stats["completion_tokens"]
+        stats["avg_latency_ms"] = round(stats["latency_seconds"] / stats["calls"] * 1000, 2) if stats["calls"] else 0.0
+        return stats
+    
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {"calls": 0, "errors": 0, "rate_limited": 0,
+                           "prompt_tokens": 0, "completion_tokens": 0, "latency_seconds": 0.0}
+    
+    @classmethod
+    def count_tokens(cls, text: str) -> int:
+        return (len(text) + cls.CHARS_PER_TOKEN - 1) // cls.CHARS_PER_TOKEN
+    
+    def _draw(self) -> Tuple[float, Optional[Exception]]:
+        """Latency (seconds) and injected failure of the next call"""
+        with self._lock:
+            roll = self._rng.random()
+            if roll < self.rate_limit_rate:
+                # Rejected up front, like a real 429
+                return 0.0, MockRateLimitError()
+            fault = MockLLMError("Injected mock failure") if roll < self.rate_limit_rate + self.error_rate else None
+            
+            mean = self.latency_ms / 1000
+            jitter = self.latency_jitter
+            distribution = self.latency_distribution
+            if distribution == "none" or mean <= 0:
+                latency = 0.0
+            elif distribution == "fixed":
+                latency = mean
+            elif distribution == "uniform":
+                latency = self._rng.uniform(mean * (1 - jitter), mean * (1 + jitter))
+            elif distribution == "normal":
+                latency = self._rng.gauss(mean, mean * jitter)
+            elif distribution == "lognormal":
+                # latency_ms is the median; jitter is sigma of the log
+                latency = mean * self._rng.lognormvariate(0, jitter)
+            else:
+                latency = self._rng.expovariate(1 / mean)
+        return max(0.0, latency), fault
+    
+    def _complete(self, prompt: str, build: Callable[[], str], latency: float, fault: Optional[Exception]) -> str:
+        """Account for the call, then raise the injected failure or return the response"""
+        completion = "" if fault else build()
+        with self._lock:
+            stats = self._stats
+            stats["calls"] += 1
+            stats["latency_seconds"] += latency
+            if isinstance(fault, MockRateLimitError):
+                stats["rate_limited"] += 1
+            elif fault is not None:
+                stats["errors"] += 1
+            if not isinstance(fault, MockRateLimitError):
+                stats["prompt_tokens"] += self.count_tokens(prompt)
+                stats["completion_tokens"] += self.count_tokens(completion)
+        if fault is not None:
+            logger.debug(f"Mock provider failure: {fault}")
+            raise fault
+        return completion
+    
+    def _prompt_rng(self, prompt: str, schema: Optional[Dict] = None) -> random.Random:
+        digest = hashlib.sha256(prompt.encode("utf-8"))
+        if schema:
+            digest.update(json.dumps(schema, sort_keys=True).encode("utf-8"))
+        return random.Random(digest.hexdigest())
+    
+    def _split(self, prompt: str) -> Tuple[str, str]:
+        """(context, field list) halves of a "Provide JSON with:" prompt"""
+        marker = None
+        for marker in self.FIELDS_MARKER.finditer(prompt):
+            pass
+        if marker is None:
+            return prompt, ""
+        return prompt[:marker.start()], prompt[marker.end():]
+    
+    def _phrases(self, prompt: str) -> List[str]:
+        """Items of the comma-separated lists in the prompt context (skills, values...)"""
+        phrases = []
+        for line in self.LIST_LINE_PATTERN.findall(self._split(prompt)[0]):
+            phrases.extend(item.strip() for item in line.split(",") if 0 < len(item.strip()) <= 40)
+        return list(dict.fromkeys(phrases)) or list(self.FALLBACK_PHRASES)
+    
+    def _sentence(self, rng: random.Random, phrases: List[str]) -> str:
+        picked = rng.sample(phrases, min(len(phrases), 2))
+        return f"Mock assessment highlighting {' and '.join(picked)}."
+    
+    def _text(self, prompt: str) -> str:
+        rng = self._prompt_rng(prompt)
+        phrases = self._phrases(prompt)
+        words = self.WORDS_PATTERN.search(prompt)
+        target = int(words.group(1)) if words else 60
+        
+        sentences, count = [], 0
+        while count < target:
+            sentence = self._sentence(rng, phrases)
+            sentences.append(sentence)
+            count += len(sentence.split())
+        return " ".join(sentences)[:self.max_tokens * self.CHARS_PER_TOKEN]
+    
+    def _json(self, prompt: str, schema: Optional[Dict] = None) -> str:
+        rng = self._prompt_rng(prompt, schema)
+        phrases = self._phrases(prompt)
+        if schema:
+            value = self._from_schema(schema, rng, phrases)
+        else:
+            value = {name: self._from_description(desc, rng, phrases)
+                     for name, desc in self.FIELD_PATTERN.findall(self._split(prompt)[1])}
+            if not value:
+                value = {"response": self._sentence(rng, phrases)}
+        return json.dumps(value)
+    
+    def _from_description(self, description: str, rng: random.Random, phrases: List[str]):
+        """Value for a "- field: description" line of a prompt"""
+        text = description.lower()
+        if "list" in text:
+            count = self.COUNT_PATTERN.search(text)
+            size = int(count.group(1)) if count else rng.randint(1, 4)
+            return rng.sample(phrases, min(size, len(phrases)))
+        bounds = self.RANGE_PATTERN.search(text)
+        if bounds:
+            return rng.randint(int(bounds.group(1)), int(bounds.group(2)))
+        if "boolean" in text:
+            return rng.random() < 0.5
+        choices = self.CHOICE_PATTERN.search(text)
+        if choices:
+            return rng.choice(choices.group(0).split("/"))
+        return self._sentence(rng, phrases)
+    
+    def _from_schema(self, schema: Dict, rng: random.Random, phrases: List[str]):
+        """Instance of a (simple) JSON schema"""
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+        kind = schema.get("type", "object")
+        if kind == "object":
+            return {name: self._from_schema(prop, rng, phrases)
+                    for name, prop in schema.get("properties", {}).items()}
+        if kind == "array":
+            items = schema.get("items", {"type": "string"})
+            size = rng.randint(schema.get("minItems", 1), schema.get("maxItems", 4))
+            if items.get("type", "string") == "string" and "enum" not in items:
+                return rng.sample(phrases, min(size, len(phrases)))
+            return [self._from_schema(items, rng, phrases) for _ in range(size)]
+        if kind == "integer":
+            return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+        if kind == "number":
+            return round(rng.uniform(schema.get("minimum", 0), schema.get("maximum", 1)), 3)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        return self._sentence(rng, phrases)
 
 
-def get_llm(provider_name: str, api_key: str) -> LLMProvider:
-    """Factory to get LLM provider"""
+PROVIDERS = {
+    "mistral": MistralProvider,
+    "claude": ClaudeProvider,
+    "openai": OpenAIProvider,
+    "gemini": GeminiProvider,
+    "mock": MockProvider,
+}
+
+# Process-wide provider registry: one pooled SDK client per (provider, api_key, model)
+_registry: Dict[Tuple, LLMProvider] = {}
+_registry_lock = threading.Lock()
+
+
+def get_llm(provider_name: str, api_key: str, model: Optional[str] = None,
+            use_cache: Optional[bool] = None) -> LLMProvider:
+    """
+    Factory to get LLM provider
+    
+    Providers are shared process-wide, keyed by (provider, api_key, model),
+    so every matcher and analysis module reuses the same thread-safe SDK
+    client and its warm keep-alive connections.
     
-    providers = {
-        "mistral": lambda key: MistralProvider(key),
-        "claude": lambda key: ClaudeProvider(key),
-        "openai": lambda key: OpenAIProvider(key),
-        "gemini": lambda key: GeminiProvider(key),
-    }
+    Responses are served from the shared response cache when use_cache
+    is True (defaults to settings.llm_cache_enabled, and to False for the
+    mock provider so every call still draws its latency and failures).
+    """
+    
+    providers = PROVIDERS
     
     if provider_name not in providers:
         raise ValueError(f"Unknown provider: {provider_name}")
     
-    return providers[provider_name](api_key)
+    if use_cache is None:
+        from .config import settings
+        use_cache = settings.llm_cache_enabled and provider_name != "mock"
+    
+    key = (provider_name, api_key, model)
+    
+    with _registry_lock:
+        provider = _registry.get(key)
+        if provider is None:
+            provider_cls = providers[provider_name]
+            provider = provider_cls(api_key, model) if model else provider_cls(api_key)
+            _registry[key] = provider
+    
+    if use_cache:
+        # Thin wrapper: cached and uncached callers share one provider (and its clients)
+        from .llm_cache import CachedLLMProvider, get_llm_cache
+        return CachedLLMProvider(provider, get_llm_cache())
+    return provider
 
 
+def clear_llm_registry():
+    """Drop all shared providers (e.g. after rotating API keys)"""
+    with _registry_lock:
+        _registry.clear()
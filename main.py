@@ -1,11 +1,111 @@
-"""Inter-Sight Main Entry Point"""
+"""Inter-Sight Main Entry Point
 
+Usage:
+    python main.py                      # launch the Streamlit app
+    python main.py score --company tech_startup.json --cvs DIR --out results.jsonl [--concurrency 8]
+"""
+import argparse
+import json
+import logging
+import os
 import sys
 import subprocess
+from typing import Dict, List, Optional
 
-if __name__ == "__main__":
+SAMPLE_COMPANIES_DIR = os.path.join("data", "sample_companies")
+
+
+def run_app(args) -> int:
     # Run Streamlit app
-    subprocess.run([
-        sys.executable, "-m", "streamlit", "run",
-        "ui/streamlit_app.py"
-    ])
+    return subprocess.run([sys.executable, "-m", "streamlit", "run", "ui/streamlit_app.py"]).returncode
+
+
+def load_company(path: str) -> Dict:
+    """Company profile JSON; bare names are also looked up in data/sample_companies"""
+    if not os.path.exists(path) and os.path.exists(os.path.join(SAMPLE_COMPANIES_DIR, path)):
+        path = os.path.join(SAMPLE_COMPANIES_DIR, path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_summary(summary: Dict, out=sys.stderr):
+    print(f"\nScored {summary['scored']} CVs ({summary['failed']} failed) in {summary['elapsed']}s "
+          f"- {summary['cvs_per_second']} CVs/s", file=out)
+    for ranking, count in sorted(summary["by_ranking"].items()):
+        print(f"  {ranking}: {count}", file=out)
+    if summary["top"]:
+        print("\nTop candidates:", file=out)
+        for entry in summary["top"]:
+            print(f"  {entry['rank']:>3}. {entry['overall_score']:>3}  {entry['name']}  ({entry['file']})", file=out)
+
+
+def score(args) -> int:
+    from core.config import settings
+    from processors.bulk_ingest import iter_cv_files
+    from processors.stream_scoring import score_to_jsonl
+
+    if not os.path.isdir(args.cvs):
+        print(f"Not a directory: {args.cvs}", file=sys.stderr)
+        return 2
+    company_profile = load_company(args.company)
+
+    files = iter_cv_files(args.cvs, recursive=not args.no_recursive)
+    options = {
+        "concurrency": args.concurrency,
+        "analysis_mode": args.analysis_mode or settings.analysis_mode,
+        "include_feedback": args.feedback,
+        # INGEST_WORKERS=0 means one per CPU; only an explicit --workers 0 parses in-process
+        "max_workers": (settings.ingest_workers or None) if args.workers is None else args.workers,
+        "timeout": settings.ingest_timeout_seconds or None,
+        "top_k": args.top,
+        "llm_provider": args.provider,
+    }
+
+    if args.out == "-":
+        summary = score_to_jsonl(company_profile, files, sys.stdout, **options)
+    else:
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as out:
+            summary = score_to_jsonl(company_profile, files, out, **options)
+
+    print_summary(summary)
+    return 0 if summary["scored"] or not summary["failed"] else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.llm_provider import PROVIDERS
+    from processors.simple_matcher import ANALYSIS_MODES, DEFAULT_MAX_CONCURRENCY
+    from processors.stream_scoring import DEFAULT_TOP_K
+
+    parser = argparse.ArgumentParser(description="Inter-Sight talent matching")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="launch the Streamlit app (default)")
+    run_parser.set_defaults(func=run_app)
+
+    score_parser = subparsers.add_parser("score", help="score a folder of CVs headlessly, streaming JSONL")
+    score_parser.add_argument("--company", required=True, help="company profile JSON")
+    score_parser.add_argument("--cvs", required=True, help="folder of CVs (pdf, docx, txt, json)")
+    score_parser.add_argument("--out", default="results.jsonl", help="JSONL output file ('-' for stdout)")
+    score_parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                              help="candidates analyzed at once")
+    score_parser.add_argument("--workers", type=int, default=None, help="parser processes (default: INGEST_WORKERS or one per CPU; 0 = in-process)")
+    score_parser.add_argument("--analysis-mode", choices=ANALYSIS_MODES, default=None)
+    score_parser.add_argument("--provider", choices=list(PROVIDERS), default=None,
+                              help="LLM provider (default: LLM_PROVIDER; 'mock' runs offline)")
+    score_parser.add_argument("--feedback", action="store_true", help="also generate feedback letters")
+    score_parser.add_argument("--top", type=int, default=DEFAULT_TOP_K, help="candidates in the final summary (0 = none)")
+    score_parser.add_argument("--no-recursive", action="store_true", help="ignore subfolders")
+    score_parser.set_defaults(func=score)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(message)s")
+    if args.command is None:
+        return run_app(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""Archive Ingestion - stream CVs straight out of ZIP/TAR uploads"""
+
+import io
+import logging
+import os
+import tarfile
+import zipfile
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+from processors.bulk_ingest import (
+    DEFAULT_CHUNK_SIZE, DEFAULT_TIMEOUT_SECONDS, IngestItem, IngestReport, IngestResult, ingest_batch
+)
+from processors.cv_parser import SUPPORTED_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+DEFAULT_MAX_MEMBER_BYTES = 25 * 1024 * 1024
+
+# A path, raw bytes, or a readable binary file object
+ArchiveSource = Union[str, bytes, BinaryIO]
+
+
+def is_archive(file_name: str) -> bool:
+    return file_name.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _is_cv_member(member_name: str) -> bool:
+    base = os.path.basename(member_name)
+    if not base or base.startswith(".") or "__MACOSX/" in member_name:
+        return False
+    return os.path.splitext(base)[1].lower() in SUPPORTED_EXTENSIONS
+
+
+def _open_source(source: ArchiveSource) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if isinstance(source, str):
+        return open(source, "rb")
+    return source
+
+
+def iter_archive_members(source: ArchiveSource, file_name: Optional[str] = None,
+                         max_member_bytes: Optional[int] = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yield (member_name, content) for every CV file inside a ZIP or tar archive
+
+    Members are read one at a time straight from the archive stream and
+    never written to disk; tar archives are read as a forward-only stream.
+    Directories, hidden files, unsupported types, encrypted ZIP entries
+    and members larger than max_member_bytes are skipped. Member names
+    are prefixed with the archive name when file_name is given.
+
+    Args:
+        source: archive path, bytes, or binary file object
+        file_name: archive name (used for type detection and naming)
+        max_member_bytes: per-member size cap (settings.archive_max_member_bytes by default)
+    """
+    if max_member_bytes is None:
+        max_member_bytes = _default_max_member_bytes()
+    name = file_name or (source if isinstance(source, str) else "")
+    prefix = os.path.basename(name) + "/" if name else ""
+
+    stream = _open_source(source)
+    try:
+        if name.lower().endswith(".zip") or (not name and zipfile.is_zipfile(stream)):
+            yield from _iter_zip(stream, prefix, max_member_bytes)
+        else:
+            if not name:
+                stream.seek(0)
+            yield from _iter_tar(stream, prefix, max_member_bytes)
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def _iter_zip(stream: BinaryIO, prefix: str, max_member_bytes: int) -> Iterator[Tuple[str, bytes]]:
+    with zipfile.ZipFile(stream) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not _is_cv_member(info.filename):
+                continue
+            reason = _zip_skip_reason(info, max_member_bytes)
+            if reason:
+                logger.warning(f"Skipping {info.filename}: {reason}")
+                continue
+            with archive.open(info) as member:
+                # Read one byte past the cap in case the header under-reports the size
+                content = member.read(max_member_bytes + 1) if max_member_bytes else member.read()
+            if max_member_bytes and len(content) > max_member_bytes:
+                logger.warning(f"Skipping {info.filename}: exceeds the member size cap")
+                continue
+            yield prefix + info.filename, content
+
+
+def _zip_skip_reason(info: zipfile.ZipInfo, max_member_bytes: int) -> Optional[str]:
+    """Why a ZIP CV member can't be read (None if it can); shared with count_archive_members"""
+    if info.flag_bits & 0x1:
+        return "encrypted archive member"
+    if max_member_bytes and info.file_size > max_member_bytes:
+        return f"{info.file_size} bytes exceeds the member size cap"
+    return None
+
+
+def _iter_tar(stream: BinaryIO, prefix: str, max_member_bytes: int) -> Iterator[Tuple[str, bytes]]:
+    with tarfile.open(fileobj=stream, mode="r|*") as archive:
+        for info in archive:
+            if not info.isfile() or not _is_cv_member(info.name):
+                continue
+            if max_member_bytes and info.size > max_member_bytes:
+                logger.warning(f"Skipping {info.name}: {info.size} bytes exceeds the member size cap")
+                continue
+            member = archive.extractfile(info)
+            if member is None:
+                continue
+            with member:
+                content = member.read()
+            yield prefix + info.name, content
+
+
+def count_archive_members(source: ArchiveSource, file_name: Optional[str] = None,
+                          max_member_bytes: Optional[int] = None) -> Optional[int]:
+    """
+    Number of CV members, when it can be known without decompressing
+
+    ZIP archives list their members in the central directory; tar
+    archives would need a full pass, so None is returned for them.
+    Members iter_archive_members would skip (encrypted, over
+    max_member_bytes) are not counted.
+    """
+    if max_member_bytes is None:
+        max_member_bytes = _default_max_member_bytes()
+    name = file_name or (source if isinstance(source, str) else "")
+    if not name.lower().endswith(".zip"):
+        return None
+
+    stream = _open_source(source)
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            return sum(
+                1 for info in archive.infolist()
+                if not info.is_dir() and _is_cv_member(info.filename)
+                and _zip_skip_reason(info, max_member_bytes) is None
+            )
+    except zipfile.BadZipFile:
+        return None
+    finally:
+        if stream is not source:
+            stream.close()
+        else:
+            stream.seek(0)
+
+
+def expand_archives(items: Iterable[IngestItem], max_member_bytes: Optional[int] = None) -> Iterator[IngestItem]:
+    """
+    Pass CV items through, replacing each archive with its CV members
+
+    Lazy: an archive is only opened when the consumer reaches it, so
+    this can feed parse_many without reading every upload up front.
+    Unreadable archives are logged and skipped.
+    """
+    for item in items:
+        if isinstance(item, str):
+            name, source = item, item
+        else:
+            name, source = item
+
+        if not is_archive(name):
+            yield item
+            continue
+
+        try:
+            yield from iter_archive_members(source, file_name=name, max_member_bytes=max_member_bytes)
+        except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+            logger.error(f"Cannot read archive {name}: {e}")
+
+
+def ingest_archive(source: ArchiveSource, file_name: Optional[str] = None, max_workers: Optional[int] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+                   progress: Optional[Callable[[IngestResult], None]] = None,
+                   max_member_bytes: Optional[int] = None) -> IngestReport:
+    """
+    Parse every CV inside an archive on the ingest process pool
+
+    Members are streamed into parse_many, which keeps a bounded number
+    of chunks in flight, so arbitrarily large archives use bounded memory.
+    progress is called with each IngestResult as soon as it is ready.
+    """
+    members = iter_archive_members(source, file_name=file_name, max_member_bytes=max_member_bytes)
+    return ingest_batch(members, max_workers=max_workers, chunk_size=chunk_size, timeout=timeout, progress=progress)
+
+
+def _default_max_member_bytes() -> int:
+    try:
+        from core.config import settings
+        return settings.archive_max_member_bytes
+    except Exception:
+        return DEFAULT_MAX_MEMBER_BYTES
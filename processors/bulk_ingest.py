@@ -0,0 +1,270 @@
+"""Bulk CV Ingestion - parse many CVs in parallel on a process pool"""
+
+import logging
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from processors.cv_cache import parse_cached
+from processors.cv_parser import SUPPORTED_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+# An item is a file path, or a (file_name, content_bytes) pair
+IngestItem = Union[str, Tuple[str, bytes]]
+
+DEFAULT_CHUNK_SIZE = 4
+DEFAULT_TIMEOUT_SECONDS = 60
+# How often parse_many checks whether queued chunks have started
+START_POLL_SECONDS = 0.5
+
+
+class FileParseTimeout(BaseException):
+    """Raised inside a worker when a single file exceeds its time budget
+
+    A BaseException, so the parsers' broad "except Exception" handlers
+    can't turn a timeout into "Could not parse".
+    """
+
+
+class IngestResult:
+    """Outcome of parsing one file"""
+
+    __slots__ = ("index", "name", "data", "error", "elapsed")
+
+    def __init__(self, index: int, name: str, data: Optional[Dict] = None,
+                 error: Optional[str] = None, elapsed: float = 0.0):
+        self.index = index
+        self.name = name
+        self.data = data
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict:
+        return {
+            "index": self.index,
+            "name": self.name,
+            "ok": self.ok,
+            "error": self.error,
+            "elapsed": round(self.elapsed, 4),
+        }
+
+
+class IngestReport:
+    """Collected results of a bulk ingestion run"""
+
+    def __init__(self, results: List[IngestResult], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def cvs(self) -> List[Dict]:
+        """Parsed CVs of the successful files, in input order"""
+        return [r.data for r in self.results if r.ok]
+
+    @property
+    def errors(self) -> List[Dict]:
+        """Per-file error report"""
+        return [r.to_dict() for r in self.results if not r.ok]
+
+    def summary(self) -> Dict:
+        ok = sum(1 for r in self.results if r.ok)
+        return {
+            "files": len(self.results),
+            "parsed": ok,
+            "failed": len(self.results) - ok,
+            "elapsed": round(self.elapsed, 3),
+            "files_per_second": round(len(self.results) / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+
+def iter_cv_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """Yield paths of supported CV files under directory (sorted, lazily)"""
+    try:
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
+    except OSError as e:
+        logger.error(f"Cannot list {directory}: {e}")
+        return
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if recursive:
+                yield from iter_cv_files(entry.path, recursive)
+        elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+            yield entry.path
+
+
+def parse_many(items: Iterable[IngestItem], max_workers: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE, timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+               ordered: bool = True) -> Iterator[IngestResult]:
+    """
+    Parse CVs across a process pool, streaming results
+
+    Items are consumed lazily and dispatched in chunks of chunk_size, with
+    at most two chunks per worker in flight, so memory stays bounded even
+    for very large inputs.
+
+    Args:
+        items: file paths or (file_name, bytes) pairs
+        max_workers: pool size (None = CPU count, 0 = parse in this process)
+        chunk_size: files per task sent to a worker
+        timeout: per-file budget in seconds; a file that exceeds it is
+            reported as failed instead of stalling the batch. Workers
+            enforce it with SIGALRM; the parent only gives up on a chunk
+            whose worker ignored the alarm (e.g. stuck in C code), and
+            such a worker keeps its process busy until the call returns
+        ordered: yield in input order (True) or as files complete (False)
+
+    Yields:
+        IngestResult per input item
+    """
+    if max_workers == 0:
+        for index, item in enumerate(items):
+            yield _parse_one(index, item, timeout, use_alarm=False)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    chunk_size = max(1, chunk_size)
+
+    pending: Dict = {}     # future -> (chunk, deadline)
+    buffered: Dict[int, IngestResult] = {}
+    next_index = 0
+    item_iter = enumerate(items)
+    exhausted = False
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            # Keep the pool fed without reading the whole input up front
+            while not exhausted and len(pending) < max_in_flight:
+                chunk = []
+                for index, item in item_iter:
+                    chunk.append((index, item))
+                    if len(chunk) >= chunk_size:
+                        break
+                if not chunk:
+                    exhausted = True
+                    break
+                future = executor.submit(_parse_chunk, chunk, timeout)
+                # The deadline is set once the chunk starts running
+                pending[future] = (chunk, None)
+
+            if not pending:
+                break
+
+            wait_for = None
+            if timeout:
+                now = time.monotonic()
+                for future, (chunk, deadline) in pending.items():
+                    if deadline is None and future.running():
+                        # Parent-side backstop in case a worker ignores its own alarm.
+                        # A "running" chunk may still wait in the call queue behind
+                        # one other chunk, hence the doubled budget.
+                        pending[future] = (chunk, now + 2 * timeout * len(chunk) + 5)
+                deadlines = [d for _, d in pending.values() if d is not None]
+                if deadlines:
+                    wait_for = max(0.0, min(deadlines) - now)
+                if len(deadlines) < len(pending):
+                    # Poll so queued chunks get their deadline soon after they start
+                    wait_for = min(wait_for, START_POLL_SECONDS) if wait_for is not None else START_POLL_SECONDS
+            done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            finished: List[IngestResult] = []
+            for future in done:
+                chunk, _ = pending.pop(future)
+                try:
+                    finished.extend(future.result())
+                except Exception as e:
+                    finished.extend(IngestResult(index, _item_name(item), error=f"Worker failed: {e}")
+                                    for index, item in chunk)
+
+            now = time.monotonic()
+            for future, (chunk, deadline) in list(pending.items()):
+                if deadline is not None and now > deadline and not future.done():
+                    # Can't stop a running worker: its process stays busy until the call returns
+                    future.cancel()
+                    pending.pop(future)
+                    finished.extend(IngestResult(index, _item_name(item), error="Timed out")
+                                    for index, item in chunk)
+
+            if not ordered:
+                yield from finished
+                continue
+
+            for result in finished:
+                buffered[result.index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # Anything left (only possible if indices were skipped) in input order
+    for index in sorted(buffered):
+        yield buffered[index]
+
+
+def ingest_batch(items: Iterable[IngestItem], max_workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+                 progress: Optional[Callable[[IngestResult], None]] = None) -> IngestReport:
+    """Parse all items and return an IngestReport (results in input order)"""
+    start = time.perf_counter()
+    results = []
+    for result in parse_many(items, max_workers=max_workers, chunk_size=chunk_size, timeout=timeout, ordered=True):
+        results.append(result)
+        if progress:
+            progress(result)
+    return IngestReport(results, time.perf_counter() - start)
+
+
+def _item_name(item: IngestItem) -> str:
+    return item if isinstance(item, str) else item[0]
+
+
+def _parse_chunk(chunk: List[Tuple[int, IngestItem]], timeout: Optional[float]) -> List[IngestResult]:
+    """Worker entry point: parse a chunk of items sequentially"""
+    return [_parse_one(index, item, timeout, use_alarm=True) for index, item in chunk]
+
+
+def _on_alarm(signum, frame):
+    raise FileParseTimeout()
+
+
+def _parse_one(index: int, item: IngestItem, timeout: Optional[float], use_alarm: bool) -> IngestResult:
+    """Parse a single item, enforcing the per-file timeout where SIGALRM is available"""
+    name = _item_name(item)
+    start = time.perf_counter()
+    alarm = use_alarm and bool(timeout) and hasattr(signal, "setitimer")
+
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        if isinstance(item, str):
+            with open(item, "rb") as f:
+                content = f.read()
+        else:
+            content = item[1]
+        data = parse_cached(name, content)
+
+        if not data or not isinstance(data, dict):
+            return IngestResult(index, name, error="Could not parse", elapsed=time.perf_counter() - start)
+        return IngestResult(index, name, data=data, elapsed=time.perf_counter() - start)
+
+    except FileParseTimeout:
+        return IngestResult(index, name, error=f"Timed out after {timeout}s", elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return IngestResult(index, name, error=str(e) or type(e).__name__, elapsed=time.perf_counter() - start)
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
@@ -0,0 +1,232 @@
+"""Candidate - compact slotted representation of a parsed CV"""
+
+import sys
+import threading
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List
+
+
+class Vocabulary:
+    """
+    Shared string <-> integer id table
+
+    Ids are process-local; Candidate pickles through its dict form so ids
+    never cross a process boundary.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._lock = threading.Lock()
+
+    def id_of(self, term: str) -> int:
+        term_id = self._ids.get(term)
+        if term_id is None:
+            with self._lock:
+                term_id = self._ids.get(term)
+                if term_id is None:
+                    term_id = len(self._terms)
+                    self._terms.append(sys.intern(term))
+                    self._ids[self._terms[-1]] = term_id
+        return term_id
+
+    def encode(self, terms: Iterable[str]) -> array:
+        return array("I", [self.id_of(term) for term in terms])
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        terms = self._terms
+        return [terms[term_id] for term_id in ids]
+
+    def term(self, term_id: int) -> str:
+        return self._terms[term_id]
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+# Skills and soft skills of every candidate in this process
+VOCABULARY = Vocabulary()
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def _all_str(values) -> bool:
+    return isinstance(values, list) and all(type(v) is str for v in values)
+
+
+class ExperienceRecord(Mapping):
+    """One experience entry; reads like the dict it came from"""
+
+    FIELDS = ("role", "company", "duration", "impact", "description")
+    __slots__ = FIELDS + ("_present", "extra")
+
+    def __init__(self, data: Dict):
+        present = 0
+        for bit, field in enumerate(self.FIELDS):
+            if field in data:
+                present |= 1 << bit
+                # Company names and durations repeat across a pool
+                value = data[field]
+                setattr(self, field, value if field == "description" else _intern(value))
+            else:
+                setattr(self, field, None)
+        self._present = present
+        extra = {k: v for k, v in data.items() if k not in self.FIELDS}
+        self.extra = extra or None
+
+    def __getitem__(self, key: str):
+        try:
+            bit = self.FIELDS.index(key)
+        except ValueError:
+            if self.extra is not None and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        if not self._present & (1 << bit):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        for bit, field in enumerate(self.FIELDS):
+            if self._present & (1 << bit):
+                yield field
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return bin(self._present).count("1") + len(self.extra or ())
+
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self}
+
+    def __reduce__(self):
+        return ExperienceRecord, (self.to_dict(),)
+
+
+class Candidate(Mapping):
+    """
+    A parsed CV in a compact form
+
+    Same content as the dict CVParser produces, but stored in slots:
+    skills and soft skills are arrays of ids into the shared VOCABULARY,
+    experience entries are ExperienceRecords, and short repeated strings
+    (degree, university, company...) are interned. Keys absent from the
+    source dict stay absent, and unknown keys are kept in extra, so
+    Candidate.from_dict(d).to_dict() == d.
+
+    Candidate is a read-only Mapping, so the matchers consume it like a
+    CV dict (candidate.get("skills", []), candidate["name"], dict(candidate)).
+
+    Example:
+        pool = [Candidate.from_dict(cv) for cv in cvs]
+        results = match_candidates(company, pool)
+    """
+
+    # Scalar fields, in CVParser output order
+    SCALAR_FIELDS = ("name", "email", "phone", "degree", "university", "years_experience",
+                     "current_role", "current_company", "education", "raw_text")
+    FIELDS = SCALAR_FIELDS[:8] + ("experience", "skills", "soft_skills") + SCALAR_FIELDS[8:]
+    _INTERNED = frozenset(("degree", "university", "current_role", "current_company", "education"))
+    _BIT = {field: 1 << idx for idx, field in enumerate(FIELDS)}
+
+    __slots__ = SCALAR_FIELDS + ("experience", "skill_ids", "soft_skill_ids", "_present", "extra")
+
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, None)
+        self._present = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Candidate":
+        """Build a Candidate from a CV dict (loss-free)"""
+        if isinstance(data, Candidate):
+            return data
+
+        candidate = cls()
+        present = 0
+        extra = {}
+
+        for key, value in data.items():
+            bit = cls._BIT.get(key)
+            if bit is None:
+                extra[key] = value
+                continue
+
+            if key == "skills" or key == "soft_skills":
+                if not _all_str(value):
+                    extra[key] = value
+                    continue
+                setattr(candidate, "skill_ids" if key == "skills" else "soft_skill_ids", VOCABULARY.encode(value))
+            elif key == "experience":
+                if not isinstance(value, list) or not all(isinstance(e, dict) for e in value):
+                    extra[key] = value
+                    continue
+                candidate.experience = tuple(ExperienceRecord(e) for e in value)
+            else:
+                setattr(candidate, key, _intern(value) if key in cls._INTERNED else value)
+            present |= bit
+
+        candidate._present = present
+        candidate.extra = extra or None
+        return candidate
+
+    def to_dict(self) -> Dict:
+        """The CV dict this candidate was built from"""
+        return {key: self[key] for key in self}
+
+    def __getitem__(self, key: str):
+        bit = self._BIT.get(key)
+        if bit is None or not self._present & bit:
+            if self.extra is not None and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+
+        if key == "skills":
+            return VOCABULARY.decode(self.skill_ids)
+        if key == "soft_skills":
+            return VOCABULARY.decode(self.soft_skill_ids)
+        if key == "experience":
+            return [record.to_dict() for record in self.experience]
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        bit = self._BIT.get(key)
+        if bit is not None and self._present & bit:
+            return True
+        return self.extra is not None and key in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        present = self._present
+        for key in self.FIELDS:
+            if present & self._BIT[key]:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return bin(self._present).count("1") + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        return f"Candidate(name={self.name!r}, skills={len(self.skill_ids or ())})"
+
+    def __reduce__(self):
+        # Vocabulary ids are process-local: pickle the portable dict form
+        return Candidate.from_dict, (self.to_dict(),)
+
+
+def to_candidates(cvs: Iterable[Dict]) -> List[Candidate]:
+    """Convert CV dicts to Candidates"""
+    return [Candidate.from_dict(cv) for cv in cvs]
+
+
+def as_dict(cv_data) -> Dict:
+    """Plain dict for a CV dict or Candidate (e.g. before json.dumps)"""
+    return cv_data.to_dict() if isinstance(cv_data, Candidate) else cv_data
@@ -0,0 +1,353 @@
+"""Candidate Store - persistent columnar talent pool (Parquet part files)"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from processors.candidate import as_dict
+from processors.cv_parser import SKILL_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# Bit i of skill_mask: the candidate lists SKILL_KEYWORDS[i] (case-insensitive)
+SKILL_BITS = {skill: 1 << idx for idx, skill in enumerate(SKILL_KEYWORDS)}
+
+# Columns written for every row, in file order
+COLUMNS = ("candidate_id", "version", "deleted", "source", "name", "email", "degree", "university",
+           "years_experience", "current_role", "experience_count", "skills", "soft_skills",
+           "skill_mask", "data")
+
+
+def skill_mask(skills: Iterable[str]) -> int:
+    """Bit vector of the known skills in a skill list"""
+    mask = 0
+    for skill in skills:
+        if isinstance(skill, str):
+            mask |= SKILL_BITS.get(skill.lower(), 0)
+    return mask
+
+
+def candidate_id_for(cv_data: Dict) -> str:
+    """Content-derived id for CVs appended without one"""
+    payload = json.dumps(as_dict(cv_data), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:20]
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ("" if value is None else str(value))
+
+
+def _years(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class CandidateStore:
+    """
+    Append-only Parquet store of parsed CVs
+
+    Every append writes one immutable part file under root. A row is
+    (candidate_id, version) plus flattened, filterable columns
+    (years_experience, skills, skill_mask...) and the full CV as JSON in
+    "data". Updating a candidate appends a newer version, and deleting
+    appends a tombstone; reads return the latest live version of each id.
+
+    Reads go through pyarrow datasets over memory-mapped files: only the
+    requested columns are loaded, and filters on years_experience and
+    known skills (skill_mask bits) are pushed down to the Parquet scan,
+    so row groups that can't match are skipped.
+
+    Example:
+        store = CandidateStore(".cache/talent_pool")
+        store.append(cvs)
+        seniors = store.candidates(min_years=5, skills=["Python", "AWS"])
+    """
+
+    def __init__(self, root: str):
+        import pyarrow  # noqa: F401  (fail early with a clear error if missing)
+
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+
+    # Writes
+
+    def append(self, cvs: Sequence[Dict], candidate_ids: Optional[Sequence[str]] = None,
+               sources: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Add or update candidates; returns their ids
+
+        Args:
+            cvs: CV dicts (or Candidates)
+            candidate_ids: stable ids (e.g. file paths); content hashes if None
+            sources: where each CV came from (file name or path)
+
+        Raises:
+            ValueError: candidate_ids or sources don't match cvs in length
+        """
+        if not cvs:
+            return []
+        ids = list(candidate_ids) if candidate_ids is not None else [candidate_id_for(cv) for cv in cvs]
+        sources = list(sources) if sources is not None else [""] * len(cvs)
+        if not len(ids) == len(sources) == len(cvs):
+            raise ValueError(f"append got {len(cvs)} CVs, {len(ids)} ids and {len(sources)} sources")
+
+        rows = {column: [] for column in COLUMNS}
+        for candidate_id, source, cv in zip(ids, sources, cvs):
+            cv = as_dict(cv)
+            skills = [s for s in cv.get("skills", []) if isinstance(s, str)]
+            soft_skills = [s for s in cv.get("soft_skills", []) if isinstance(s, str)]
+            experience = cv.get("experience")
+
+            rows["candidate_id"].append(candidate_id)
+            rows["deleted"].append(False)
+            rows["source"].append(_text(source))
+            rows["name"].append(_text(cv.get("name")))
+            rows["email"].append(_text(cv.get("email")))
+            rows["degree"].append(_text(cv.get("degree")))
+            rows["university"].append(_text(cv.get("university")))
+            rows["years_experience"].append(_years(cv.get("years_experience")))
+            rows["current_role"].append(_text(cv.get("current_role")))
+            rows["experience_count"].append(len(experience) if isinstance(experience, list) else int(bool(experience)))
+            rows["skills"].append(skills)
+            rows["soft_skills"].append(soft_skills)
+            rows["skill_mask"].append(skill_mask(skills))
+            rows["data"].append(json.dumps(cv, default=str))
+
+        self._write(rows, len(ids))
+        return ids
+
+    def delete(self, candidate_ids: Iterable[str]):
+        """Tombstone candidates (they stop appearing in reads)"""
+        ids = list(candidate_ids)
+        if not ids:
+            return
+        rows = {column: [] for column in COLUMNS}
+        for candidate_id in ids:
+            rows["candidate_id"].append(candidate_id)
+            rows["deleted"].append(True)
+            for column in ("source", "name", "email", "degree", "university", "current_role", "data"):
+                rows[column].append("")
+            for column in ("years_experience", "experience_count", "skill_mask"):
+                rows[column].append(0)
+            rows["skills"].append([])
+            rows["soft_skills"].append([])
+        self._write(rows, len(ids))
+
+    def _write(self, rows: Dict[str, list], count: int):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with self._lock:
+            # Nanosecond clock + row offset: later appends always win
+            base = time.time_ns()
+            rows["version"] = list(range(base, base + count))
+            table = pa.table({
+                "candidate_id": pa.array(rows["candidate_id"], pa.string()),
+                "version": pa.array(rows["version"], pa.int64()),
+                "deleted": pa.array(rows["deleted"], pa.bool_()),
+                "source": pa.array(rows["source"], pa.string()),
+                "name": pa.array(rows["name"], pa.string()),
+                "email": pa.array(rows["email"], pa.string()),
+                "degree": pa.array(rows["degree"], pa.string()),
+                "university": pa.array(rows["university"], pa.string()),
+                "years_experience": pa.array(rows["years_experience"], pa.int32()),
+                "current_role": pa.array(rows["current_role"], pa.string()),
+                "experience_count": pa.array(rows["experience_count"], pa.int32()),
+                "skills": pa.array(rows["skills"], pa.list_(pa.string())),
+                "soft_skills": pa.array(rows["soft_skills"], pa.list_(pa.string())),
+                "skill_mask": pa.array(rows["skill_mask"], pa.int64()),
+                "data": pa.array(rows["data"], pa.string()),
+            })
+
+            name = f"part-{base}-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(self.root, "." + name)
+            # Write then rename, so readers never see a half-written part
+            pq.write_table(table, tmp_path, compression="zstd", row_group_size=16384)
+            os.replace(tmp_path, os.path.join(self.root, name))
+
+    # Reads
+
+    def _parts(self) -> List[str]:
+        return sorted(
+            os.path.join(self.root, name) for name in os.listdir(self.root)
+            if name.startswith("part-") and name.endswith(".parquet")
+        )
+
+    def _dataset(self):
+        import pyarrow.dataset as ds
+        from pyarrow import fs
+
+        return ds.dataset(self._parts(), format="parquet", filesystem=fs.LocalFileSystem(use_mmap=True))
+
+    def _live_versions(self, dataset) -> np.ndarray:
+        """Versions of the latest row per candidate, excluding tombstones"""
+        keys = dataset.to_table(columns=["candidate_id", "version", "deleted"]).to_pandas()
+        if keys.empty:
+            return np.empty(0, dtype=np.int64)
+        latest = keys.sort_values("version").drop_duplicates("candidate_id", keep="last")
+        return latest.loc[~latest["deleted"], "version"].to_numpy()
+
+    def scan_table(self, columns: Optional[Sequence[str]] = None, min_years: Optional[int] = None,
+                   max_years: Optional[int] = None, skills: Optional[Iterable[str]] = None,
+                   where=None):
+        """
+        Latest live rows matching all filters, as a pyarrow Table
+
+        Args:
+            columns: columns to load (all if None); candidate_id is always included
+            min_years / max_years: bounds on years_experience
+            skills: candidates must list all of these (case-insensitive)
+            where: extra pyarrow.dataset expression, e.g. pc.field("degree") != ""
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        read_columns = list(dict.fromkeys(["candidate_id"] + list(columns or COLUMNS)))
+        if not self._parts():
+            return pa.table({column: pa.array([], pa.string()) for column in read_columns})
+
+        dataset = self._dataset()
+        expression = pc.field("version").isin(self._live_versions(dataset))
+        if min_years is not None:
+            expression &= pc.field("years_experience") >= min_years
+        if max_years is not None:
+            expression &= pc.field("years_experience") <= max_years
+
+        # Known skills are pushed down as a bit test; others are checked after the scan
+        wanted = list(dict.fromkeys(s.lower() for s in (skills or [])))
+        mask = skill_mask(wanted)
+        if mask:
+            expression &= pc.equal(pc.bit_wise_and(pc.field("skill_mask"), pc.scalar(mask)), pc.scalar(mask))
+        if where is not None:
+            expression &= where
+
+        extra_skills = [s for s in wanted if s not in SKILL_BITS]
+        if extra_skills and "skills" not in read_columns:
+            read_columns.append("skills")
+
+        table = dataset.to_table(columns=read_columns, filter=expression)
+
+        if extra_skills and table.num_rows:
+            lists = table["skills"].combine_chunks()
+            rows = pc.list_parent_indices(lists).to_numpy()
+            terms = pc.utf8_lower(pc.list_flatten(lists))
+            keep = np.ones(table.num_rows, dtype=bool)
+            for skill in extra_skills:
+                matched = pc.equal(terms, skill).to_numpy(zero_copy_only=False)
+                keep &= np.isin(np.arange(table.num_rows), rows[matched])
+            table = table.filter(pa.array(keep))
+            if columns is not None and "skills" not in columns:
+                table = table.drop_columns(["skills"])
+
+        return table
+
+    def scan(self, columns: Optional[Sequence[str]] = None, **filters) -> pd.DataFrame:
+        """Latest live rows matching all filters, as a DataFrame (see scan_table)"""
+        return self.scan_table(columns, **filters).to_pandas()
+
+    def candidates(self, **filters) -> List[Dict]:
+        """CV dicts of the latest live candidates matching filters (see scan)"""
+        frame = self.scan(columns=["data"], **filters)
+        return [json.loads(data) for data in frame["data"]]
+
+    def ids(self) -> List[str]:
+        return list(self.scan(columns=["candidate_id"])["candidate_id"])
+
+    def __len__(self) -> int:
+        if not self._parts():
+            return 0
+        return len(self._live_versions(self._dataset()))
+
+    def compact(self):
+        """Rewrite all parts as one file holding only live rows"""
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        with self._lock:
+            parts = self._parts()
+            if len(parts) < 2:
+                return
+            dataset = self._dataset()
+            table = dataset.to_table(filter=pc.field("version").isin(self._live_versions(dataset)))
+
+            name = f"part-{time.time_ns()}-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(self.root, "." + name)
+            pq.write_table(table, tmp_path, compression="zstd", row_group_size=16384)
+            os.replace(tmp_path, os.path.join(self.root, name))
+            for path in parts:
+                os.remove(path)
+        logger.info(f"Compacted {len(parts)} parts into {name} ({table.num_rows} rows)")
+
+
+_store: Optional[CandidateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_candidate_store() -> Optional[CandidateStore]:
+    """Shared talent pool from settings (None when disabled or pyarrow is missing)"""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            from core.config import settings
+
+            if not settings.talent_pool_enabled or not settings.talent_pool_path:
+                return None
+            try:
+                _store = CandidateStore(settings.talent_pool_path)
+            except Exception as e:
+                logger.warning(f"Talent pool unavailable: {e}")
+                return None
+        return _store
+
+
+def score_pool(company_profile: Dict, store: CandidateStore, top_k: Optional[int] = None, **filters) -> List[Dict]:
+    """
+    Rank a stored talent pool against a role with the vectorized scorer
+
+    Reads only the scoring columns (no JSON decoding, no re-parsing).
+    filters are passed to CandidateStore.scan. Results are the
+    score_candidates dicts plus candidate_id.
+    """
+    from processors.batch_scorer import BatchScorer
+
+    table = store.scan_table(
+        columns=["name", "email", "degree", "university", "experience_count",
+                 "skills", "soft_skills", "years_experience"],
+        **filters
+    )
+    if not table.num_rows:
+        return []
+
+    scorer = BatchScorer(company_profile)
+    scores = scorer.score(None, batch=scorer.encode_table(table))
+    order = scorer.rank(scores)
+    if top_k is not None:
+        order = order[:top_k]
+
+    ids = table["candidate_id"].to_pylist()
+    names = table["name"].to_pylist()
+    results = []
+    for rank, idx in enumerate(order, 1):
+        results.append({
+            "candidate_id": ids[idx],
+            "name": names[idx] or "Unknown",
+            "overall_score": int(scores["overall_score"][idx]),
+            "technical_score": int(scores["technical_score"][idx]),
+            "culture_score": int(scores["culture_score"][idx]),
+            "cv_quality_score": int(scores["cv_quality_score"][idx]),
+            "method": "batch_manual",
+            "rank": rank,
+        })
+    return results
@@ -0,0 +1,63 @@
+"""Compiled Company Profile - precomputed lookup tables for manual scoring"""
+
+from typing import Dict, FrozenSet, Tuple
+
+
+class CompiledCompanyProfile:
+    """
+    Immutable, pre-normalized view of a company profile
+
+    Built once per profile so the manual analyses can score each
+    candidate with set lookups instead of rebuilding lowercased lists
+    for every skill of every candidate.
+    """
+
+    focus_skills: Tuple[str, ...]
+    focus_skills_lower: FrozenSet[str]
+    focus_skill_pairs: Tuple[Tuple[str, str], ...]
+    values: Tuple[str, ...]
+    values_lower: Tuple[str, ...]
+    value_pairs: Tuple[Tuple[str, str], ...]
+    value_token_pairs: Tuple[Tuple[str, FrozenSet[str]], ...]
+    value_tokens: FrozenSet[str]
+
+    __slots__ = (
+        "focus_skills",
+        "focus_skills_lower",
+        "focus_skill_pairs",
+        "values",
+        "values_lower",
+        "value_pairs",
+        "value_token_pairs",
+        "value_tokens",
+    )
+
+    def __init__(self, company_profile: Dict):
+        focus_skills = tuple(company_profile.get("focus_skills", []))
+        values = tuple(company_profile.get("values", []))
+
+        # Focus skills: original spelling + lowercase, in profile order
+        focus_skill_pairs = tuple((f, f.lower()) for f in focus_skills)
+
+        # Values: original spelling + lowercase, and the word tokens of each lowercase value
+        value_pairs = tuple((v, v.lower()) for v in values)
+        values_lower = tuple(lower for _, lower in value_pairs)
+        value_token_pairs = tuple((lower, frozenset(lower.split())) for lower in values_lower)
+
+        # Attributes are set once here; __setattr__ rejects any later assignment
+        _set = object.__setattr__
+        _set(self, "focus_skills", focus_skills)
+        _set(self, "focus_skill_pairs", focus_skill_pairs)
+        _set(self, "focus_skills_lower", frozenset(lower for _, lower in focus_skill_pairs))
+        _set(self, "values", values)
+        _set(self, "value_pairs", value_pairs)
+        _set(self, "values_lower", values_lower)
+        _set(self, "value_token_pairs", value_token_pairs)
+        # Every token that can align a value (for quick rejection / vocabularies)
+        _set(self, "value_tokens", frozenset().union(*(tokens for _, tokens in value_token_pairs)))
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
@@ -0,0 +1,118 @@
+"""Parsed CV Cache - content-hash keyed store of extracted text + structured data"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from processors.cv_parser import CVParser, PARSER_VERSION, pdf_budget
+from processors.pdf_backends import pdf_backend_name
+from utils.cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedCVCache:
+    """
+    Persistent cache of parsed CVs
+
+    Entries are keyed by the SHA-256 of the file bytes, the file type,
+    PARSER_VERSION and (for PDFs) the backend and extraction budget, and
+    hold both the raw extracted text and the structured dict.
+    Re-ingesting a known file costs one hash and one lookup. The least
+    recently used entries are evicted once the store exceeds max_bytes.
+    """
+
+    def __init__(self, path: str, max_bytes: Optional[int] = None, max_entries: Optional[int] = None):
+        self.store = SQLiteCache(path, max_bytes=max_bytes, max_entries=max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(file_name: str, file_content) -> str:
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        extension = os.path.splitext(file_name)[1].lower()
+        digest = hashlib.sha256(file_content).hexdigest()
+        if extension == ".pdf":
+            # Backend and budgets change the output, so they are part of the key
+            extension += ":%s:%d:%d" % ((pdf_backend_name(),) + pdf_budget())
+        return f"v{PARSER_VERSION}:{extension}:{digest}"
+
+    def get(self, file_name: str, file_content) -> Optional[Dict]:
+        """Cached {"text", "data"} entry for this content, or None"""
+        entry = self.store.get(self.make_key(file_name, file_content))
+        self._count(entry is not None)
+        return entry
+
+    def parse(self, file_name: str, file_content) -> Dict:
+        """Parsed CV for this content, from cache when possible"""
+        key = self.make_key(file_name, file_content)
+
+        try:
+            entry = self.store.get(key)
+        except Exception as e:
+            logger.warning(f"CV cache read failed: {e}")
+            entry = None
+        self._count(entry is not None)
+        if entry is not None:
+            return entry["data"]
+
+        text, data = CVParser.parse_with_text(file_name, file_content)
+        # Failed parses are not cached; they may succeed after a fix or install
+        if data:
+            try:
+                self.store.set(key, {"text": text, "data": data})
+            except Exception as e:
+                logger.warning(f"CV cache write failed: {e}")
+        return data
+
+    def stats(self) -> Dict:
+        stats = self.store.info()
+        stats.update({"hits": self.hits, "misses": self.misses, "evictions": self.store.evictions})
+        return stats
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+_cv_cache: Optional[ParsedCVCache] = None
+_cv_cache_pid: Optional[int] = None
+_cv_cache_lock = threading.Lock()
+
+
+def get_cv_cache() -> Optional[ParsedCVCache]:
+    """Process-wide parsed-CV cache from settings (None when disabled)
+
+    A new connection is opened per process, so forked ingest workers
+    never share the parent's SQLite handle.
+    """
+    global _cv_cache, _cv_cache_pid
+
+    with _cv_cache_lock:
+        if _cv_cache is None or _cv_cache_pid != os.getpid():
+            from core.config import settings
+
+            if not settings.cv_cache_enabled or not settings.cv_cache_path:
+                return None
+            try:
+                _cv_cache = ParsedCVCache(settings.cv_cache_path, max_bytes=settings.cv_cache_max_bytes or None)
+                _cv_cache_pid = os.getpid()
+            except Exception as e:
+                logger.warning(f"Parsed CV cache unavailable: {e}")
+                return None
+        return _cv_cache
+
+
+def parse_cached(file_name: str, file_content) -> Dict:
+    """Parse CV content through the shared cache (plain parse if disabled)"""
+    cache = get_cv_cache()
+    if cache is None:
+        return CVParser.parse_bytes(file_name, file_content)
+    return cache.parse(file_name, file_content)
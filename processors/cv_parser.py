@@ -2,11 +2,50 @@
 
 import json
 import os
-from typing import Dict, Optional
+import re
+from typing import Dict, Iterator, Optional, Tuple
 import logging
 
+from utils.keyword_scanner import KeywordScanner
+
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes, to invalidate cached parses
+PARSER_VERSION = "5"
+
+# File extensions CVParser knows how to read
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt', '.text', '.json')
+
+# Keyword tables for _extract_structured_data (matched as lowercase substrings)
+EDUCATION_KEYWORDS = ('bs ', 'ba ', 'ms ', 'ma ', 'phd', 'mba', 'degree', 'certificate')
+UNIVERSITY_KEYWORDS = ('university', 'college', 'institute', 'school')
+EXPERIENCE_KEYWORDS = ('engineer', 'developer', 'manager', 'director', 'lead', 'analyst', 'specialist')
+SKILL_KEYWORDS = ('python', 'java', 'javascript', 'sql', 'aws', 'kubernetes', 'git',
+                  'react', 'django', 'tensorflow', 'pytorch', 'machine learning', 'ai', 'ml')
+SOFT_SKILL_KEYWORDS = ('leadership', 'communication', 'problem-solving', 'teamwork',
+                       'collaboration', 'creativity', 'adaptability', 'mentoring', 'presentation')
+
+SKILL_ORDER = {skill: idx for idx, skill in enumerate(SKILL_KEYWORDS)}
+SOFT_SKILL_ORDER = {skill: idx for idx, skill in enumerate(SOFT_SKILL_KEYWORDS)}
+
+# One automaton over every table (plus 'year' for the experience estimate)
+KEYWORD_SCANNER = KeywordScanner(
+    EDUCATION_KEYWORDS + UNIVERSITY_KEYWORDS + EXPERIENCE_KEYWORDS +
+    SKILL_KEYWORDS + SOFT_SKILL_KEYWORDS + ('year',)
+)
+
+PHONE_PATTERN = re.compile(r'(\+?1?\s*)?(\d{3}[-.]?\d{3}[-.]?\d{4})')
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+def pdf_budget() -> Tuple[int, int]:
+    """(max_pages, max_chars) extracted per PDF, from settings (0 = unlimited)"""
+    try:
+        from core.config import settings
+        return settings.pdf_max_pages, settings.pdf_max_chars
+    except Exception:
+        return 0, 0
+
 
 class CVParser:
     """Parse CVs from multiple formats"""
@@ -18,25 +57,52 @@ class CVParser:
         
         Args:
             file_path: Path or filename with extension
-            file_content: File content (if already loaded)
+            file_content: File content (if already loaded); read from
+                file_path when omitted
             
         Returns:
             Dictionary with parsed CV data
         """
         
-        extension = os.path.splitext(file_path)[1].lower()
+        if file_content is None:
+            try:
+                with open(file_path, 'rb') as f:
+                    file_content = f.read()
+            except OSError as e:
+                logger.error(f"Error reading {file_path}: {e}")
+                return {}
+        
+        return CVParser.parse_bytes(file_path, file_content)
+    
+    @staticmethod
+    def parse_bytes(file_name: str, file_content) -> Dict:
+        """
+        Parse CV from in-memory content, dispatching on the file name's extension
+        
+        Args:
+            file_name: Filename (or path) with extension
+            file_content: Raw bytes (str is accepted for text formats)
+        """
+        
+        extension = os.path.splitext(file_name)[1].lower()
         
         if extension == '.json':
-            return CVParser.parse_json(file_content or file_path)
+            try:
+                if isinstance(file_content, bytes):
+                    file_content = file_content.decode('utf-8')
+                return CVParser.parse_json(json.loads(file_content))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.error(f"Error parsing JSON: {e}")
+                return {}
         elif extension == '.pdf':
-            return CVParser.parse_pdf(file_path, file_content)
+            return CVParser.parse_pdf(None, file_content)
         elif extension in ['.docx', '.doc']:
-            return CVParser.parse_docx(file_path, file_content)
+            return CVParser.parse_docx(None, file_content)
         elif extension in ['.txt', '.text']:
-            return CVParser.parse_txt(file_content or file_path)
+            return CVParser.parse_txt(file_content)
         else:
             logger.warning(f"Unknown format: {extension}")
-            return CVParser.parse_txt(file_content or file_path)
+            return CVParser.parse_txt(file_content)
     
     @staticmethod
     def parse_json(file_content) -> Dict:
@@ -51,20 +117,9 @@ class CVParser:
     
     @staticmethod
     def parse_pdf(file_path: str, file_content=None) -> Dict:
-        """Parse PDF CV using PyPDF2"""
+        """Parse PDF CV with the configured PDF backend"""
         try:
-            import PyPDF2
-            import io
-            
-            if file_content:
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            else:
-                pdf_reader = PyPDF2.PdfReader(open(file_path, 'rb'))
-            
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            
+            text = CVParser.extract_pdf_text(file_path, file_content)
             return CVParser._extract_structured_data(text)
             
         except Exception as e:
@@ -75,18 +130,7 @@ class CVParser:
     def parse_docx(file_path: str, file_content=None) -> Dict:
         """Parse DOCX CV"""
         try:
-            from docx import Document
-            import io
-            
-            if file_content:
-                doc = Document(io.BytesIO(file_content))
-            else:
-                doc = Document(file_path)
-            
-            text = ""
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-            
+            text = CVParser.extract_docx_text(file_path, file_content)
             return CVParser._extract_structured_data(text)
             
         except Exception as e:
@@ -97,22 +141,137 @@ class CVParser:
     def parse_txt(file_content: str) -> Dict:
         """Parse TXT CV"""
         try:
-            if isinstance(file_content, bytes):
-                text = file_content.decode('utf-8')
-            else:
-                text = file_content
-            
+            text = CVParser.extract_txt_text(file_content)
             return CVParser._extract_structured_data(text)
             
         except Exception as e:
             logger.error(f"Error parsing TXT: {e}")
             return {}
     
+    @staticmethod
+    def parse_with_text(file_name: str, file_content) -> Tuple[str, Dict]:
+        """
+        Parse CV from in-memory content and also return its raw text
+        
+        Returns:
+            (raw_text, cv_data); cv_data is {} if the file can't be parsed
+        """
+        extension = os.path.splitext(file_name)[1].lower()
+        
+        try:
+            if extension == '.json':
+                text = file_content.decode('utf-8') if isinstance(file_content, bytes) else file_content
+                return text, CVParser.parse_json(json.loads(text))
+            
+            text = CVParser.extract_text(file_name, file_content)
+            return text, CVParser._extract_structured_data(text)
+            
+        except Exception as e:
+            logger.error(f"Error parsing {file_name}: {e}")
+            return "", {}
+    
+    @staticmethod
+    def extract_text(file_name: str, file_content) -> str:
+        """Raw text of a PDF, DOCX or text CV (raises on unreadable files)"""
+        extension = os.path.splitext(file_name)[1].lower()
+        
+        if extension == '.pdf':
+            return CVParser.extract_pdf_text(None, file_content)
+        elif extension in ['.docx', '.doc']:
+            return CVParser.extract_docx_text(None, file_content)
+        return CVParser.extract_txt_text(file_content)
+    
+    @staticmethod
+    def iter_pdf_pages(file_path: str, file_content=None, max_pages: Optional[int] = None,
+                       backend: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield the text of each PDF page in order
+        
+        Pages are extracted one at a time by the configured backend
+        (settings.pdf_backend), so a caller that stops early never pays
+        for the rest of the document. PDFs without a text layer yield
+        nothing. The file handle (when reading from a path) is closed as
+        soon as the generator finishes or is closed.
+        """
+        from processors.pdf_backends import get_pdf_backend, has_text_layer
+        import io
+        
+        with (io.BytesIO(file_content) if file_content else open(file_path, 'rb')) as stream:
+            if not has_text_layer(stream):
+                logger.info(f"No text layer in {file_path or 'PDF upload'}, skipping extraction")
+                return
+            yield from get_pdf_backend(backend).iter_pages(stream, max_pages=max_pages)
+    
+    @staticmethod
+    def extract_pdf_text(file_path: str, file_content=None, max_pages: Optional[int] = None,
+                         max_chars: Optional[int] = None, backend: Optional[str] = None) -> str:
+        """
+        Extract the text layer of a PDF, within a page and character budget
+        
+        Budgets default to settings.pdf_max_pages / settings.pdf_max_chars
+        (0 = unlimited). Extraction stops at whichever is reached first.
+        """
+        default_pages, default_chars = pdf_budget()
+        max_pages = default_pages if max_pages is None else max_pages
+        max_chars = default_chars if max_chars is None else max_chars
+        
+        parts = []
+        total = 0
+        pages = CVParser.iter_pdf_pages(file_path, file_content, max_pages=max_pages, backend=backend)
+        try:
+            for page_text in pages:
+                if max_chars and total + len(page_text) >= max_chars:
+                    parts.append(page_text[:max_chars - total])
+                    break
+                parts.append(page_text)
+                total += len(page_text)
+        finally:
+            pages.close()
+        
+        return "".join(parts)
+    
+    @staticmethod
+    def extract_docx_text(file_path: str, file_content=None) -> str:
+        """
+        Extract paragraph and table text of a DOCX
+        
+        Streams word/document.xml straight out of the zip; python-docx is
+        only used if that fails (e.g. a malformed or non-standard package).
+        """
+        from processors.docx_reader import extract_docx_text
+        import io
+        
+        try:
+            return extract_docx_text(io.BytesIO(file_content) if file_content else file_path)
+        except Exception as e:
+            logger.warning(f"Fast DOCX extraction failed ({e}), falling back to python-docx")
+        
+        from docx import Document
+        
+        doc = Document(io.BytesIO(file_content) if file_content else file_path)
+        lines = [para.text for para in doc.paragraphs]
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    lines.extend(para.text for para in cell.paragraphs)
+        
+        return "".join(line + "\n" for line in lines)
+    
+    @staticmethod
+    def extract_txt_text(file_content) -> str:
+        """Decode a text CV"""
+        if isinstance(file_content, bytes):
+            return file_content.decode('utf-8')
+        return file_content
+    
     @staticmethod
     def _extract_structured_data(text: str) -> Dict:
         """
         Extract structured data from raw CV text
         Uses pattern matching to find common CV sections
+        
+        Single pass over the lines: one Aho-Corasick scan per line finds
+        every keyword from all tables at once.
         """
         
         lines = text.split('\n')
@@ -140,89 +299,52 @@ class CVParser:
                 cv_data["name"] = line.strip()
                 break
         
-        # Extract email
-        for line in text.split('\n'):
-            if '@' in line and '.' in line:
-                email = line.strip()
-                if email.count('@') == 1:
-                    cv_data["email"] = email
-                    break
-        
         # Extract phone
-        import re
-        phone_pattern = r'(\+?1?\s*)?(\d{3}[-.]?\d{3}[-.]?\d{4})'
-        for match in re.finditer(phone_pattern, text):
-            cv_data["phone"] = match.group(0)
-            break
-        
-        # Extract education keywords
-        education_keywords = ['bs ', 'ba ', 'ms ', 'ma ', 'phd', 'mba', 'degree', 'certificate']
-        for line in lines:
-            line_lower = line.lower()
-            for keyword in education_keywords:
-                if keyword in line_lower:
-                    cv_data["degree"] = line.strip()
-                    break
+        phone_match = PHONE_PATTERN.search(text)
+        if phone_match:
+            cv_data["phone"] = phone_match.group(0)
         
-        # Extract university keywords
-        university_keywords = ['university', 'college', 'institute', 'school']
         for line in lines:
-            line_lower = line.lower()
-            for keyword in university_keywords:
-                if keyword in line_lower:
-                    cv_data["university"] = line.strip()
-                    break
-        
-        # Extract experience (look for common job keywords)
-        experience_keywords = ['engineer', 'developer', 'manager', 'director', 'lead', 'analyst', 'specialist']
-        current_role = ""
-        
-        for line in lines:
-            line_lower = line.lower()
-            for keyword in experience_keywords:
-                if keyword in line_lower and len(line.strip()) < 100:
-                    if not current_role:
-                        current_role = line.strip()
-                        cv_data["current_role"] = current_role
-                    
-                    cv_data["experience"].append({
-                        "role": line.strip(),
-                        "company": "Unknown",
-                        "duration": "N/A",
-                        "description": ""
-                    })
-                    break
-        
-        # Extract skills (look for common skill keywords)
-        skill_keywords = ['python', 'java', 'javascript', 'sql', 'aws', 'kubernetes', 'git',
-                         'react', 'django', 'tensorflow', 'pytorch', 'machine learning', 'ai', 'ml']
-        
-        for line in lines:
-            line_lower = line.lower()
-            for skill in skill_keywords:
-                if skill in line_lower:
-                    if skill not in cv_data["skills"]:
-                        cv_data["skills"].append(skill.title())
-        
-        # Extract soft skills
-        soft_skills_keywords = ['leadership', 'communication', 'problem-solving', 'teamwork',
-                              'collaboration', 'creativity', 'adaptability', 'mentoring', 'presentation']
-        
-        for line in lines:
-            line_lower = line.lower()
-            for skill in soft_skills_keywords:
-                if skill in line_lower:
-                    if skill not in cv_data["soft_skills"]:
-                        cv_data["soft_skills"].append(skill.title())
-        
-        # Estimate years of experience from keywords
-        for line in lines:
-            line_lower = line.lower()
-            if 'year' in line_lower:
-                import re
-                numbers = re.findall(r'\d+', line)
-                if numbers:
-                    cv_data["years_experience"] = max(cv_data["years_experience"], int(numbers[0]))
+            # Extract email (first line that looks like one)
+            if not cv_data["email"] and '@' in line and '.' in line:
+                email = line.strip()
+                if email.count('@') == 1:
+                    cv_data["email"] = email
+            
+            hits = KEYWORD_SCANNER.scan(line.lower())
+            if not hits:
+                continue
+            
+            # Education / university (last matching line wins)
+            if not hits.isdisjoint(EDUCATION_KEYWORDS):
+                cv_data["degree"] = line.strip()
+            if not hits.isdisjoint(UNIVERSITY_KEYWORDS):
+                cv_data["university"] = line.strip()
+            
+            # Experience (look for common job keywords)
+            if not hits.isdisjoint(EXPERIENCE_KEYWORDS) and len(line.strip()) < 100:
+                if not cv_data["current_role"]:
+                    cv_data["current_role"] = line.strip()
+                
+                cv_data["experience"].append({
+                    "role": line.strip(),
+                    "company": "Unknown",
+                    "duration": "N/A",
+                    "description": ""
+                })
+            
+            # Skills and soft skills, in keyword-table order. A skill found on
+            # several lines is listed once per line, as the parser always has.
+            for skill in sorted(hits.intersection(SKILL_KEYWORDS), key=SKILL_ORDER.__getitem__):
+                cv_data["skills"].append(skill.title())
+            for skill in sorted(hits.intersection(SOFT_SKILL_KEYWORDS), key=SOFT_SKILL_ORDER.__getitem__):
+                cv_data["soft_skills"].append(skill.title())
+            
+            # Estimate years of experience from keywords
+            if 'year' in hits:
+                number = NUMBER_PATTERN.search(line)
+                if number:
+                    cv_data["years_experience"] = max(cv_data["years_experience"], int(number.group(0)))
         
         return cv_data
 
@@ -234,20 +356,13 @@ def parse_cv_streamlit(uploaded_file) -> Dict:
     """
     
     try:
+        from processors.cv_cache import parse_cached
         file_name = uploaded_file.name
         file_content = uploaded_file.read()
-        
-        # Try to parse based on file type
-        extension = os.path.splitext(file_name)[1].lower()
-        
-        if extension == '.json':
-            return CVParser.parse_json(json.loads(file_content.decode('utf-8')))
-        elif extension == '.pdf':
-            return CVParser.parse_pdf(None, file_content)
-        elif extension in ['.docx', '.doc']:
-            return CVParser.parse_docx(None, file_content)
-        else:
-            return CVParser.parse_txt(file_content)
+        if os.path.splitext(file_name)[1].lower() == '.json':
+            # Malformed JSON is reported as an error dict (the parsers return {})
+            json.loads(file_content.decode('utf-8'))
+        return parse_cached(file_name, file_content)
             
     except Exception as e:
         logger.error(f"Error parsing CV: {e}")
@@ -0,0 +1,158 @@
+"""CV Deduplication - MinHash/LSH near-duplicate detection"""
+
+import logging
+import re
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 64
+LSH_BANDS = 8  # 8 bands x 8 rows: pairs above ~0.77 Jaccard almost always collide
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.RandomState(1)
+# Fixed seed: signatures are comparable across runs and processes
+_PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Stable 32-bit hashes of the word size-grams of text (lowercased)"""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+    if len(tokens) <= size:
+        grams = {" ".join(tokens)}
+    else:
+        grams = {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash(text: str) -> Optional[np.ndarray]:
+    """MinHash signature (NUM_PERM uint32 values), or None for empty text"""
+    hashes = shingles(text)
+    if not len(hashes):
+        return None
+    # (NUM_PERM, n_shingles) universal hashes; uint64 wraparound is intended
+    permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def candidate_text(cv_data: Dict) -> str:
+    """Text to fingerprint: the parsed fields, so parsed and JSON CVs compare alike"""
+    parts = [cv_data.get("raw_text", ""), cv_data.get("name", ""), cv_data.get("email", ""),
+             cv_data.get("degree", ""), cv_data.get("university", "") or cv_data.get("education", "")]
+    parts.extend(cv_data.get("skills", []))
+    parts.extend(cv_data.get("soft_skills", []))
+    for experience in cv_data.get("experience", []):
+        if isinstance(experience, dict):
+            parts.extend(str(v) for v in experience.values())
+        else:
+            parts.append(str(experience))
+    return " ".join(str(part) for part in parts if part)
+
+
+def candidate_signature(cv_data: Dict) -> Optional[np.ndarray]:
+    """MinHash of the CV fields, computed at dedup time (never stored on the CV)"""
+    return minhash(candidate_text(cv_data))
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 (path halving, union by smallest root)"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest index as root so it becomes the representative
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
+
+class LSHIndex:
+    """Banded LSH over MinHash signatures: lookups touch only colliding buckets"""
+
+    def __init__(self, bands: int = LSH_BANDS, num_perm: int = NUM_PERM):
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: np.ndarray) -> Iterable[bytes]:
+        rows = self.rows
+        for band in range(self.bands):
+            yield signature[band * rows:(band + 1) * rows].tobytes()
+
+    def query(self, signature: np.ndarray) -> List[int]:
+        found = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(key, ()))
+        return sorted(found)
+
+    def insert(self, key: int, signature: np.ndarray):
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+
+def find_duplicate_clusters(signatures: Sequence[Optional[np.ndarray]],
+                            threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """
+    Group near-duplicate signatures
+
+    Each signature is checked only against earlier ones sharing an LSH
+    bucket, then confirmed with the estimated Jaccard similarity, so the
+    cost grows with the number of likely matches rather than N^2.
+    Clusters are transitive (union-find).
+
+    Returns:
+        Clusters as lists of indices, each sorted with the representative
+        (earliest index) first; clusters are ordered by representative.
+        Items without a signature are singletons.
+    """
+    index = LSHIndex()
+    groups = UnionFind(len(signatures))
+
+    for idx, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for other in index.query(signature):
+            if similarity(signature, signatures[other]) >= threshold:
+                groups.union(idx, other)
+        index.insert(idx, signature)
+
+    clusters: Dict[int, List[int]] = {}
+    for idx in range(len(signatures)):
+        clusters.setdefault(groups.find(idx), []).append(idx)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+def dedup_candidates(candidates: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """Near-duplicate clusters of candidate CVs (see find_duplicate_clusters)"""
+    signatures = [candidate_signature(candidate) for candidate in candidates]
+    clusters = find_duplicate_clusters(signatures, threshold)
+    duplicates = len(candidates) - len(clusters)
+    if duplicates:
+        logger.info(f"Dedup: {duplicates} near-duplicate CVs in {len(candidates)} candidates")
+    return clusters
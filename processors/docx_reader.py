@@ -0,0 +1,67 @@
+"""DOCX Reader - stream text out of word/document.xml without python-docx"""
+
+import logging
+import zipfile
+from typing import BinaryIO, Iterator, List, Union
+from xml.etree.ElementTree import iterparse
+
+logger = logging.getLogger(__name__)
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+PARAGRAPH = W_NS + "p"
+TEXT = W_NS + "t"
+TAB = W_NS + "tab"
+BREAKS = (W_NS + "br", W_NS + "cr")
+TABLE = W_NS + "tbl"
+
+DOCUMENT_PART = "word/document.xml"
+
+
+def iter_docx_paragraphs(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """
+    Yield the text of every paragraph in a DOCX, in document order
+
+    Opens the zip and iterparses word/document.xml as it is decompressed,
+    so neither the full XML tree nor the python-docx object model is
+    built, and embedded media is never read. Paragraphs inside tables
+    and text boxes are included (one per cell paragraph).
+
+    Raises:
+        zipfile.BadZipFile / KeyError / ParseError on files that aren't DOCX
+    """
+    with zipfile.ZipFile(source) as archive:
+        with archive.open(DOCUMENT_PART) as document:
+            # Runs of the paragraphs currently open (text boxes nest inside runs)
+            open_paragraphs: List[List[str]] = []
+            # Open elements, so finished body-level blocks can be detached
+            path: List = []
+
+            for event, elem in iterparse(document, events=("start", "end")):
+                if event == "start":
+                    path.append(elem)
+                    if elem.tag == PARAGRAPH:
+                        open_paragraphs.append([])
+                    continue
+
+                path.pop()
+                tag = elem.tag
+                if tag == TEXT:
+                    if elem.text and open_paragraphs:
+                        open_paragraphs[-1].append(elem.text)
+                elif tag == TAB:
+                    if open_paragraphs:
+                        open_paragraphs[-1].append("\t")
+                elif tag in BREAKS:
+                    if open_paragraphs:
+                        open_paragraphs[-1].append("\n")
+                elif tag == PARAGRAPH:
+                    yield "".join(open_paragraphs.pop())
+
+                # document > body > block: drop finished blocks to keep memory flat
+                if len(path) == 2 and tag in (PARAGRAPH, TABLE):
+                    path[-1].remove(elem)
+
+
+def extract_docx_text(source: Union[str, BinaryIO]) -> str:
+    """Paragraph text of a DOCX, one line per paragraph"""
+    return "".join(paragraph + "\n" for paragraph in iter_docx_paragraphs(source))
@@ -4,6 +4,8 @@ import logging
 from typing import Dict, List
 import os
 
+from utils.stage_graph import StageGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +26,7 @@ class IntelligentMatcher:
         
         # Import modules only when needed
         try:
-            from ai_analysis_modules import (
+            from processors.ai_analysis_modules import (
                 SkillExtractor,
                 CultureAnalyzer,
                 RedFlagDetector,
@@ -33,6 +35,7 @@ class IntelligentMatcher:
             
             api_key = os.getenv(f"{llm_provider.upper()}_API_KEY")
             
+            # All modules share one registry-backed client (see core.llm_provider.get_llm)
             self.skill_extractor = SkillExtractor(llm_provider, api_key)
             self.culture_analyzer = CultureAnalyzer(llm_provider, api_key)
             self.red_flag_detector = RedFlagDetector(llm_provider, api_key)
@@ -54,40 +57,15 @@ class IntelligentMatcher:
             return self._match_candidate_basic(cv_data)
         
         try:
-            # Step 1: Extract skills intelligently
-            skills_analysis = self.skill_extractor.extract_skills(cv_data)
-            
-            # Step 2: Analyze culture fit
-            culture_fit = self.culture_analyzer.analyze_fit(cv_data, self.company_profile)
-            
-            # Step 3: Detect red flags
-            red_flags = self.red_flag_detector.detect_flags(cv_data)
-            
-            # Step 4: Calculate combined score
-            technical_score = self._score_technical_skills(cv_data, skills_analysis)
-            soft_skills_score = culture_fit.get("culture_score", 60)
-            red_flag_penalty = self._calculate_red_flag_penalty(red_flags)
-            cv_quality_score = self._score_cv_quality(cv_data)
-            
-            # Weighted scoring: Tech(35%) + Soft(30%) + RedFlags(20%) + Quality(15%)
-            overall_score = (
-                technical_score * 0.35 +
-                soft_skills_score * 0.30 +
-                (100 - red_flag_penalty) * 0.20 +
-                cv_quality_score * 0.15
-            )
+            # Steps 1-3 (skills, culture fit, red flags) are independent and run
+            # concurrently; step 4 scores them and step 5 writes feedback
+            results = self._match_graph(cv_data).run()
             
-            # Step 5: Generate feedback
-            analysis_data = {
-                "candidate": cv_data,
-                "company": self.company_profile,
-                "match_score": int(overall_score),
-                "skills_analysis": skills_analysis,
-                "culture_fit": culture_fit,
-                "red_flags": red_flags
-            }
-            
-            feedback = self.feedback_generator.generate_feedback(analysis_data)
+            skills_analysis = results["skills"]
+            culture_fit = results["culture_fit"]
+            red_flags = results["red_flags"]
+            technical_score, soft_skills_score, cv_quality_score, overall_score = results["scores"]
+            feedback = results["feedback"]
             
             return {
                 "name": cv_data.get("name", "Unknown"),
@@ -107,6 +85,54 @@ class IntelligentMatcher:
             logger.error(f"Error matching candidate: {e}")
             return self._match_candidate_basic(cv_data)
     
+    def _match_graph(self, cv_data: Dict) -> StageGraph:
+        """Stage graph for one candidate; each stage falls back on its own"""
+        
+        def scores(skills, culture_fit, red_flags):
+            technical_score = self._score_technical_skills(cv_data, skills)
+            soft_skills_score = culture_fit.get("culture_score", 60)
+            red_flag_penalty = self._calculate_red_flag_penalty(red_flags)
+            cv_quality_score = self._score_cv_quality(cv_data)
+            
+            # Weighted scoring: Tech(35%) + Soft(30%) + RedFlags(20%) + Quality(15%)
+            overall_score = (
+                technical_score * 0.35 +
+                soft_skills_score * 0.30 +
+                (100 - red_flag_penalty) * 0.20 +
+                cv_quality_score * 0.15
+            )
+            return technical_score, soft_skills_score, cv_quality_score, overall_score
+        
+        def analysis_data(skills, culture_fit, red_flags, scores):
+            return {
+                "candidate": cv_data,
+                "company": self.company_profile,
+                "match_score": int(scores[3]),
+                "skills_analysis": skills,
+                "culture_fit": culture_fit,
+                "red_flags": red_flags
+            }
+        
+        feedback_deps = ("skills", "culture_fit", "red_flags", "scores")
+        
+        return (
+            StageGraph()
+            .add("skills",
+                 lambda: self.skill_extractor.extract_skills(cv_data),
+                 fallback=lambda: self.skill_extractor._extract_skills_fallback(cv_data))
+            .add("culture_fit",
+                 lambda: self.culture_analyzer.analyze_fit(cv_data, self.company_profile),
+                 fallback=lambda: self.culture_analyzer._analyze_fit_fallback(cv_data, self.company_profile))
+            .add("red_flags",
+                 lambda: self.red_flag_detector.detect_flags(cv_data),
+                 fallback=lambda: self.red_flag_detector._detect_flags_fallback(cv_data))
+            .add("scores", scores, depends_on=("skills", "culture_fit", "red_flags"))
+            .add("feedback",
+                 lambda **deps: self.feedback_generator.generate_feedback(analysis_data(**deps)),
+                 depends_on=feedback_deps,
+                 fallback=lambda **deps: self.feedback_generator._generate_feedback_fallback(analysis_data(**deps)))
+        )
+    
     def _score_technical_skills(self, cv_data: Dict, skills_analysis: Dict) -> int:
         """Score technical skills match"""
         try:
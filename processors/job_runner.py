@@ -0,0 +1,431 @@
+"""Job Runner - background matching jobs with progress and partial results"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from utils.cache import LRUCache
+from processors.simple_matcher import EnhancedMatcher, MatchResult, match_candidates, rank_results
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+# Persisted as queued/running but no longer known to any live runner
+INTERRUPTED = "interrupted"
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED, INTERRUPTED)
+
+
+class JobCancelled(Exception):
+    """Raised from the progress callback to abandon a cancelled job"""
+
+
+def _snapshot(result: Dict) -> Dict:
+    """Copy of a result that still generates its feedback on first read"""
+    if isinstance(result, MatchResult) and not result.feedback_ready:
+        return MatchResult(dict(dict.items(result)), feedback_loader=result.resolve_feedback,
+                           feedback_source=result.feedback_source)
+    return dict(result.items())
+
+
+def plain_result(analysis: Dict) -> Dict:
+    """JSON-ready copy of a result (a feedback letter nobody opened stays None)"""
+    if isinstance(analysis, MatchResult) and not analysis.feedback_ready:
+        data = dict(dict.items(analysis))
+        data["feedback"] = None
+        return data
+    return dict(analysis.items())
+
+
+def stored_result(analysis: Dict) -> Dict:
+    """plain_result plus what's needed to generate unopened feedback later"""
+    data = plain_result(analysis)
+    if isinstance(analysis, MatchResult) and not analysis.feedback_ready and analysis.feedback_source is not None:
+        data["feedback_source"] = analysis.feedback_source
+    return data
+
+
+class Job:
+    """
+    One (company, CVs) matching run
+
+    Results arrive through match_candidates' on_result callback while the
+    job runs, so ranked() returns a partial ranking long before the last
+    candidate is done; once finished it returns the final ranking.
+    """
+
+    def __init__(self, job_id: str, company_profile: Dict, candidates: List[Dict],
+                 options: Dict, key: Optional[str] = None):
+        self.id = job_id
+        self.key = key
+        self.company_profile = company_profile
+        self.candidates = candidates
+        self.options = options
+        self.status = QUEUED
+        self.error: Optional[str] = None
+        self.submitted = len(candidates)
+        self.completed = 0
+        self.expected = len(candidates)
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._partial: Dict[int, Dict] = {}
+        self._results: Optional[List[Dict]] = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def progress(self) -> float:
+        """Fraction of analyses completed (0.0 - 1.0)"""
+        if self.status == DONE:
+            return 1.0
+        return self.completed / self.expected if self.expected else 0.0
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def request_cancel(self):
+        self._cancel.set()
+
+    def record_result(self, position: int, analysis: Dict, expected: int):
+        """match_candidates on_result callback"""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        with self._lock:
+            self._partial[position] = analysis
+            self.completed += 1
+            self.expected = expected
+
+    def partial_results(self) -> List:
+        """(position, analysis) of every candidate finished so far"""
+        with self._lock:
+            return list(self._partial.items())
+
+    def complete(self, results: List[Dict]):
+        """Set the final ranking"""
+        self._results = results
+        self.completed = self.expected
+
+    def ranked(self) -> List[Dict]:
+        """Final ranking when done, else the candidates finished so far ranked"""
+        if self._results is not None:
+            return self._results
+        partial = [result for _, result in self.partial_results()]
+        # Copies: ranking a snapshot must not renumber live results
+        return rank_results([_snapshot(result) for result in partial])
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job is finished (False on timeout)"""
+        return self._done.wait(timeout)
+
+    def status_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "key": self.key,
+            "status": self.status,
+            "error": self.error,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "expected": self.expected,
+            "progress": round(self.progress, 4),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def to_dict(self) -> Dict:
+        """Persisted form; unopened feedback can be regenerated from it (StoredJob)"""
+        data = self.status_dict()
+        data["results"] = [stored_result(result) for result in self.ranked()] if self.finished else []
+        data["options"] = {key: self.options.get(key) for key in ("analysis_mode", "llm_provider")}
+        if any("feedback_source" in result for result in data["results"]):
+            data["company_profile"] = self.company_profile
+        return data
+
+
+class StoredJob:
+    """
+    A finished job read back from disk (read-only)
+
+    Results whose feedback was never opened come back as MatchResults
+    that regenerate the letter on first read, from the stored analysis
+    details and feedback_source.
+    """
+
+    def __init__(self, data: Dict):
+        self._data = data
+        self.id = data["id"]
+        self.key = data.get("key")
+        self.status = data.get("status", INTERRUPTED)
+        self.error = data.get("error")
+        self.completed = data.get("completed", 0)
+        self.expected = data.get("expected", 0)
+        self.options = data.get("options") or {}
+        self.finished = True
+        self._ranked: Optional[List[Dict]] = None
+        self._matcher = None
+        self._lock = threading.Lock()
+
+    @property
+    def progress(self) -> float:
+        return 1.0 if self.status == DONE else (self.completed / self.expected if self.expected else 0.0)
+
+    def ranked(self) -> List[Dict]:
+        with self._lock:
+            if self._ranked is None:
+                self._ranked = [self._result(data) for data in self._data.get("results", [])]
+            return self._ranked
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def status_dict(self) -> Dict:
+        data = {k: v for k, v in self._data.items() if k not in ("results", "company_profile", "options")}
+        data["progress"] = round(self.progress, 4)
+        return data
+
+    def _result(self, data: Dict) -> Dict:
+        source = data.get("feedback_source")
+        if source is None or data.get("feedback") is not None or "company_profile" not in self._data:
+            return data
+        data = {k: v for k, v in data.items() if k != "feedback_source"}
+        return MatchResult(data, feedback_loader=lambda: self._feedback_matcher().feedback_for(data, source),
+                           feedback_source=source)
+
+    def _feedback_matcher(self):
+        with self._lock:
+            if self._matcher is None:
+                options = self._data.get("options") or {}
+                self._matcher = EnhancedMatcher(self._data["company_profile"],
+                                                analysis_mode=options.get("analysis_mode") or "multi",
+                                                llm_provider=options.get("llm_provider"))
+            return self._matcher
+
+    def to_dict(self) -> Dict:
+        return dict(self._data)
+
+
+class JobRunner:
+    """
+    Runs matching jobs on a small thread pool
+
+    submit() returns a job id immediately; a worker thread calls
+    match_candidates, which runs the analysis on the shared background
+    loop (utils.event_loop.run_sync) while the worker waits, recording
+    results as they finish. Status is written to persist_dir on submit and the full
+    ranking when the job ends, so a client that reconnects - or a new
+    process - can still fetch it by id. At most max_jobs jobs are kept in
+    memory; older finished ones are served from disk.
+
+    Example:
+        runner = get_job_runner()
+        job_id = runner.submit(company, cvs, analysis_mode="fused")
+        job = runner.get(job_id)
+        job.progress, job.ranked()  # partial until job.finished
+    """
+
+    def __init__(self, max_workers: int = 2, persist_dir: Optional[str] = None, max_jobs: int = 64):
+        self.persist_dir = persist_dir
+        self.max_jobs = max_jobs
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="match-job")
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+
+    def submit(self, company_profile: Dict, candidates: List[Dict], key: Optional[str] = None, **options) -> str:
+        """
+        Queue a matching job
+
+        options are passed to match_candidates (analysis_mode,
+        shortlist_size, lazy_feedback, dedup, ...); key is an optional
+        caller-side label (e.g. a hash of the inputs).
+        """
+        job = Job(uuid.uuid4().hex, company_profile, list(candidates), options, key=key)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._trim()
+        persist_job(self.persist_dir, job)
+        self._executor.submit(self._run, job)
+        logger.info(f"Job {job.id}: queued {job.submitted} candidates")
+        return job.id
+
+    def get(self, job_id: str):
+        """Live Job, or StoredJob from disk, or None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            return job
+        return load_job(self.persist_dir, job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Stop a queued or running job (analyses already in flight finish first)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.request_cancel()
+        return True
+
+    def jobs(self) -> List[Dict]:
+        """Status of the jobs in memory, newest first"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.status_dict() for job in sorted(jobs, key=lambda j: j.created_at, reverse=True)]
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.request_cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job: Job):
+        if job.cancel_requested:
+            self._finish(job, CANCELLED)
+            return
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            results = match_candidates(job.company_profile, job.candidates,
+                                       on_result=job.record_result, **job.options)
+        except JobCancelled:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = str(e)
+            self._finish(job, FAILED)
+        else:
+            if job.cancel_requested:
+                self._finish(job, CANCELLED)
+                return
+            job.complete(results)
+            self._finish(job, DONE)
+
+    def _finish(self, job: Job, status: str):
+        job.status = status
+        job.finished_at = time.time()
+        # Inputs are no longer needed once the job has ended
+        job.candidates = []
+        persist_job(self.persist_dir, job)
+        job._done.set()
+        elapsed = job.finished_at - (job.started_at or job.created_at)
+        logger.info(f"Job {job.id}: {status} after {elapsed:.1f}s")
+
+    def _trim(self):
+        """Drop the oldest finished jobs beyond max_jobs (they stay on disk)"""
+        finished = [job for job in self._jobs.values() if job.finished]
+        excess = len(self._jobs) - self.max_jobs
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(0, excess)]:
+            del self._jobs[job.id]
+
+
+# Finished jobs read back from disk, by path
+_stored_jobs = LRUCache(max_entries=32)
+
+
+def _job_path(persist_dir: Optional[str], job_id: str) -> Optional[str]:
+    # Ids are uuid hex: anything else never touches the filesystem
+    if not persist_dir or not job_id.isalnum():
+        return None
+    return os.path.join(persist_dir, f"{job_id}.json")
+
+
+def persist_job(persist_dir: Optional[str], job: Job):
+    """Write a job's status (and results once finished) to persist_dir"""
+    path = _job_path(persist_dir, job.id)
+    if path is None:
+        return
+    try:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(job.to_dict(), f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Could not persist job {job.id}: {e}")
+
+
+def load_job(persist_dir: Optional[str], job_id: str) -> Optional[StoredJob]:
+    """A job persisted to persist_dir, or None
+
+    Finished jobs are kept in a small LRU, so feedback regenerated for
+    them is not lost between calls.
+    """
+    path = _job_path(persist_dir, job_id)
+    if path is None:
+        return None
+    stored = _stored_jobs.get(path)
+    if stored is not None:
+        return stored
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read job {job_id}: {e}")
+        return None
+    if data.get("status") not in FINISHED_STATES:
+        # Written by a runner that is gone (or still running elsewhere): don't cache
+        data["status"] = INTERRUPTED
+        return StoredJob(data)
+    stored = StoredJob(data)
+    _stored_jobs.set(path, stored)
+    return stored
+
+
+def results_key(company_profile: Optional[Dict], cvs: List[Dict]) -> str:
+    """Hash of everything that affects the ranking (profile, CVs, provider settings)
+
+    The profile's created_at timestamp is ignored, so re-saving an
+    unchanged profile keeps reusing the same job.
+    """
+    from core.config import settings
+
+    payload = {
+        "company": {k: v for k, v in (company_profile or {}).items() if k != "created_at"},
+        "cvs": cvs,
+        "provider": settings.llm_provider,
+        "analysis_mode": settings.analysis_mode,
+        "shortlist_size": settings.shortlist_size,
+        "lazy_feedback": settings.lazy_feedback,
+        "dedup": (settings.dedup_enabled, settings.dedup_threshold),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Process-wide job runner from settings"""
+    global _runner
+
+    with _runner_lock:
+        if _runner is None:
+            from core.config import settings
+
+            _runner = JobRunner(
+                max_workers=settings.job_workers,
+                persist_dir=settings.jobs_path or None,
+                max_jobs=settings.job_memory_limit
+            )
+        return _runner
@@ -0,0 +1,132 @@
+"""PDF Backends - pluggable text extraction engines for CVParser"""
+
+import logging
+from typing import BinaryIO, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes read per probe step (the probe overlaps chunks so markers can't be split)
+PROBE_CHUNK_SIZE = 64 * 1024
+
+
+class PDFBackend:
+    """Base class for PDF text extraction engines"""
+
+    name = "base"
+    module = None  # import name of the library the backend needs
+
+    @classmethod
+    def available(cls) -> bool:
+        if cls.module is None:
+            return True
+        try:
+            __import__(cls.module)
+            return True
+        except ImportError:
+            return False
+
+    def iter_pages(self, stream: BinaryIO, max_pages: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of each page in order (stream stays owned by the caller)"""
+        raise NotImplementedError
+
+
+class PyPDF2Backend(PDFBackend):
+    """PyPDF2 - pure Python, fast, good enough for most generated CVs"""
+
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def iter_pages(self, stream: BinaryIO, max_pages: Optional[int] = None) -> Iterator[str]:
+        import PyPDF2
+
+        pdf_reader = PyPDF2.PdfReader(stream)
+        for page_number, page in enumerate(pdf_reader.pages):
+            if max_pages and page_number >= max_pages:
+                break
+            yield page.extract_text() or ""
+
+
+class PdfPlumberBackend(PDFBackend):
+    """pdfplumber - slower, better reading order on multi-column layouts"""
+
+    name = "pdfplumber"
+    module = "pdfplumber"
+
+    def iter_pages(self, stream: BinaryIO, max_pages: Optional[int] = None) -> Iterator[str]:
+        import pdfplumber
+
+        with pdfplumber.open(stream) as pdf:
+            for page_number, page in enumerate(pdf.pages):
+                if max_pages and page_number >= max_pages:
+                    break
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    # Drop cached layout objects so memory stays per-page
+                    page.close()
+
+
+BACKENDS: Dict[str, type] = {
+    PyPDF2Backend.name: PyPDF2Backend,
+    PdfPlumberBackend.name: PdfPlumberBackend,
+}
+
+DEFAULT_BACKEND = PyPDF2Backend.name
+
+_instances: Dict[str, PDFBackend] = {}
+
+
+def pdf_backend_name() -> str:
+    """Configured backend name (settings.pdf_backend)"""
+    try:
+        from core.config import settings
+        return (settings.pdf_backend or DEFAULT_BACKEND).lower()
+    except Exception:
+        return DEFAULT_BACKEND
+
+
+def get_pdf_backend(name: Optional[str] = None) -> PDFBackend:
+    """
+    Backend instance by name (configured backend if None)
+
+    Falls back to the default backend if the requested one is unknown or
+    its library isn't installed.
+    """
+    name = (name or pdf_backend_name()).lower()
+    backend_class = BACKENDS.get(name)
+
+    if backend_class is None:
+        logger.warning(f"Unknown PDF backend '{name}', using {DEFAULT_BACKEND}")
+        backend_class = BACKENDS[DEFAULT_BACKEND]
+    elif not backend_class.available():
+        logger.warning(f"PDF backend '{name}' not installed, using {DEFAULT_BACKEND}")
+        backend_class = BACKENDS[DEFAULT_BACKEND]
+
+    if backend_class.name not in _instances:
+        _instances[backend_class.name] = backend_class()
+    return _instances[backend_class.name]
+
+
+def has_text_layer(stream: BinaryIO) -> bool:
+    """
+    Cheap probe: can this PDF contain extractable text?
+
+    Text can only be drawn with a font, so a PDF whose bytes never
+    mention /Font is image-only (typically a scan) and extraction would
+    return nothing. PDFs with compressed object streams (/ObjStm) may
+    hide their font dictionaries, so they are always treated as having
+    text. Reads the stream in chunks and rewinds it afterwards.
+    """
+    start = stream.tell()
+    tail = b""
+    try:
+        while True:
+            chunk = stream.read(PROBE_CHUNK_SIZE)
+            if not chunk:
+                return False
+            window = tail + chunk
+            if b"/Font" in window or b"/ObjStm" in window:
+                return True
+            tail = window[-8:]
+    finally:
+        stream.seek(start)
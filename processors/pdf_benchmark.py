@@ -0,0 +1,176 @@
+"""PDF Backend Benchmark - compare extraction engines on a CV corpus
+
+Usage:
+    python -m processors.pdf_benchmark path/to/cvs [--backends pypdf2,pdfplumber]
+                                                   [--reference pdfplumber] [--repeat 3]
+
+For every backend reports throughput, p50/p95 latency per file, failures,
+and quality relative to the reference backend: extracted character ratio,
+token overlap (Jaccard) and agreement of the skills CVParser derives.
+"""
+
+import argparse
+import io
+import os
+import re
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Set
+
+from processors.cv_parser import CVParser
+from processors.pdf_backends import BACKENDS, get_pdf_backend, has_text_layer
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def iter_pdfs(directory: str) -> List[str]:
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def extract(backend_name: str, content: bytes) -> str:
+    """Full-document text with one backend (no probe, no budgets)"""
+    backend = get_pdf_backend(backend_name)
+    return "".join(backend.iter_pages(io.BytesIO(content)))
+
+
+def run_benchmark(paths: List[str], backends: List[str], reference: Optional[str] = None,
+                  repeat: int = 1) -> Dict[str, Dict]:
+    """
+    Benchmark backends over PDF files
+
+    Returns:
+        {backend: {files, failed, total_seconds, files_per_second, p50_ms,
+        p95_ms, char_ratio, token_jaccard, skills_agreement}}; quality
+        fields are None for the reference itself or when no reference runs
+    """
+    corpus = []
+    for path in paths:
+        with open(path, "rb") as f:
+            corpus.append((path, f.read()))
+
+    texts: Dict[str, Dict[str, Optional[str]]] = {}
+    report: Dict[str, Dict] = {}
+
+    for name in backends:
+        latencies = []
+        failed = 0
+        texts[name] = {}
+        for path, content in corpus:
+            best = None
+            text = None
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                try:
+                    text = extract(name, content)
+                except Exception:
+                    text = None
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            if text is None:
+                failed += 1
+            latencies.append(best)
+            texts[name][path] = text
+
+        total = sum(latencies)
+        report[name] = {
+            "files": len(corpus),
+            "failed": failed,
+            "total_seconds": round(total, 4),
+            "files_per_second": round(len(corpus) / total, 2) if total else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "char_ratio": None,
+            "token_jaccard": None,
+            "skills_agreement": None,
+        }
+
+    if reference in texts:
+        for name in backends:
+            if name == reference:
+                continue
+            char_ratios, token_scores, skill_scores = [], [], []
+            for path, _ in corpus:
+                ref_text = texts[reference][path] or ""
+                text = texts[name][path] or ""
+                if ref_text:
+                    char_ratios.append(len(text) / len(ref_text))
+                token_scores.append(jaccard(set(TOKEN_PATTERN.findall(text.lower())),
+                                            set(TOKEN_PATTERN.findall(ref_text.lower()))))
+                skill_scores.append(jaccard(
+                    set(CVParser._extract_structured_data(text).get("skills", [])),
+                    set(CVParser._extract_structured_data(ref_text).get("skills", [])),
+                ))
+            report[name]["char_ratio"] = round(statistics.mean(char_ratios), 3) if char_ratios else None
+            report[name]["token_jaccard"] = round(statistics.mean(token_scores), 3) if token_scores else None
+            report[name]["skills_agreement"] = round(statistics.mean(skill_scores), 3) if skill_scores else None
+
+    return report
+
+
+def format_report(report: Dict[str, Dict], reference: Optional[str]) -> str:
+    columns = ("files", "failed", "files_per_second", "p50_ms", "p95_ms",
+               "char_ratio", "token_jaccard", "skills_agreement")
+    lines = ["backend".ljust(18) + "".join(c.rjust(18) for c in columns)]
+    for name, row in report.items():
+        label = name + (" (ref)" if name == reference else "")
+        cells = ["-" if row[c] is None else str(row[c]) for c in columns]
+        lines.append(label.ljust(18) + "".join(cell.rjust(18) for cell in cells))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends on a CV corpus")
+    parser.add_argument("directory", help="folder of PDF CVs (searched recursively)")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="comma-separated backend names")
+    parser.add_argument("--reference", default="pdfplumber", help="backend used as the quality baseline")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per file (best time is kept)")
+    args = parser.parse_args(argv)
+
+    backends = [b.strip().lower() for b in args.backends.split(",") if b.strip()]
+    unknown = [b for b in backends if b not in BACKENDS]
+    if unknown:
+        print(f"Unknown backend(s): {', '.join(unknown)}; choose from {', '.join(BACKENDS)}", file=sys.stderr)
+        return 2
+    missing = [b for b in backends if not BACKENDS[b].available()]
+    if missing:
+        print(f"Not installed, skipping: {', '.join(missing)}", file=sys.stderr)
+        backends = [b for b in backends if b not in missing]
+
+    paths = iter_pdfs(args.directory)
+    if not paths or not backends:
+        print("Nothing to benchmark", file=sys.stderr)
+        return 1
+
+    reference = args.reference.lower() if args.reference.lower() in backends else None
+    report = run_benchmark(paths, backends, reference=reference, repeat=args.repeat)
+    no_text = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            no_text += not has_text_layer(f)
+    print(f"{len(paths)} PDF files, {no_text} without a text layer (skipped by the probe in production)\n")
+    print(format_report(report, reference))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,182 @@
 """Enhanced AI Matcher - Better prompts and fallback analysis"""
 
 import os
+import asyncio
+import hashlib
+import heapq
 import logging
 import json
-from typing import Dict, List
+import threading
+from typing import Callable, Dict, List, Optional
 import re
 
+from utils.cache import LRUCache
+from utils.event_loop import run_sync
+from utils.stage_graph import StageGraph
+from processors.candidate import as_dict
+from processors.compiled_profile import CompiledCompanyProfile
+from processors.dedup import DEFAULT_THRESHOLD as DEFAULT_DEDUP_THRESHOLD, candidate_signature, dedup_candidates, similarity
+
 logger = logging.getLogger(__name__)
 
+# Max candidates analyzed at once by amatch_candidates (bounds in-flight LLM calls)
+DEFAULT_MAX_CONCURRENCY = 8
+
+# "multi": one LLM call per stage (skills, soft skills, culture, feedback)
+# "fused": a single structured request returning all four sections
+ANALYSIS_MODES = ("multi", "fused")
+
+# Role title words that imply leadership soft skills
+LEADERSHIP_ROLE_WORDS = ("manager", "lead", "director", "head")
+
+FUSED_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "skills": {
+            "type": "object",
+            "properties": {
+                "matched_skills": {"type": "array", "items": {"type": "string"}},
+                "missing_skills": {"type": "array", "items": {"type": "string"}},
+                "strengths": {"type": "array", "items": {"type": "string"}},
+                "proficiency_level": {"type": "string", "enum": ["junior", "mid", "senior"]}
+            }
+        },
+        "soft_skills": {
+            "type": "object",
+            "properties": {
+                "identified_soft_skills": {"type": "array", "items": {"type": "string"}},
+                "leadership_level": {"type": "string", "enum": ["none", "junior", "mid", "senior"]},
+                "communication_score": {"type": "integer", "minimum": 1, "maximum": 100},
+                "collaboration_score": {"type": "integer", "minimum": 1, "maximum": 100},
+                "adaptability_score": {"type": "integer", "minimum": 1, "maximum": 100},
+                "strengths": {"type": "array", "items": {"type": "string"}},
+                "gaps": {"type": "array", "items": {"type": "string"}}
+            }
+        },
+        "culture": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "integer", "minimum": 0, "maximum": 100},
+                "aligned_values": {"type": "array", "items": {"type": "string"}},
+                "misaligned_values": {"type": "array", "items": {"type": "string"}},
+                "assessment": {"type": "string"}
+            }
+        },
+        "feedback": {"type": "string"}
+    },
+    "required": ["skills", "soft_skills", "culture", "feedback"]
+}
+
+
+# Feedback generated on demand, shared across matchers: (profile, candidate, method) -> text
+_feedback_memo = LRUCache(max_entries=4096)
+# CV fields feedback letters use besides the analysis details
+FEEDBACK_SOURCE_FIELDS = ("name", "years_experience")
+
+# on_result(position, analysis, expected) progress callback of amatch_candidates
+ResultCallback = Callable[[int, Dict, int], None]
+
+
+def _fingerprint(data: Dict) -> str:
+    """Stable content hash of a JSON-like dict"""
+    payload = json.dumps(as_dict(data), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MatchResult(dict):
+    """
+    Candidate result dict with deferred feedback
+    
+    "feedback" is produced by feedback_loader the first time it is read
+    (result["feedback"], .get, .items/.values, dict(result), json.dumps,
+    to_dict) and then stored, so ranking doesn't pay for letters nobody
+    opens. Until then the key is kept out of the dict storage, so raw
+    copies (dict.items, repr, ==) simply lack it. feedback_source holds the
+    CV fields the letter needs besides the result itself, so it can be
+    regenerated later (EnhancedMatcher.feedback_for).
+    """
+    
+    def __init__(self, data: Dict, feedback_loader: Optional[Callable[[], str]] = None,
+                 feedback_source: Optional[Dict] = None):
+        super().__init__(data)
+        self.feedback_source = feedback_source
+        self._feedback_loader = feedback_loader
+        self._feedback_lock = threading.Lock()
+        if feedback_loader is not None:
+            dict.pop(self, "feedback", None)
+    
+    @property
+    def feedback_ready(self) -> bool:
+        return self._feedback_loader is None
+    
+    def resolve_feedback(self) -> str:
+        """Generate the feedback now if it hasn't been yet"""
+        if self._feedback_loader is not None:
+            with self._feedback_lock:
+                loader = self._feedback_loader
+                if loader is not None:
+                    dict.__setitem__(self, "feedback", loader())
+                    self._feedback_loader = None
+        return dict.get(self, "feedback")
+    
+    def __getitem__(self, key):
+        if key == "feedback":
+            return self.resolve_feedback()
+        return super().__getitem__(key)
+    
+    def __setitem__(self, key, value):
+        if key == "feedback":
+            self._feedback_loader = None
+        super().__setitem__(key, value)
+    
+    def get(self, key, default=None):
+        if key == "feedback" and key in self:
+            return self.resolve_feedback()
+        return super().get(key, default)
+    
+    def __contains__(self, key) -> bool:
+        return super().__contains__(key) or (key == "feedback" and not self.feedback_ready)
+    
+    def __iter__(self):
+        # Also disables CPython's dict-copy fast path, so dict(result) and
+        # {**result} go through keys() / __getitem__ and resolve feedback
+        keys = list(super().__iter__())
+        if not self.feedback_ready and "feedback" not in keys:
+            keys.append("feedback")
+        return iter(keys)
+    
+    def keys(self):
+        return list(self)
+    
+    def __len__(self) -> int:
+        return super().__len__() + (0 if self.feedback_ready else 1)
+    
+    def items(self):
+        self.resolve_feedback()
+        return super().items()
+    
+    def values(self):
+        self.resolve_feedback()
+        return super().values()
+    
+    def copy(self) -> Dict:
+        return self.to_dict()
+    
+    def to_dict(self) -> Dict:
+        """Plain dict with feedback resolved"""
+        return dict(self.items())
+    
+    def __reduce__(self):
+        return (dict, (self.to_dict(),))
+
 
-def get_llm_instance(provider="mistral"):
-    """Get LLM instance directly"""
+def get_llm_instance(provider: Optional[str] = None):
+    """Get LLM instance directly (provider defaults to settings.llm_provider)"""
     try:
         from core.llm_provider import get_llm
+        if provider is None:
+            from core.config import settings
+            provider = settings.llm_provider
         api_key = os.getenv(f"{provider.upper()}_API_KEY")
         return get_llm(provider, api_key)
     except Exception as e:
@@ -23,74 +187,302 @@ def get_llm_instance(provider="mistral"):
 class EnhancedMatcher:
     """Enhanced AI matcher with detailed analysis"""
     
-    def __init__(self, company_profile: Dict):
+    def __init__(self, company_profile: Dict, analysis_mode: str = "multi", lazy_feedback: bool = True,
+                 llm_provider: Optional[str] = None):
+        if analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(f"Unknown analysis mode: {analysis_mode}")
+        
         self.company_profile = company_profile
-        self.llm = get_llm_instance()
+        self.compiled_profile = CompiledCompanyProfile(company_profile)
+        self.analysis_mode = analysis_mode
+        self.lazy_feedback = lazy_feedback
+        self._profile_fingerprint = _fingerprint(company_profile)
+        self.llm = get_llm_instance(llm_provider)
     
     def analyze_candidate(self, cv_data: Dict) -> Dict:
         """Analyze candidate with detailed AI analysis"""
         
         if self.llm:
             # Try AI analysis first
-            ai_analysis = self._ai_analysis(cv_data)
+            if self.analysis_mode == "fused":
+                ai_analysis = self._ai_fused_analysis(cv_data)
+            else:
+                ai_analysis = self._ai_analysis(cv_data)
             if ai_analysis:
                 return ai_analysis
         
         # Fallback to enhanced manual analysis
         return self._enhanced_manual_analysis(cv_data)
     
+    async def aanalyze_candidate(self, cv_data: Dict) -> Dict:
+        """Async version of analyze_candidate using the provider's async API"""
+        
+        if self.llm:
+            if self.analysis_mode == "fused":
+                ai_analysis = await self._ai_fused_analysis_async(cv_data)
+            else:
+                ai_analysis = await self._ai_analysis_async(cv_data)
+            if ai_analysis:
+                return ai_analysis
+        
+        return self._enhanced_manual_analysis(cv_data)
+    
     def _ai_analysis(self, cv_data: Dict) -> Dict:
-        """Try to get AI analysis"""
+        """Try to get AI analysis
+        
+        Skills, soft skills and culture fit are independent and run
+        concurrently; feedback runs once all three are available.
+        """
         try:
-            # Step 1: Extract and analyze skills
-            skills_analysis = self._ai_analyze_skills(cv_data)
+            results = self._analysis_graph(cv_data, include_feedback=not self.lazy_feedback).run()
             
-            # Step 2: Analyze soft skills
-            soft_skills_analysis = self._ai_analyze_soft_skills(cv_data)
+            result = self._build_ai_result(
+                cv_data,
+                results["skills"],
+                results["soft_skills"],
+                results["culture"],
+                results.get("feedback")
+            )
+            
+            if self.lazy_feedback:
+                return self._defer_feedback(result, cv_data, lambda: self._ai_generate_feedback(
+                    cv_data, results["skills"], results["soft_skills"], results["culture"]
+                ))
+            return result
             
-            # Step 3: Culture fit
-            culture_analysis = self._ai_analyze_culture_fit(cv_data)
+        except Exception as e:
+            logger.error(f"AI analysis failed: {e}")
+            return None
+    
+    async def _ai_analysis_async(self, cv_data: Dict) -> Dict:
+        """Async version of _ai_analysis"""
+        try:
+            results = await self._analysis_graph(cv_data, asynchronous=True, include_feedback=not self.lazy_feedback).arun()
             
-            # Step 4: Generate comprehensive feedback
-            feedback = self._ai_generate_feedback(
-                cv_data, 
-                skills_analysis, 
-                soft_skills_analysis, 
-                culture_analysis
+            result = self._build_ai_result(
+                cv_data,
+                results["skills"],
+                results["soft_skills"],
+                results["culture"],
+                results.get("feedback")
             )
             
-            # Calculate scores
-            technical_score = min(100, 50 + len(cv_data.get("skills", [])) * 8)
-            culture_score = culture_analysis.get("score", 65)
-            cv_quality = self._calculate_cv_quality(cv_data)
-            overall_score = int((technical_score * 0.35 + culture_score * 0.30 + cv_quality * 0.35))
-            
-            return {
-                "overall_score": overall_score,
-                "technical_score": technical_score,
-                "culture_score": culture_score,
-                "cv_quality_score": cv_quality,
-                "strengths": skills_analysis.get("strengths", []) + soft_skills_analysis.get("strengths", []),
-                "improvements": soft_skills_analysis.get("gaps", []),
-                "feedback": feedback,
-                "ranking": self._get_ranking(overall_score),
-                "method": "ai",
-                "skills_detail": skills_analysis,
-                "soft_skills_detail": soft_skills_analysis,
-                "culture_detail": culture_analysis
-            }
+            if self.lazy_feedback:
+                return self._defer_feedback(result, cv_data, lambda: self._ai_generate_feedback(
+                    cv_data, results["skills"], results["soft_skills"], results["culture"]
+                ))
+            return result
             
         except Exception as e:
             logger.error(f"AI analysis failed: {e}")
             return None
     
+    def _analysis_graph(self, cv_data: Dict, asynchronous: bool = False,
+                        include_feedback: bool = True) -> StageGraph:
+        """Stage graph for the multi-call analysis of one candidate
+        
+        Every stage falls back to its manual counterpart if it fails.
+        Without include_feedback the graph stops after the three analyses.
+        """
+        
+        def manual_feedback(skills, soft_skills, culture):
+            return self._generate_manual_feedback(cv_data, skills, soft_skills, culture)
+        
+        if asynchronous:
+            async def skills():
+                return await self._ai_analyze_skills_async(cv_data)
+            
+            async def soft_skills():
+                return await self._ai_analyze_soft_skills_async(cv_data)
+            
+            async def culture():
+                return await self._ai_analyze_culture_fit_async(cv_data)
+            
+            async def feedback(skills, soft_skills, culture):
+                return await self._ai_generate_feedback_async(cv_data, skills, soft_skills, culture)
+        else:
+            def skills():
+                return self._ai_analyze_skills(cv_data)
+            
+            def soft_skills():
+                return self._ai_analyze_soft_skills(cv_data)
+            
+            def culture():
+                return self._ai_analyze_culture_fit(cv_data)
+            
+            def feedback(skills, soft_skills, culture):
+                return self._ai_generate_feedback(cv_data, skills, soft_skills, culture)
+        
+        graph = (
+            StageGraph()
+            .add("skills", skills, fallback=lambda: self._manual_skills_analysis(cv_data))
+            .add("soft_skills", soft_skills, fallback=lambda: self._manual_soft_skills_analysis(cv_data))
+            .add("culture", culture, fallback=lambda: self._manual_culture_analysis(cv_data))
+        )
+        if include_feedback:
+            graph.add("feedback", feedback, depends_on=("skills", "soft_skills", "culture"), fallback=manual_feedback)
+        return graph
+    
+    def _defer_feedback(self, result: Dict, cv_data: Dict, generate: Callable[[], str]) -> "MatchResult":
+        """Wrap a result so its feedback is generated on first read
+        
+        Generated feedback is memoized per (company profile, candidate,
+        method), so reruns and repeated reads don't regenerate it.
+        """
+        method = result.get("method", "")
+        
+        def load() -> str:
+            key = f"{self._profile_fingerprint}:{_fingerprint(cv_data)}:{method}"
+            feedback = _feedback_memo.get(key)
+            if feedback is None:
+                feedback = generate()
+                _feedback_memo.set(key, feedback)
+            return feedback
+        
+        source = {field: cv_data[field] for field in FEEDBACK_SOURCE_FIELDS if field in cv_data}
+        return MatchResult(result, feedback_loader=load, feedback_source=source)
+    
+    def feedback_for(self, result: Dict, cv_data: Dict) -> str:
+        """Feedback letter for a finished result, rebuilt from its *_detail analyses
+        
+        cv_data only needs FEEDBACK_SOURCE_FIELDS (e.g. MatchResult.feedback_source).
+        """
+        details = (result.get("skills_detail") or {}, result.get("soft_skills_detail") or {},
+                   result.get("culture_detail") or {})
+        if result.get("method") == "ai" and self.llm:
+            return self._ai_generate_feedback(cv_data, *details)
+        return self._generate_manual_feedback(cv_data, *details)
+    
+    def _ai_fused_analysis(self, cv_data: Dict) -> Dict:
+        """AI analysis of all stages in a single structured request"""
+        try:
+            response = self.llm.extract_json(self._fused_prompt(cv_data), FUSED_ANALYSIS_SCHEMA)
+            return self._parse_fused_response(cv_data, response)
+        except Exception as e:
+            logger.error(f"Fused AI analysis failed: {e}")
+            return None
+    
+    async def _ai_fused_analysis_async(self, cv_data: Dict) -> Dict:
+        """Async version of _ai_fused_analysis"""
+        try:
+            response = await self.llm.aextract_json(self._fused_prompt(cv_data), FUSED_ANALYSIS_SCHEMA)
+            return self._parse_fused_response(cv_data, response)
+        except Exception as e:
+            logger.error(f"Fused AI analysis failed: {e}")
+            return None
+    
+    def _fused_prompt(self, cv_data: Dict) -> str:
+        """Build the single-shot prompt covering skills, soft skills, culture and feedback"""
+        experience_text = "\n".join([e.get("description", "") for e in cv_data.get("experience", [])])
+        
+        return f"""Analyze this candidate against the company profile.
+
+Candidate:
+- Name: {cv_data.get('name', 'N/A')}
+- Role: {cv_data.get('current_role', 'N/A')}
+- Years exp: {cv_data.get('years_experience', 0)}
+- Skills: {', '.join(cv_data.get('skills', []))}
+- Soft skills: {', '.join(cv_data.get('soft_skills', []))}
+
+Experience:
+{experience_text}
+
+Company:
+- Mission: {self.company_profile.get('mission', 'N/A')}
+- Values: {', '.join(self.company_profile.get('values', []))}
+- Focus skills: {', '.join(self.company_profile.get('focus_skills', []))}
+
+Provide JSON with:
+- skills: matched_skills (skills that match company needs), missing_skills (important skills missing),
+  strengths (3 technical strengths), proficiency_level (junior/mid/senior)
+- soft_skills: identified_soft_skills, leadership_level (none/junior/mid/senior),
+  communication_score, collaboration_score, adaptability_score (1-100 each),
+  strengths (3 soft skill strengths), gaps (2 areas to develop)
+- culture: score (0-100 culture fit), aligned_values, misaligned_values, assessment (brief)
+- feedback: personalized, encouraging feedback (150 words) that celebrates their strengths,
+  explains why they're a good fit and gives 2-3 specific improvements. Professional but warm.
+
+Return ONLY JSON."""
+    
+    def _parse_fused_response(self, cv_data: Dict, response: Dict) -> Dict:
+        """Map the fused JSON response onto the standard result dict
+        
+        Sections missing from the response fall back individually, like
+        the multi-call stages do.
+        """
+        if not response:
+            return None
+        
+        skills = response.get("skills")
+        soft_skills = response.get("soft_skills")
+        culture = response.get("culture")
+        
+        skills_analysis = self._parse_skills_response(skills) if skills else self._manual_skills_analysis(cv_data)
+        soft_skills_analysis = self._parse_soft_skills_response(soft_skills) if soft_skills else self._manual_soft_skills_analysis(cv_data)
+        culture_analysis = self._parse_culture_response(culture) if culture else {"score": 65, "aligned": [], "misaligned": [], "assessment": ""}
+        
+        feedback = response.get("feedback")
+        if not feedback:
+            feedback = self._generate_manual_feedback(cv_data, skills_analysis, soft_skills_analysis, culture_analysis)
+        
+        return self._build_ai_result(cv_data, skills_analysis, soft_skills_analysis, culture_analysis, feedback,
+                                     method="ai_fused")
+    
+    def _build_ai_result(self, cv_data: Dict, skills_analysis: Dict, soft_skills_analysis: Dict,
+                         culture_analysis: Dict, feedback: str, method: str = "ai") -> Dict:
+        """Combine AI stage outputs into the candidate result"""
+        
+        # Calculate scores
+        technical_score = min(100, 50 + len(cv_data.get("skills", [])) * 8)
+        culture_score = culture_analysis.get("score", 65)
+        cv_quality = self._calculate_cv_quality(cv_data)
+        overall_score = int((technical_score * 0.35 + culture_score * 0.30 + cv_quality * 0.35))
+        
+        return {
+            "overall_score": overall_score,
+            "technical_score": technical_score,
+            "culture_score": culture_score,
+            "cv_quality_score": cv_quality,
+            "strengths": skills_analysis.get("strengths", []) + soft_skills_analysis.get("strengths", []),
+            "improvements": soft_skills_analysis.get("gaps", []),
+            "feedback": feedback,
+            "ranking": self._get_ranking(overall_score),
+            "method": method,
+            "skills_detail": skills_analysis,
+            "soft_skills_detail": soft_skills_analysis,
+            "culture_detail": culture_analysis
+        }
+    
     def _ai_analyze_skills(self, cv_data: Dict) -> Dict:
         """Analyze technical skills with AI"""
         try:
-            skills_list = cv_data.get("skills", [])
-            experience_text = "\n".join([e.get("description", "") for e in cv_data.get("experience", [])])
+            response = self.llm.extract_json(self._skills_prompt(cv_data))
             
-            prompt = f"""Analyze the technical skills of this candidate:
+            if response:
+                return self._parse_skills_response(response)
+        except Exception as e:
+            logger.error(f"Skills analysis error: {e}")
+        
+        return self._manual_skills_analysis(cv_data)
+    
+    async def _ai_analyze_skills_async(self, cv_data: Dict) -> Dict:
+        """Async version of _ai_analyze_skills"""
+        try:
+            response = await self.llm.aextract_json(self._skills_prompt(cv_data))
+            
+            if response:
+                return self._parse_skills_response(response)
+        except Exception as e:
+            logger.error(f"Skills analysis error: {e}")
+        
+        return self._manual_skills_analysis(cv_data)
+    
+    def _skills_prompt(self, cv_data: Dict) -> str:
+        """Build the technical skills prompt"""
+        skills_list = cv_data.get("skills", [])
+        experience_text = "\n".join([e.get("description", "") for e in cv_data.get("experience", [])])
+        
+        return f"""Analyze the technical skills of this candidate:
 
 Skills: {', '.join(skills_list)}
 
@@ -106,30 +498,48 @@ Provide JSON with:
 - proficiency_level: junior/mid/senior
 
 Return ONLY JSON."""
-            
-            response = self.llm.extract_json(prompt)
+    
+    def _parse_skills_response(self, response: Dict) -> Dict:
+        """Map the skills JSON response onto the skills detail"""
+        return {
+            "matched_skills": response.get("matched_skills", []),
+            "missing_skills": response.get("missing_skills", []),
+            "strengths": response.get("strengths", []),
+            "proficiency": response.get("proficiency_level", "mid")
+        }
+    
+    def _ai_analyze_soft_skills(self, cv_data: Dict) -> Dict:
+        """Analyze soft skills with AI"""
+        try:
+            response = self.llm.extract_json(self._soft_skills_prompt(cv_data))
             
             if response:
-                return {
-                    "matched_skills": response.get("matched_skills", []),
-                    "missing_skills": response.get("missing_skills", []),
-                    "strengths": response.get("strengths", []),
-                    "proficiency": response.get("proficiency_level", "mid")
-                }
+                return self._parse_soft_skills_response(response)
         except Exception as e:
-            logger.error(f"Skills analysis error: {e}")
+            logger.error(f"Soft skills analysis error: {e}")
         
-        return self._manual_skills_analysis(cv_data)
+        return self._manual_soft_skills_analysis(cv_data)
     
-    def _ai_analyze_soft_skills(self, cv_data: Dict) -> Dict:
-        """Analyze soft skills with AI"""
+    async def _ai_analyze_soft_skills_async(self, cv_data: Dict) -> Dict:
+        """Async version of _ai_analyze_soft_skills"""
         try:
-            soft_skills = cv_data.get("soft_skills", [])
-            experience_text = "\n".join([e.get("description", "") for e in cv_data.get("experience", [])])
-            role = cv_data.get("current_role", "")
-            years = cv_data.get("years_experience", 0)
+            response = await self.llm.aextract_json(self._soft_skills_prompt(cv_data))
             
-            prompt = f"""Analyze the soft skills of this candidate:
+            if response:
+                return self._parse_soft_skills_response(response)
+        except Exception as e:
+            logger.error(f"Soft skills analysis error: {e}")
+        
+        return self._manual_soft_skills_analysis(cv_data)
+    
+    def _soft_skills_prompt(self, cv_data: Dict) -> str:
+        """Build the soft skills prompt"""
+        soft_skills = cv_data.get("soft_skills", [])
+        experience_text = "\n".join([e.get("description", "") for e in cv_data.get("experience", [])])
+        role = cv_data.get("current_role", "")
+        years = cv_data.get("years_experience", 0)
+        
+        return f"""Analyze the soft skills of this candidate:
 
 Current soft skills: {', '.join(soft_skills)}
 Current role: {role}
@@ -150,28 +560,46 @@ Provide JSON with:
 - gaps: list of 2 areas to develop
 
 Return ONLY JSON."""
-            
-            response = self.llm.extract_json(prompt)
+    
+    def _parse_soft_skills_response(self, response: Dict) -> Dict:
+        """Map the soft skills JSON response onto the soft skills detail"""
+        return {
+            "identified_skills": response.get("identified_soft_skills", []),
+            "leadership": response.get("leadership_level", "junior"),
+            "communication": response.get("communication_score", 65),
+            "collaboration": response.get("collaboration_score", 65),
+            "adaptability": response.get("adaptability_score", 65),
+            "strengths": response.get("strengths", []),
+            "gaps": response.get("gaps", [])
+        }
+    
+    def _ai_analyze_culture_fit(self, cv_data: Dict) -> Dict:
+        """Analyze culture fit with AI"""
+        try:
+            response = self.llm.extract_json(self._culture_prompt(cv_data))
             
             if response:
-                return {
-                    "identified_skills": response.get("identified_soft_skills", []),
-                    "leadership": response.get("leadership_level", "junior"),
-                    "communication": response.get("communication_score", 65),
-                    "collaboration": response.get("collaboration_score", 65),
-                    "adaptability": response.get("adaptability_score", 65),
-                    "strengths": response.get("strengths", []),
-                    "gaps": response.get("gaps", [])
-                }
+                return self._parse_culture_response(response)
         except Exception as e:
-            logger.error(f"Soft skills analysis error: {e}")
+            logger.error(f"Culture analysis error: {e}")
         
-        return self._manual_soft_skills_analysis(cv_data)
+        return {"score": 65, "aligned": [], "misaligned": [], "assessment": ""}
     
-    def _ai_analyze_culture_fit(self, cv_data: Dict) -> Dict:
-        """Analyze culture fit with AI"""
+    async def _ai_analyze_culture_fit_async(self, cv_data: Dict) -> Dict:
+        """Async version of _ai_analyze_culture_fit"""
         try:
-            prompt = f"""Analyze culture fit:
+            response = await self.llm.aextract_json(self._culture_prompt(cv_data))
+            
+            if response:
+                return self._parse_culture_response(response)
+        except Exception as e:
+            logger.error(f"Culture analysis error: {e}")
+        
+        return {"score": 65, "aligned": [], "misaligned": [], "assessment": ""}
+    
+    def _culture_prompt(self, cv_data: Dict) -> str:
+        """Build the culture fit prompt"""
+        return f"""Analyze culture fit:
 
 Candidate:
 - Name: {cv_data.get('name', 'N/A')}
@@ -190,25 +618,41 @@ Provide JSON with:
 - assessment: brief assessment
 
 Return ONLY JSON."""
-            
-            response = self.llm.extract_json(prompt)
-            
-            if response:
-                return {
-                    "score": response.get("score", 65),
-                    "aligned": response.get("aligned_values", []),
-                    "misaligned": response.get("misaligned_values", []),
-                    "assessment": response.get("assessment", "")
-                }
-        except Exception as e:
-            logger.error(f"Culture analysis error: {e}")
-        
-        return {"score": 65, "aligned": [], "misaligned": [], "assessment": ""}
+    
+    def _parse_culture_response(self, response: Dict) -> Dict:
+        """Map the culture JSON response onto the culture detail"""
+        return {
+            "score": response.get("score", 65),
+            "aligned": response.get("aligned_values", []),
+            "misaligned": response.get("misaligned_values", []),
+            "assessment": response.get("assessment", "")
+        }
     
     def _ai_generate_feedback(self, cv_data: Dict, skills: Dict, soft_skills: Dict, culture: Dict) -> str:
         """Generate comprehensive AI feedback"""
         try:
-            prompt = f"""Generate detailed, actionable feedback for this candidate:
+            feedback = self.llm.generate_text(self._feedback_prompt(cv_data, skills, soft_skills, culture))
+            if feedback:
+                return feedback
+        except Exception as e:
+            logger.error(f"Feedback generation error: {e}")
+        
+        return self._generate_manual_feedback(cv_data, skills, soft_skills, culture)
+    
+    async def _ai_generate_feedback_async(self, cv_data: Dict, skills: Dict, soft_skills: Dict, culture: Dict) -> str:
+        """Async version of _ai_generate_feedback"""
+        try:
+            feedback = await self.llm.agenerate_text(self._feedback_prompt(cv_data, skills, soft_skills, culture))
+            if feedback:
+                return feedback
+        except Exception as e:
+            logger.error(f"Feedback generation error: {e}")
+        
+        return self._generate_manual_feedback(cv_data, skills, soft_skills, culture)
+    
+    def _feedback_prompt(self, cv_data: Dict, skills: Dict, soft_skills: Dict, culture: Dict) -> str:
+        """Build the feedback prompt"""
+        return f"""Generate detailed, actionable feedback for this candidate:
 
 Name: {cv_data.get('name', 'N/A')}
 Years exp: {cv_data.get('years_experience', 0)}
@@ -227,14 +671,6 @@ Write personalized, encouraging feedback (150 words) that:
 3. Gives 2-3 specific improvements
 
 Be professional but warm."""
-            
-            feedback = self.llm.generate_text(prompt)
-            if feedback:
-                return feedback
-        except Exception as e:
-            logger.error(f"Feedback generation error: {e}")
-        
-        return self._generate_manual_feedback(cv_data, skills, soft_skills, culture)
     
     def _enhanced_manual_analysis(self, cv_data: Dict) -> Dict:
         """Enhanced manual analysis when AI fails"""
@@ -248,9 +684,12 @@ Be professional but warm."""
         cv_quality = self._calculate_cv_quality(cv_data)
         overall_score = int((technical_score * 0.35 + culture_score * 0.30 + cv_quality * 0.35))
         
-        feedback = self._generate_manual_feedback(cv_data, skills_analysis, soft_skills_analysis, culture_analysis)
+        if self.lazy_feedback:
+            feedback = None
+        else:
+            feedback = self._generate_manual_feedback(cv_data, skills_analysis, soft_skills_analysis, culture_analysis)
         
-        return {
+        result = {
             "overall_score": overall_score,
             "technical_score": technical_score,
             "culture_score": culture_score,
@@ -264,14 +703,21 @@ Be professional but warm."""
             "soft_skills_detail": soft_skills_analysis,
             "culture_detail": culture_analysis
         }
+        
+        if self.lazy_feedback:
+            return self._defer_feedback(result, cv_data, lambda: self._generate_manual_feedback(
+                cv_data, skills_analysis, soft_skills_analysis, culture_analysis
+            ))
+        return result
     
     def _manual_skills_analysis(self, cv_data: Dict) -> Dict:
         """Manual technical skills analysis"""
         skills = cv_data.get("skills", [])
-        focus_skills = self.company_profile.get("focus_skills", [])
+        profile = self.compiled_profile
         
-        matched = [s for s in skills if s.lower() in [f.lower() for f in focus_skills]]
-        missing = [f for f in focus_skills if f.lower() not in [s.lower() for s in skills]]
+        skills_lower = {s.lower() for s in skills}
+        matched = [s for s in skills if s.lower() in profile.focus_skills_lower]
+        missing = [f for f, f_lower in profile.focus_skill_pairs if f_lower not in skills_lower]
         
         years = cv_data.get("years_experience", 0)
         proficiency = "senior" if years > 5 else "mid" if years > 2 else "junior"
@@ -299,30 +745,33 @@ Be professional but warm."""
         
         # Infer soft skills from role and experience
         inferred = []
-        if any(word in role for word in ["manager", "lead", "director", "head"]):
+        if any(word in role for word in LEADERSHIP_ROLE_WORDS):
             inferred.extend(["Leadership", "Decision-making"])
         if years > 3:
             inferred.extend(["Mentoring", "Strategic thinking"])
         
         all_soft_skills = set(soft_skills + inferred)
         
-        communication_score = 60 + (10 if len(soft_skills) > 0 else 0) + (10 if "communication" in [s.lower() for s in soft_skills] else 0)
-        collaboration_score = 60 + (10 if "collaboration" in [s.lower() for s in soft_skills] else 0)
-        adaptability_score = 60 + (10 if "adaptability" in [s.lower() for s in soft_skills] else 0)
+        soft_skills_lower = {s.lower() for s in soft_skills}
+        all_soft_skills_lower = {s.lower() for s in all_soft_skills}
+        
+        communication_score = 60 + (10 if len(soft_skills) > 0 else 0) + (10 if "communication" in soft_skills_lower else 0)
+        collaboration_score = 60 + (10 if "collaboration" in soft_skills_lower else 0)
+        adaptability_score = 60 + (10 if "adaptability" in soft_skills_lower else 0)
         
         strengths = []
-        if "leadership" in [s.lower() for s in all_soft_skills]:
+        if "leadership" in all_soft_skills_lower:
             strengths.append("Demonstrated leadership capabilities")
         if len(all_soft_skills) > 3:
             strengths.append("Well-rounded interpersonal skills")
         if years > 5:
             strengths.append("Seasoned professional with proven track record")
         
-        gaps = []
-        company_values = self.company_profile.get("values", [])
-        for value in company_values:
-            if value.lower() not in [s.lower() for s in all_soft_skills]:
-                gaps.append(f"Could demonstrate more {value}")
+        gaps = [
+            f"Could demonstrate more {value}"
+            for value, value_lower in self.compiled_profile.value_pairs
+            if value_lower not in all_soft_skills_lower
+        ]
         
         return {
             "identified_skills": list(all_soft_skills),
@@ -336,11 +785,15 @@ Be professional but warm."""
     
     def _manual_culture_analysis(self, cv_data: Dict) -> Dict:
         """Manual culture fit analysis"""
-        soft_skills = set([s.lower() for s in cv_data.get("soft_skills", [])])
-        company_values = [v.lower() for v in self.company_profile.get("values", [])]
+        soft_skills = {s.lower() for s in cv_data.get("soft_skills", [])}
         
-        aligned = [v for v in company_values if any(v_part in soft_skills for v_part in v.split())]
-        misaligned = [v for v in company_values if not any(v_part in soft_skills for v_part in v.split())]
+        aligned = []
+        misaligned = []
+        for value, tokens in self.compiled_profile.value_token_pairs:
+            if tokens.isdisjoint(soft_skills):
+                misaligned.append(value)
+            else:
+                aligned.append(value)
         
         score = 60 + (len(aligned) * 10)
         
@@ -378,8 +831,8 @@ Key strengths: {', '.join(soft_skills.get('strengths', [])[:2])}
 {chr(10).join(['• ' + s for s in soft_skills.get('gaps', [])[:2]])}
 
 **RECOMMENDATIONS:**
-1. Enhance {soft_skills.get('gaps', ['collaboration'])[0].lower()} through additional projects
-2. Build skills in {', '.join(skills.get('missing_skills', ['cloud technology'])[:1]).lower()}
+1. Enhance {(soft_skills.get('gaps') or ['collaboration'])[0].lower()} through additional projects
+2. Build skills in {', '.join((skills.get('missing_skills') or ['cloud technology'])[:1]).lower()}
 3. Consider mentorship roles to strengthen leadership
 
 You have solid potential for this role. We'd like to move forward with the next steps.
@@ -422,16 +875,198 @@ Inter-Sight Team"""
             return "🔴 Not Recommended"
 
 
-def match_candidates(company_profile: Dict, candidates: List[Dict]) -> List[Dict]:
-    """Match all candidates"""
+def match_candidates(company_profile: Dict, candidates: List[Dict],
+                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                     analysis_mode: str = "multi",
+                     shortlist_size: Optional[int] = None,
+                     shortlist_min_score: Optional[float] = None,
+                     lazy_feedback: bool = True,
+                     dedup: bool = False,
+                     dedup_threshold: float = DEFAULT_DEDUP_THRESHOLD,
+                     on_result: Optional[ResultCallback] = None,
+                     llm_provider: Optional[str] = None) -> List[Dict]:
+    """Match all candidates
+    
+    Blocking wrapper around amatch_candidates for callers without an
+    event loop (Streamlit scripts, CLI). The match runs on the shared
+    background loop, so async LLM clients are reused across calls. Called
+    from inside a running loop (notebooks, async apps) it blocks that
+    loop until done - async code should await amatch_candidates.
+    """
+    try:
+        asyncio.get_running_loop()
+        logger.warning("match_candidates called inside a running event loop; use amatch_candidates there")
+    except RuntimeError:
+        pass
+    
+    return run_sync(amatch_candidates(
+        company_profile,
+        candidates,
+        max_concurrency,
+        analysis_mode,
+        shortlist_size,
+        shortlist_min_score,
+        lazy_feedback,
+        dedup,
+        dedup_threshold,
+        on_result,
+        llm_provider=llm_provider
+    ))
+
+
+async def amatch_candidates(company_profile: Dict, candidates: List[Dict],
+                            max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                            analysis_mode: str = "multi",
+                            shortlist_size: Optional[int] = None,
+                            shortlist_min_score: Optional[float] = None,
+                            lazy_feedback: bool = True,
+                            dedup: bool = False,
+                            dedup_threshold: float = DEFAULT_DEDUP_THRESHOLD,
+                            on_result: Optional[ResultCallback] = None,
+                            semaphore: Optional[asyncio.Semaphore] = None,
+                            llm_provider: Optional[str] = None) -> List[Dict]:
+    """Match all candidates concurrently
     
-    matcher = EnhancedMatcher(company_profile)
-    results = []
+    At most max_concurrency candidates are analyzed at a time, which
+    bounds the number of in-flight LLM requests. Pass a semaphore instead
+    to share one cap between concurrent runs (e.g. per provider).
+    llm_provider overrides settings.llm_provider (e.g. "mock").
     
-    for candidate in candidates:
-        analysis = matcher.analyze_candidate(candidate)
-        analysis["name"] = candidate.get("name", "Unknown")
-        results.append(analysis)
+    Two-stage pipeline: when shortlist_size and/or shortlist_min_score is
+    set, everyone is first scored with the local manual analysis and only
+    the top shortlist_size candidates (at or above shortlist_min_score)
+    go through AI analysis. Shortlisted candidates rank first, followed
+    by the rest in manual-score order; each result carries its "tier".
+    
+    With lazy_feedback (default) results are MatchResult dicts whose
+    feedback letter is generated only when first read.
+    
+    With dedup, near-duplicate CVs (MinHash similarity >= dedup_threshold)
+    are collapsed first: only the earliest CV of each cluster is analyzed
+    and the others are listed under its "duplicates".
+    
+    on_result(position, analysis, expected) is called as each analysis
+    finishes, so callers can show partial rankings. position identifies
+    the analyzed candidate (after dedup); in the two-stage pipeline every
+    screened result is reported first and a shortlisted candidate's AI
+    result then replaces it. expected is the total number of calls.
+    """
+    
+    # Only one representative per near-duplicate cluster is analyzed
+    duplicates_of: Dict[int, List[Dict]] = {}
+    if dedup and len(candidates) > 1:
+        # CPU-bound: off the event loop, which may be serving other work
+        clusters = await asyncio.to_thread(dedup_candidates, candidates, dedup_threshold)
+        if len(clusters) < len(candidates):
+            duplicates_of = {
+                pos: _describe_duplicates(candidates, cluster)
+                for pos, cluster in enumerate(clusters)
+            }
+            candidates = [candidates[cluster[0]] for cluster in clusters]
+    
+    matcher = EnhancedMatcher(company_profile, analysis_mode=analysis_mode, lazy_feedback=lazy_feedback,
+                              llm_provider=llm_provider)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    def annotate(analysis: Dict, idx: int) -> Dict:
+        analysis["name"] = candidates[idx].get("name", "Unknown")
+        if dedup:
+            analysis["duplicates"] = duplicates_of.get(idx, [])
+        return analysis
+    
+    expected = len(candidates)
+    
+    def report(idx: int, analysis: Dict) -> Dict:
+        if on_result is not None:
+            # An exception here aborts the run (e.g. a cancelled job)
+            on_result(idx, analysis, expected)
+        return analysis
+    
+    async def analyze(idx: int) -> Dict:
+        async with semaphore:
+            analysis = await matcher.aanalyze_candidate(candidates[idx])
+        return report(idx, annotate(analysis, idx))
+    
+    if shortlist_size is None and shortlist_min_score is None:
+        results = await asyncio.gather(*(analyze(idx) for idx in range(len(candidates))))
+        return rank_results(list(results))
+    
+    # Stage 1: cheap deterministic scoring for everyone (in a worker thread:
+    # for large batches it is CPU-bound and would stall the event loop)
+    def screen() -> List[Dict]:
+        screened = []
+        for idx, candidate in enumerate(candidates):
+            analysis = annotate(matcher._enhanced_manual_analysis(candidate), idx)
+            analysis["tier"] = "screened"
+            screened.append(analysis)
+        return screened
+    
+    screened = await asyncio.to_thread(screen)
+    
+    shortlist_idx = select_shortlist(
+        [analysis["overall_score"] for analysis in screened],
+        shortlist_size,
+        shortlist_min_score
+    )
+    
+    expected = len(candidates) + len(shortlist_idx)
+    for idx, analysis in enumerate(screened):
+        report(idx, analysis)
+    
+    # Stage 2: LLM analysis for the shortlist only
+    shortlisted = await asyncio.gather(*(analyze(idx) for idx in shortlist_idx))
+    for analysis in shortlisted:
+        analysis["tier"] = "shortlist"
+    
+    shortlist_set = set(shortlist_idx)
+    rest = [analysis for idx, analysis in enumerate(screened) if idx not in shortlist_set]
+    
+    results = rank_results(list(shortlisted)) + rank_results(rest)
+    for idx, result in enumerate(results, 1):
+        result["rank"] = idx
+    
+    return results
+
+
+def _describe_duplicates(candidates: List[Dict], cluster: List[int]) -> List[Dict]:
+    """Duplicates of a cluster's representative (its first index)"""
+    if len(cluster) < 2:
+        return []
+    
+    representative = candidate_signature(candidates[cluster[0]])
+    duplicates = []
+    for idx in cluster[1:]:
+        signature = candidate_signature(candidates[idx])
+        duplicates.append({
+            "name": candidates[idx].get("name", "Unknown"),
+            "index": idx,
+            "similarity": round(similarity(representative, signature), 3)
+        })
+    return duplicates
+
+
+def select_shortlist(scores: List[float], size: Optional[int] = None,
+                     min_score: Optional[float] = None) -> List[int]:
+    """Indices of the best scores, highest first (ties keep input order)
+    
+    Uses a bounded heap, so picking the top K of N costs O(N log K).
+    """
+    eligible = (
+        (score, -idx) for idx, score in enumerate(scores)
+        if min_score is None or score >= min_score
+    )
+    
+    if size is None:
+        top = sorted(eligible, reverse=True)
+    else:
+        top = heapq.nlargest(max(0, size), eligible)
+    
+    return [-neg_idx for _, neg_idx in top]
+
+
+def rank_results(results: List[Dict]) -> List[Dict]:
+    """Sort results by overall score and assign ranks"""
     
     # Sort by overall score
     results = sorted(results, key=lambda x: x.get("overall_score", 0), reverse=True)
@@ -439,4 +1074,4 @@ def match_candidates(company_profile: Dict, candidates: List[Dict]) -> List[Dict
     for idx, result in enumerate(results, 1):
         result["rank"] = idx
     
-    return results
\ No newline at end of file
+    return results
@@ -0,0 +1,180 @@
+"""Streaming Scoring - parse, match and emit CVs one at a time with bounded memory"""
+
+import asyncio
+import heapq
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, List, Optional, TextIO
+
+from processors.bulk_ingest import DEFAULT_TIMEOUT_SECONDS, IngestItem, IngestResult, parse_many
+from processors.simple_matcher import DEFAULT_MAX_CONCURRENCY, EnhancedMatcher
+from utils.event_loop import run_sync
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 10
+
+
+def _record(result: IngestResult, analysis: Dict, include_feedback: bool) -> Dict:
+    """One JSONL line: the source file, who it is, and the analysis"""
+    if include_feedback:
+        # Generated during analysis (lazy_feedback off)
+        data = dict(analysis.items())
+    else:
+        # Unresolved feedback is kept out of the dict storage, so dict.items never generates it
+        data = {key: value for key, value in dict.items(analysis) if key != "feedback"}
+
+    record = {
+        "file": result.name,
+        "ok": True,
+        "name": result.data.get("name", "Unknown"),
+        "email": result.data.get("email", ""),
+    }
+    record.update(data)
+    return record
+
+
+def _error_record(result: IngestResult) -> Dict:
+    return {"file": result.name, "ok": False, "error": result.error}
+
+
+async def astream_scores(company_profile: Dict, items: Iterable[IngestItem],
+                         concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                         analysis_mode: str = "multi",
+                         include_feedback: bool = False,
+                         max_workers: Optional[int] = None,
+                         timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+                         llm_provider: Optional[str] = None) -> AsyncIterator[Dict]:
+    """
+    Score CVs as they are parsed, yielding one record per input
+
+    Parsing runs on the ingest process pool (parse_many) and matching on
+    this event loop, with at most concurrency candidates being analyzed
+    at once. The next file is only pulled from the parser while a match
+    slot is free, so memory stays flat however many CVs there are.
+    Records are yielded in completion order; files that fail to parse
+    come out as {"file", "ok": False, "error"}.
+
+    Feedback letters are left out unless include_feedback is set (they
+    cost one LLM call each).
+    """
+    loop = asyncio.get_running_loop()
+    matcher = EnhancedMatcher(company_profile, analysis_mode=analysis_mode, lazy_feedback=not include_feedback,
+                              llm_provider=llm_provider)
+    concurrency = max(1, concurrency)
+
+    parsed = parse_many(items, max_workers=max_workers, timeout=timeout, ordered=False)
+    # A single thread drives the parse generator, so next() calls never overlap
+    reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stream-parse")
+
+    async def analyze(result: IngestResult) -> Dict:
+        try:
+            analysis = await matcher.aanalyze_candidate(result.data)
+            return _record(result, analysis, include_feedback)
+        except Exception as e:
+            logger.error(f"Scoring {result.name} failed: {e}")
+            return {"file": result.name, "ok": False, "error": f"Scoring failed: {e}"}
+
+    next_parse = loop.run_in_executor(reader, next, parsed, None)
+    running = set()
+    try:
+        while next_parse is not None or running:
+            waiting = set(running)
+            if next_parse is not None and len(running) < concurrency:
+                waiting.add(next_parse)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            for future in done:
+                if future is next_parse:
+                    result = future.result()
+                    if result is None:
+                        next_parse = None
+                        continue
+                    next_parse = loop.run_in_executor(reader, next, parsed, None)
+                    if result.ok:
+                        running.add(asyncio.ensure_future(analyze(result)))
+                    else:
+                        yield _error_record(result)
+                else:
+                    running.discard(future)
+                    yield future.result()
+    finally:
+        for task in running:
+            task.cancel()
+        # Queued behind any in-flight next(), so the generator is never closed mid-call
+        reader.submit(parsed.close)
+        reader.shutdown(wait=False)
+
+
+class ScoreSummary:
+    """Running totals and top candidates of a streamed run (O(top_k) memory; top_k <= 0 keeps none)"""
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self.scored = 0
+        self.failed = 0
+        self.by_ranking: Dict[str, int] = {}
+        self.by_method: Dict[str, int] = {}
+        self._top: List = []  # min-heap of (score, -seq, name, file)
+        self._start = time.perf_counter()
+
+    def add(self, record: Dict):
+        if not record.get("ok"):
+            self.failed += 1
+            return
+
+        self.scored += 1
+        ranking = record.get("ranking", "")
+        method = record.get("method", "")
+        self.by_ranking[ranking] = self.by_ranking.get(ranking, 0) + 1
+        self.by_method[method] = self.by_method.get(method, 0) + 1
+
+        if self.top_k <= 0:
+            return
+        # Earlier records win ties, like rank_results' stable sort
+        entry = (record.get("overall_score", 0), -self.scored, record.get("name", "Unknown"), record["file"])
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+
+    def top(self) -> List[Dict]:
+        ranked = sorted(self._top, reverse=True)
+        return [
+            {"rank": idx, "name": name, "overall_score": score, "file": file_name}
+            for idx, (score, _, name, file_name) in enumerate(ranked, 1)
+        ]
+
+    def to_dict(self) -> Dict:
+        elapsed = time.perf_counter() - self._start
+        total = self.scored + self.failed
+        return {
+            "files": total,
+            "scored": self.scored,
+            "failed": self.failed,
+            "elapsed": round(elapsed, 3),
+            "cvs_per_second": round(total / elapsed, 2) if elapsed else 0.0,
+            "by_ranking": self.by_ranking,
+            "by_method": self.by_method,
+            "top": self.top(),
+        }
+
+
+async def ascore_to_jsonl(company_profile: Dict, items: Iterable[IngestItem], out: TextIO,
+                          top_k: int = DEFAULT_TOP_K, **kwargs) -> Dict:
+    """Stream records to out as JSON lines; returns the ScoreSummary dict"""
+    summary = ScoreSummary(top_k)
+    async for record in astream_scores(company_profile, items, **kwargs):
+        out.write(json.dumps(record, ensure_ascii=False, default=str))
+        out.write("\n")
+        summary.add(record)
+    out.flush()
+    return summary.to_dict()
+
+
+def score_to_jsonl(company_profile: Dict, items: Iterable[IngestItem], out: TextIO,
+                   top_k: int = DEFAULT_TOP_K, **kwargs) -> Dict:
+    """Blocking wrapper around ascore_to_jsonl (runs on the shared background loop)"""
+    return run_sync(ascore_to_jsonl(company_profile, items, out, top_k=top_k, **kwargs))
@@ -0,0 +1,302 @@
+"""Watch Folder - incremental ingestion of a directory the ATS drops CVs into
+
+Usage:
+    python -m processors.watch_folder path/to/dropbox [--interval 30] [--once]
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from processors.bulk_ingest import DEFAULT_TIMEOUT_SECONDS, parse_many
+from processors.candidate_store import CandidateStore, get_candidate_store, score_pool
+from processors.cv_parser import SUPPORTED_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _walk(directory: str, recursive: bool = True) -> Iterator[Tuple[str, int, int]]:
+    """(path, size, mtime_ns) of every supported CV file, via scandir"""
+    try:
+        entries = list(os.scandir(directory))
+    except OSError as e:
+        logger.error(f"Cannot list {directory}: {e}")
+        return
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _walk(entry.path, recursive)
+            elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS:
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_mtime_ns
+        except OSError:
+            # Vanished between listing and stat: picked up as removed next scan
+            continue
+
+
+class ScanDelta:
+    """Differences between the folder and the manifest"""
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.changed: List[str] = []
+        self.removed: List[str] = []
+        self.touched: List[Tuple[str, int, int]] = []  # metadata changed, content identical
+        self.hashes: Dict[str, str] = {}
+        self.stats: Dict[str, Tuple[int, int]] = {}
+        self.unchanged = 0
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self) -> Dict:
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged + len(self.touched),
+        }
+
+
+class FolderWatcher:
+    """
+    Incrementally sync a CV folder into the candidate store
+
+    A SQLite manifest records (path, size, mtime, content hash) of every
+    file seen. A scan stats each file and only hashes those whose size or
+    mtime moved, so re-scanning an unchanged folder costs one stat per
+    file. New and changed files are parsed on the ingest process pool and
+    appended to the store (keyed by path, so edits replace the previous
+    version); deleted files are tombstoned.
+
+    Example:
+        watcher = FolderWatcher("/mnt/ats-dropbox")
+        report = watcher.sync()
+        watcher.watch(interval=30)  # blocks; see stop()
+    """
+
+    def __init__(self, directory: str, store: Optional[CandidateStore] = None,
+                 manifest_path: Optional[str] = None, recursive: bool = True,
+                 max_workers: Optional[int] = None, timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS):
+        self.directory = os.path.abspath(directory)
+        self.store = store if store is not None else get_candidate_store()
+        if self.store is None:
+            raise ValueError("No candidate store: enable TALENT_POOL_ENABLED or pass store=")
+        self.recursive = recursive
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._stop = threading.Event()
+
+        if manifest_path is None:
+            from core.config import settings
+            manifest_path = settings.watch_manifest_path
+        directory_name = os.path.dirname(manifest_path)
+        if directory_name:
+            os.makedirs(directory_name, exist_ok=True)
+
+        self._conn = sqlite3.connect(manifest_path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS manifest (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (root, path)
+                )"""
+            )
+
+    def candidate_id(self, path: str) -> str:
+        """Store id of a file: its absolute path, unique across watched folders"""
+        return os.path.abspath(path)
+
+    def _manifest(self) -> Dict[str, Tuple[int, int, str]]:
+        rows = self._conn.execute(
+            "SELECT path, size, mtime_ns, sha256 FROM manifest WHERE root = ?", (self.directory,)
+        )
+        return {path: (size, mtime_ns, sha256) for path, size, mtime_ns, sha256 in rows}
+
+    def scan(self) -> ScanDelta:
+        """Compare the folder with the manifest (hashes only files whose stat changed)"""
+        known = self._manifest()
+        delta = ScanDelta()
+        seen = set()
+
+        for path, size, mtime_ns in _walk(self.directory, self.recursive):
+            seen.add(path)
+            previous = known.get(path)
+            if previous is not None and previous[0] == size and previous[1] == mtime_ns:
+                delta.unchanged += 1
+                continue
+
+            try:
+                digest = file_sha256(path)
+            except OSError as e:
+                logger.warning(f"Cannot read {path}: {e}")
+                continue
+
+            delta.stats[path] = (size, mtime_ns)
+            delta.hashes[path] = digest
+            if previous is None:
+                delta.added.append(path)
+            elif previous[2] == digest:
+                delta.touched.append((path, size, mtime_ns))
+            else:
+                delta.changed.append(path)
+
+        delta.removed = [path for path in known if path not in seen]
+        return delta
+
+    def sync(self, progress: Optional[Callable] = None) -> Dict:
+        """
+        Apply one scan: parse new/changed files, tombstone removed ones
+
+        Returns:
+            Summary dict (added, changed, removed, unchanged, parsed, failed, elapsed)
+        """
+        start = time.perf_counter()
+        delta = self.scan()
+        now = time.time()
+
+        to_parse = delta.added + delta.changed
+        changed = set(delta.changed)
+        parsed_cvs, parsed_ids, parsed_sources = [], [], []
+        stale_ids = [self.candidate_id(path) for path in delta.removed]
+        manifest_rows = []
+        failed = 0
+
+        if to_parse:
+            workers = self.max_workers
+            if workers is None:
+                from core.config import settings
+                workers = settings.ingest_workers or None
+            for result in parse_many(to_parse, max_workers=workers, timeout=self.timeout):
+                path = to_parse[result.index]
+                size, mtime_ns = delta.stats[path]
+                if result.ok:
+                    parsed_cvs.append(result.data)
+                    parsed_ids.append(self.candidate_id(path))
+                    parsed_sources.append(path)
+                    status, error = "ok", None
+                else:
+                    failed += 1
+                    status, error = "error", result.error
+                    if path in changed:
+                        # The stored version no longer matches the file
+                        stale_ids.append(self.candidate_id(path))
+                # Failed files stay in the manifest so they're retried only once they change
+                manifest_rows.append((self.directory, path, size, mtime_ns, delta.hashes[path], status, error, now))
+                if progress:
+                    progress(result)
+
+        # Store first, manifest second: a crash in between re-parses, never loses files
+        if parsed_cvs:
+            self.store.append(parsed_cvs, candidate_ids=parsed_ids, sources=parsed_sources)
+        if stale_ids:
+            self.store.delete(stale_ids)
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO manifest (root, path, size, mtime_ns, sha256, status, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                manifest_rows
+            )
+            self._conn.executemany(
+                "UPDATE manifest SET size = ?, mtime_ns = ?, updated_at = ? WHERE root = ? AND path = ?",
+                [(size, mtime_ns, now, self.directory, path) for path, size, mtime_ns in delta.touched]
+            )
+            self._conn.executemany(
+                "DELETE FROM manifest WHERE root = ? AND path = ?",
+                [(self.directory, path) for path in delta.removed]
+            )
+
+        summary = delta.summary()
+        summary.update({
+            "parsed": len(parsed_cvs),
+            "failed": failed,
+            "elapsed": round(time.perf_counter() - start, 3),
+        })
+        if not delta.empty:
+            logger.info(f"Watch folder {self.directory}: {summary}")
+        return summary
+
+    def watch(self, interval: float = 30.0, on_change: Optional[Callable[[Dict], None]] = None,
+              company_profile: Optional[Dict] = None, top_k: Optional[int] = None):
+        """
+        Poll the folder until stop() is called
+
+        on_change receives the sync summary whenever something changed;
+        with company_profile it also carries the refreshed "ranking"
+        (score_pool over the whole store).
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            try:
+                summary = self.sync()
+                changed = summary["added"] or summary["changed"] or summary["removed"]
+                if changed and company_profile is not None:
+                    summary["ranking"] = score_pool(company_profile, self.store, top_k=top_k)
+                if changed and on_change:
+                    on_change(summary)
+            except Exception as e:
+                logger.error(f"Watch folder sync failed: {e}")
+            self._stop.wait(interval)
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self):
+        self._conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Incrementally ingest a CV folder into the talent pool")
+    parser.add_argument("directory", help="folder the ATS drops CVs into")
+    parser.add_argument("--interval", type=float, default=None, help="seconds between scans")
+    parser.add_argument("--once", action="store_true", help="sync once and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    from core.config import settings
+
+    watcher = FolderWatcher(args.directory)
+    if args.once:
+        print(watcher.sync())
+        return 0
+
+    try:
+        watcher.watch(interval=args.interval or settings.watch_interval_seconds, on_change=print)
+    except KeyboardInterrupt:
+        watcher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+import asyncio
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import FormData
+from aiohttp.test_utils import TestClient, TestServer
+
+from api.server import MatchService, create_app
+from core.config import settings
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+CVS = [
+    {"name": f"Person {i}", "years_experience": i, "skills": ["Python", "SQL", "AWS"][:i % 3 + 1],
+     "soft_skills": ["Leadership"], "experience": []}
+    for i in range(6)
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_provider(monkeypatch):
+    monkeypatch.setattr(settings, "llm_provider", "mock")
+    monkeypatch.setattr(settings, "ingest_workers", 1)
+
+
+@pytest.fixture
+def company():
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run(test, service=None):
+    async def main():
+        client = TestClient(TestServer(create_app(service or MatchService())))
+        await client.start_server()
+        try:
+            return await test(client)
+        finally:
+            await client.close()
+    return asyncio.run(main())
+
+
+async def submit(client, company, **body):
+    response = await client.post("/jobs", json={"company": company, **body})
+    assert response.status == 202
+    return (await response.json())["id"]
+
+
+async def wait_done(client, job_id):
+    for _ in range(200):
+        status = await (await client.get(f"/jobs/{job_id}")).json()
+        if status["status"] == "done":
+            return status
+        await asyncio.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+def test_health():
+    async def test(client):
+        response = await client.get("/health")
+        assert response.status == 200
+        assert (await response.json())["provider"] == "mock"
+    run(test)
+
+
+def test_upload_files_and_archives():
+    async def test(client):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as z:
+            for i in range(3):
+                z.writestr(f"cv{i}.txt", f"Zip Person {i}\nz{i}@example.com\n{i} years python\n")
+        form = FormData()
+        form.add_field("files", archive.getvalue(), filename="batch.zip")
+        form.add_field("files", b"Plain Person\nplain@example.com\n", filename="plain.txt")
+        form.add_field("files", b"{broken", filename="broken.json")
+
+        response = await client.post("/cvs", data=form)
+        assert response.status == 201
+        upload = await response.json()
+        assert upload["count"] == 4
+        assert sorted(cv["name"] for cv in upload["cvs"]) == ["Plain Person"] + [f"Zip Person {i}" for i in range(3)]
+        assert [error["file"] for error in upload["errors"]] == ["broken.json"]
+    run(test)
+
+
+def test_upload_json_cvs():
+    async def test(client):
+        response = await client.post("/cvs", json={"cvs": CVS})
+        assert response.status == 201
+        assert (await response.json())["count"] == len(CVS)
+    run(test)
+
+
+def test_upload_over_the_size_cap(monkeypatch):
+    async def test(client):
+        monkeypatch.setattr(settings, "api_max_upload_bytes", 1000)
+        form = FormData()
+        for i in range(3):
+            form.add_field("files", b"x" * 400, filename=f"{i}.txt")
+        response = await client.post("/cvs", data=form)
+        assert response.status == 413
+    run(test)
+
+
+def test_job_stream_results_and_feedback(company):
+    async def test(client):
+        upload = await (await client.post("/cvs", json={"cvs": CVS})).json()
+        job_id = await submit(client, company, upload_id=upload["upload_id"])
+
+        lines = []
+        async with client.get(f"/jobs/{job_id}/stream") as response:
+            assert response.status == 200
+            async for line in response.content:
+                lines.append(json.loads(line))
+        results, end = lines[:-1], lines[-1]
+        assert end["event"] == "end" and end["status"] == "done"
+        assert len(results) == len(CVS)
+        assert all(line["event"] == "result" and line["result"]["feedback"] is None for line in results)
+
+        page = await (await client.get(f"/jobs/{job_id}/results?offset=2&limit=3")).json()
+        assert (page["total"], page["partial"]) == (len(CVS), False)
+        assert [result["rank"] for result in page["results"]] == [3, 4, 5]
+
+        response = await client.get(f"/jobs/{job_id}/results/1/feedback")
+        assert response.status == 200
+        feedback = await response.json()
+        assert feedback["rank"] == 1 and feedback["feedback"]
+
+        assert (await client.get(f"/jobs/{job_id}/results/99/feedback")).status == 404
+        listed = await (await client.get("/jobs")).json()
+        assert [job["id"] for job in listed["jobs"]] == [job_id]
+    run(test)
+
+
+def test_job_with_feedback_and_options(company):
+    async def test(client):
+        job_id = await submit(client, company, cvs=CVS, feedback=True, dedup="true", dedup_threshold="0.9",
+                              shortlist_size="2", shortlist_min_score="0")
+        await wait_done(client, job_id)
+        page = await (await client.get(f"/jobs/{job_id}/results")).json()
+        assert all(result["feedback"] for result in page["results"])
+        assert [result["tier"] for result in page["results"]][:2] == ["shortlist", "shortlist"]
+    run(test)
+
+
+def test_persisted_job_is_served_after_restart(company, tmp_path):
+    service = MatchService(persist_dir=str(tmp_path))
+
+    async def test(client):
+        job_id = await submit(client, company, cvs=CVS)
+        await wait_done(client, job_id)
+        return job_id
+
+    job_id = run(test, service)
+    service.close()
+
+    async def reload(client):
+        status = await (await client.get(f"/jobs/{job_id}")).json()
+        assert status["status"] == "done"
+        response = await client.get(f"/jobs/{job_id}/results/1/feedback")
+        assert response.status == 200
+    run(reload, MatchService(persist_dir=str(tmp_path)))
+
+
+@pytest.mark.parametrize("body, status", [
+    ({"cvs": CVS}, 400),                                              # no company
+    ({"company": {}, "cvs": CVS, "analysis_mode": "bogus"}, 400),
+    ({"company": {}, "cvs": CVS, "llm_provider": "bogus"}, 400),
+    ({"company": {}, "cvs": CVS, "dedup_threshold": "abc"}, 400),
+    ({"company": {}, "cvs": CVS, "dedup_threshold": 2}, 400),
+    ({"company": {}, "cvs": CVS, "shortlist_size": 0}, 400),
+    ({"company": {}, "cvs": CVS, "dedup": "maybe"}, 400),
+    ({"company": {}, "cvs": "not a list"}, 400),
+    ({"company": {}, "cvs": [1, 2]}, 400),
+    ({"company": {}, "cvs": []}, 400),
+    ({"company": {}}, 400),
+    ({"company": {}, "upload_id": "missing"}, 404),
+])
+def test_bad_job_requests(body, status):
+    async def test(client):
+        response = await client.post("/jobs", json=body)
+        assert response.status == status
+        assert "error" in await response.json()
+    run(test)
+
+
+def test_bad_uploads_and_unknown_jobs():
+    async def test(client):
+        assert (await client.post("/jobs", data="{not json",
+                                  headers={"Content-Type": "application/json"})).status == 400
+        assert (await client.post("/cvs", json={"nope": []})).status == 400
+        assert (await client.post("/cvs", json={"cvs": ["text"]})).status == 400
+        assert (await client.post("/cvs", data="plain", headers={"Content-Type": "text/plain"})).status == 415
+        assert (await client.get("/jobs/unknown")).status == 404
+        assert (await client.delete("/jobs/unknown")).status == 404
+        assert (await client.get("/jobs/unknown/results?offset=x")).status == 404
+    run(test)
+
+
+def test_cancel_running_job(company, monkeypatch):
+    monkeypatch.setattr(settings, "mock_latency_distribution", "fixed")
+    monkeypatch.setattr(settings, "mock_latency_ms", 50.0)
+    from core.llm_provider import clear_llm_registry
+    clear_llm_registry()
+
+    async def test(client):
+        job_id = await submit(client, company, cvs=CVS * 5, analysis_mode="fused")
+        response = await client.delete(f"/jobs/{job_id}")
+        assert response.status == 202
+        for _ in range(100):
+            status = await (await client.get(f"/jobs/{job_id}")).json()
+            if status["status"] == "cancelled":
+                break
+            await asyncio.sleep(0.02)
+        assert status["status"] == "cancelled"
+        assert (await client.delete(f"/jobs/{job_id}")).status == 409
+    run(test)
+    clear_llm_registry()
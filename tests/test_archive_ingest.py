@@ -0,0 +1,75 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from processors.archive_ingest import (
+    count_archive_members, expand_archives, ingest_archive, is_archive, iter_archive_members
+)
+
+CVS = {
+    "cvs/ana.txt": b"Ana Lopez\nana@example.com\n5 years python\n",
+    "cvs/ben.json": b'{"name": "Ben", "skills": ["SQL"]}',
+}
+SKIPPED = {
+    "cvs/.hidden.txt": b"hidden",
+    "__MACOSX/cvs/._ana.txt": b"resource fork",
+    "cvs/photo.png": b"\x89PNG",
+    "cvs/huge.txt": b"x" * 2048,
+}
+
+
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("cvs/", "")
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def make_tar(members, mode="w:gz"):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("file_name,build", [
+    ("batch.zip", make_zip),
+    ("batch.tar.gz", make_tar),
+    ("batch.tar", lambda members: make_tar(members, mode="w")),
+])
+def test_streams_only_cv_members_under_the_cap(file_name, build):
+    content = build({**CVS, **SKIPPED})
+    members = dict(iter_archive_members(content, file_name=file_name, max_member_bytes=1024))
+    assert members == {f"{file_name}/{name}": data for name, data in CVS.items()}
+
+
+@pytest.mark.parametrize("build", [make_zip, make_tar])
+def test_detects_the_type_without_a_name(build):
+    members = dict(iter_archive_members(io.BytesIO(build(CVS)), max_member_bytes=0))
+    assert members == CVS
+
+
+def test_count_matches_iteration_for_zip_only():
+    content = make_zip({**CVS, **SKIPPED})
+    assert count_archive_members(content, "batch.zip", max_member_bytes=1024) == len(CVS)
+    assert count_archive_members(make_tar(CVS), "batch.tar.gz") is None
+    assert count_archive_members(b"not a zip", "broken.zip") is None
+
+
+def test_expand_archives_passes_other_files_through():
+    items = [("single.txt", b"Solo\n"), ("batch.zip", make_zip(CVS)), ("broken.tar.gz", b"garbage")]
+    names = [name for name, _ in expand_archives(items, max_member_bytes=1024)]
+    assert names == ["single.txt", "batch.zip/cvs/ana.txt", "batch.zip/cvs/ben.json"]
+    assert is_archive("CVS.TGZ") and not is_archive("cv.pdf")
+
+
+def test_ingest_archive_parses_members_in_order():
+    report = ingest_archive(make_zip(CVS), file_name="batch.zip", max_workers=1, max_member_bytes=1024)
+    assert [cv["name"] for cv in report.cvs] == ["Ana Lopez", "Ben"]
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from processors.batch_scorer import BatchScorer, score_candidates
+from processors.simple_matcher import EnhancedMatcher
+
+SKILLS = ["Python", "python", "Leadership", "Communication", "Problem-Solving", "Adaptability",
+          "learning mindset", "Learning Mindset", "SQL", "Go", "Collaboration", "communication",
+          "Innovation", "ownership", "Excellence", "Mentoring"]
+VALUES = ["Innovation", "Ownership", "Collaboration", "Excellence", "Learning", "Growth Mindset", "Team work", ""]
+SCORE_KEYS = ("technical_score", "culture_score", "cv_quality_score", "overall_score")
+
+
+def random_company(rng):
+    return {"values": rng.sample(VALUES, rng.randint(0, 6)),
+            "focus_skills": rng.sample(SKILLS, rng.randint(0, 6))}
+
+
+def random_cvs(rng, n):
+    cvs = []
+    for i in range(n):
+        cv = {"name": rng.choice(["", f"Candidate {i}"]),
+              "skills": rng.sample(SKILLS, rng.randint(0, 8)),
+              "soft_skills": rng.sample(SKILLS + ["leadership", "growth", "team"], rng.randint(0, 6)),
+              "current_role": rng.choice(["", "Engineering Manager", "Developer", "Team Lead"]),
+              "years_experience": rng.randint(0, 12)}
+        for field in ("email", "degree", "university"):
+            if rng.random() < 0.5:
+                cv[field] = "x"
+        if rng.random() < 0.5:
+            cv["experience"] = [{"role": "x"}]
+        if rng.random() < 0.2:
+            del cv["skills"]
+        if rng.random() < 0.2:
+            del cv["soft_skills"]
+        cvs.append(cv)
+    return cvs
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_scores_match_manual_analysis(seed):
+    rng = random.Random(seed)
+    company = random_company(rng)
+    cvs = random_cvs(rng, 40)
+
+    matcher = EnhancedMatcher(company, llm_provider="mock")
+    scores = BatchScorer(company).score(cvs)
+
+    for idx, cv in enumerate(cvs):
+        expected = matcher._enhanced_manual_analysis(cv)
+        for key in SCORE_KEYS:
+            assert int(scores[key][idx]) == expected[key], (seed, idx, key)
+        # Distinct focus skills: "Python" and "python" count once
+        matched = {skill.lower() for skill in expected["skills_detail"]["matched_skills"]}
+        assert int(scores["matched_focus_skills"][idx]) == len(matched)
+
+
+def test_score_candidates_orders_like_manual_ranking():
+    rng = random.Random(99)
+    company = random_company(rng)
+    cvs = random_cvs(rng, 60)
+
+    matcher = EnhancedMatcher(company, llm_provider="mock")
+    manual = [matcher._enhanced_manual_analysis(cv)["overall_score"] for cv in cvs]
+    expected = sorted(range(len(cvs)), key=lambda idx: -manual[idx])
+
+    results = score_candidates(company, cvs)
+    assert [r["overall_score"] for r in results] == [manual[idx] for idx in expected]
+    assert [r["rank"] for r in results] == list(range(1, len(cvs) + 1))
+
+
+def test_encode_table_matches_encode(tmp_path):
+    pytest.importorskip("pyarrow")
+    from processors.candidate_store import CandidateStore, score_pool
+
+    rng = random.Random(7)
+    company = random_company(rng)
+    cvs = [dict(cv, name=f"Candidate {i}") for i, cv in enumerate(random_cvs(rng, 30))]
+    store = CandidateStore(str(tmp_path / "pool"))
+    store.append(cvs)
+
+    pooled = {r["name"]: r["overall_score"] for r in score_pool(company, store)}
+    direct = {r["name"]: r["overall_score"] for r in score_candidates(company, cvs)}
+    assert pooled == direct
@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from processors import bulk_ingest
+from processors.bulk_ingest import _parse_one, parse_many
+from processors.cv_parser import CVParser
+
+
+@pytest.fixture
+def slow_parser(monkeypatch):
+    def slow(text):
+        time.sleep(5)
+        return {"name": "never"}
+    monkeypatch.setattr(CVParser, "_extract_structured_data", staticmethod(slow))
+    # Bypass the parsed-CV cache so the slow parser always runs
+    monkeypatch.setattr(bulk_ingest, "parse_cached", CVParser.parse_bytes)
+
+
+def test_slow_parse_reports_timeout(slow_parser):
+    start = time.monotonic()
+    result = _parse_one(0, ("slow.txt", b"Jane Doe\npython\n"), 0.3, use_alarm=True)
+    assert time.monotonic() - start < 2
+    assert not result.ok
+    assert result.error.startswith("Timed out")
+
+
+def test_slow_parse_times_out_in_worker(slow_parser):
+    items = [("slow.txt", b"Jane Doe\npython\n")]
+    results = list(parse_many(items, max_workers=1, timeout=0.3))
+    assert len(results) == 1
+    assert results[0].error.startswith("Timed out")
+
+
+def test_parse_many_keeps_input_order(tmp_path):
+    items = [(f"cv{i}.txt", f"Person {i}\np{i}@example.com\n{i} years python\n".encode()) for i in range(20)]
+    results = list(parse_many(items, max_workers=2, chunk_size=3))
+    assert [r.index for r in results] == list(range(20))
+    assert [r.data["name"] for r in results] == [f"Person {i}" for i in range(20)]
@@ -0,0 +1,85 @@
+import json
+import pickle
+import random
+
+import pytest
+
+from processors.candidate import VOCABULARY, Candidate, ExperienceRecord, as_dict, to_candidates
+from processors.cv_parser import CVParser
+from processors.simple_matcher import match_candidates
+
+PARSED_TEXT = ("Ana Lopez\nana@example.com\n+1 555-123-4567\nBS Computer Science, State University\n"
+               "Lead Python engineer at Acme\nSQL, AWS, leadership, mentoring\n7 years experience\n")
+
+
+def test_parsed_cv_round_trips_in_parser_order():
+    cv = CVParser._extract_structured_data(PARSED_TEXT)
+    candidate = Candidate.from_dict(cv)
+
+    assert candidate.to_dict() == cv
+    assert json.dumps(candidate.to_dict()) == json.dumps(cv)
+    assert dict(candidate) == cv and len(candidate) == len(cv)
+
+
+@pytest.mark.parametrize("cv", [
+    {},
+    {"name": "Ben"},
+    {"name": "Cleo", "skills": ["Python", 3], "soft_skills": "Leadership", "experience": ["Acme"]},
+    {"name": "Dan", "experience": [{"role": "Lead", "company": "Acme", "years": 3}], "linkedin": "dan"},
+    {"skills": [], "soft_skills": [], "experience": [], "years_experience": 0, "email": None},
+])
+def test_irregular_dicts_round_trip(cv):
+    candidate = Candidate.from_dict(cv)
+    assert candidate.to_dict() == cv
+    assert set(candidate) == set(cv)
+    for key, value in cv.items():
+        assert key in candidate and candidate[key] == value
+    assert "missing" not in candidate and candidate.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        candidate["missing"]
+
+
+def test_random_dicts_round_trip():
+    rng = random.Random(2)
+    fields = list(Candidate.FIELDS) + ["extra_field"]
+    for _ in range(200):
+        cv = {}
+        for key in rng.sample(fields, rng.randint(0, len(fields))):
+            if key in ("skills", "soft_skills"):
+                cv[key] = [rng.choice(["Python", "SQL", "Go", "Leadership"]) for _ in range(rng.randint(0, 4))]
+            elif key == "experience":
+                cv[key] = [{"role": "Dev", "company": rng.choice(["Acme", "Initech"])}] * rng.randint(0, 2)
+            else:
+                cv[key] = rng.choice(["", "x", 0, 5, None])
+        assert Candidate.from_dict(cv).to_dict() == cv
+
+
+def test_pickle_uses_the_portable_dict_form():
+    cv = CVParser._extract_structured_data(PARSED_TEXT)
+    candidate = Candidate.from_dict(cv)
+    restored = pickle.loads(pickle.dumps(candidate))
+
+    assert isinstance(restored, Candidate) and restored.to_dict() == cv
+    record = candidate.experience[0]
+    assert isinstance(record, ExperienceRecord)
+    assert pickle.loads(pickle.dumps(record)).to_dict() == cv["experience"][0]
+
+
+def test_skills_share_the_vocabulary():
+    first = Candidate.from_dict({"skills": ["Python", "SQL"]})
+    second = Candidate.from_dict({"skills": ["SQL"]})
+    assert first.skill_ids[1] == second.skill_ids[0]
+    assert VOCABULARY.term(second.skill_ids[0]) == "SQL"
+
+
+def test_matchers_rank_candidates_like_dicts():
+    company = {"values": ["Ownership", "Collaboration"], "focus_skills": ["Python", "SQL"]}
+    cvs = [
+        {"name": "Ana", "email": "a@x.com", "skills": ["Python", "SQL"], "soft_skills": ["Ownership"], "experience": []},
+        {"name": "Ben", "skills": ["Go"], "soft_skills": [], "experience": [{"role": "Dev"}], "years_experience": 3},
+    ]
+    plain = match_candidates(company, cvs, llm_provider="mock", analysis_mode="fused")
+    compact = match_candidates(company, to_candidates(cvs), llm_provider="mock", analysis_mode="fused")
+
+    assert [(r["name"], r["overall_score"]) for r in compact] == [(r["name"], r["overall_score"]) for r in plain]
+    assert as_dict(to_candidates(cvs)[0]) == cvs[0] and as_dict(cvs[1]) is cvs[1]
@@ -0,0 +1,87 @@
+import pytest
+
+from processors.candidate_store import CandidateStore
+
+
+def cv(name, years=3, skills=("Python",)):
+    return {"name": name, "email": f"{name.lower()}@example.com", "years_experience": years,
+            "skills": list(skills), "soft_skills": [], "experience": []}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandidateStore(str(tmp_path / "pool"))
+
+
+def test_two_appends_in_a_row(store):
+    first = store.append([cv("Ana")], sources=["ana.pdf"])
+    second = store.append([cv("Ben"), cv("Cleo")], sources=["ben.pdf", "cleo.pdf"])
+
+    assert len(store) == 3
+    assert set(store.ids()) == set(first + second)
+    sources = dict(zip(store.scan(columns=["name", "source"])["name"],
+                       store.scan(columns=["name", "source"])["source"]))
+    assert sources == {"Ana": "ana.pdf", "Ben": "ben.pdf", "Cleo": "cleo.pdf"}
+
+
+def test_append_rejects_mismatched_lengths(store):
+    with pytest.raises(ValueError):
+        store.append([cv("Ana"), cv("Ben")], sources=["ana.pdf"])
+    with pytest.raises(ValueError):
+        store.append([cv("Ana")], candidate_ids=["a", "b"])
+    assert len(store) == 0
+
+
+def test_update_appends_a_newer_version(store):
+    store.append([cv("Ana", years=3)], candidate_ids=["ana"])
+    store.append([cv("Ana", years=6)], candidate_ids=["ana"])
+
+    assert len(store) == 1
+    assert store.candidates()[0]["years_experience"] == 6
+    assert len(store._parts()) == 2
+
+
+def test_delete_tombstones_until_re_added(store):
+    store.append([cv("Ana"), cv("Ben")], candidate_ids=["ana", "ben"])
+    store.delete(["ana"])
+    assert store.ids() == ["ben"]
+    assert len(store) == 1
+
+    store.append([cv("Ana", years=9)], candidate_ids=["ana"])
+    assert sorted(store.ids()) == ["ana", "ben"]
+    assert {c["name"]: c["years_experience"] for c in store.candidates()}["Ana"] == 9
+
+
+def test_content_ids_are_stable(store):
+    first = store.append([cv("Ana")])
+    second = store.append([cv("Ana")])
+    assert first == second
+    assert len(store) == 1
+
+
+def test_filters(store):
+    import pyarrow.compute as pc
+
+    store.append([cv("Ana", years=2, skills=("Python", "SQL")),
+                  cv("Ben", years=8, skills=("python", "Rust")),
+                  cv("Cleo", years=12, skills=("Go",))])
+
+    assert {c["name"] for c in store.candidates(min_years=5)} == {"Ben", "Cleo"}
+    assert {c["name"] for c in store.candidates(max_years=8, skills=["PYTHON"])} == {"Ana", "Ben"}
+    # Rust is not a parser keyword, so it is filtered after the scan
+    assert [c["name"] for c in store.candidates(skills=["python", "rust"])] == ["Ben"]
+    assert [c["name"] for c in store.candidates(where=pc.field("name") == "Cleo")] == ["Cleo"]
+
+
+def test_compact_keeps_only_live_rows(store, tmp_path):
+    store.append([cv("Ana")], candidate_ids=["ana"])
+    store.append([cv("Ana", years=7)], candidate_ids=["ana"])
+    store.append([cv("Ben")], candidate_ids=["ben"], sources=["ben.pdf"])
+    store.delete(["ben"])
+
+    store.compact()
+    assert len(store._parts()) == 1
+    assert store.ids() == ["ana"]
+
+    reopened = CandidateStore(str(tmp_path / "pool"))
+    assert reopened.candidates() == [cv("Ana", years=7)]
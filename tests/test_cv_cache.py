@@ -0,0 +1,46 @@
+import pytest
+
+from processors import cv_cache
+from processors.cv_cache import ParsedCVCache
+from processors.cv_parser import CVParser, PARSER_VERSION
+
+CV_TEXT = b"Jane Doe\njane@doe.com\nSenior Python Engineer\n7 years of SQL and AWS\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParsedCVCache(str(tmp_path / "cvs.sqlite"))
+
+
+def test_second_parse_is_a_hit(cache, monkeypatch):
+    first = cache.parse("jane.txt", CV_TEXT)
+    assert first == CVParser.parse_bytes("jane.txt", CV_TEXT)
+
+    monkeypatch.setattr(CVParser, "parse_with_text", lambda *args: pytest.fail("parsed again"))
+    assert cache.parse("renamed.txt", CV_TEXT) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get("jane.txt", CV_TEXT)["text"].startswith("Jane Doe")
+
+
+def test_key_covers_content_type_and_version(cache):
+    key = cache.make_key("jane.txt", CV_TEXT)
+    assert key.startswith(f"v{PARSER_VERSION}:.txt:")
+    assert key == cache.make_key("other.TXT", CV_TEXT.decode("utf-8"))
+    assert key != cache.make_key("jane.txt", CV_TEXT + b"\n")
+    assert key != cache.make_key("jane.json", CV_TEXT)
+
+
+def test_failed_parses_are_not_cached(cache):
+    assert cache.parse("broken.json", b"{not json") == {}
+    assert cache.get("broken.json", b"{not json") is None
+
+
+def test_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cvs.sqlite")
+    ParsedCVCache(path).parse("jane.txt", CV_TEXT)
+    assert ParsedCVCache(path).get("jane.txt", CV_TEXT) is not None
+
+
+def test_parse_cached_without_cache(monkeypatch):
+    monkeypatch.setattr(cv_cache, "get_cv_cache", lambda: None)
+    assert cv_cache.parse_cached("jane.txt", CV_TEXT)["name"] == "Jane Doe"
@@ -0,0 +1,33 @@
+import io
+
+import pytest
+
+from core.config import settings
+from processors.cv_parser import CVParser, parse_cv_streamlit
+
+
+class Upload(io.BytesIO):
+    def __init__(self, name, content):
+        super().__init__(content)
+        self.name = name
+
+
+@pytest.mark.parametrize("content", [b"{not json", b"\xff\xfe", "{broken"])
+def test_malformed_json_returns_empty(tmp_path, content):
+    assert CVParser.parse_bytes("cv.json", content) == {}
+    path = tmp_path / "cv.json"
+    path.write_bytes(content.encode() if isinstance(content, str) else content)
+    assert CVParser.parse_file(str(path)) == {}
+
+
+@pytest.mark.parametrize("cache_enabled", [False, True])
+def test_streamlit_upload_of_malformed_json_reports_error(tmp_path, monkeypatch, cache_enabled):
+    monkeypatch.setattr(settings, "cv_cache_enabled", cache_enabled)
+    monkeypatch.setattr(settings, "cv_cache_path", str(tmp_path / "cv_cache.sqlite"))
+    result = parse_cv_streamlit(Upload("cv.json", b"{not json"))
+    assert result["name"] == "Error parsing file"
+    assert result["error"]
+
+
+def test_valid_json_round_trips():
+    assert CVParser.parse_bytes("cv.json", b'{"name": "Ana"}') == {"name": "Ana"}
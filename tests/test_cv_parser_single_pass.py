@@ -0,0 +1,106 @@
+import random
+import re
+
+import pytest
+
+from processors.cv_parser import CVParser
+
+WORDS = ["python", "Java", "JavaScript developer", "SQL", "aws", "Kubernetes", "git", "React", "django",
+         "TensorFlow", "PyTorch", "Machine Learning", "AI", "ml", "maintain", "Leadership", "communication",
+         "Problem-Solving", "teamwork", "collaboration", "creativity", "Adaptability", "mentoring",
+         "presentation", "BS Computer", "ba ", "MS in", "phd", "MBA", "degree", "certificate",
+         "University of X", "college", "Institute", "school", "engineer", "Developer", "manager",
+         "Director", "lead", "analyst", "specialist", "5 years", "year 2019", "10+ yrs", "3 Years exp",
+         "john@x.com", "a@b@c.com", "555-123-4567", "+1 555.123.4567", "İstanbul", "ß", "JAVA", "emAIl",
+         "x" * 60, "x" * 120, "Mail: me@site.org"]
+
+
+def baseline_extract(text):
+    """The line-by-line, keyword-by-keyword extraction the single-pass parser replaced"""
+    lines = text.split('\n')
+    cv_data = {
+        "name": "", "email": "", "phone": "", "degree": "", "university": "", "years_experience": 0,
+        "current_role": "", "current_company": "", "experience": [], "skills": [], "soft_skills": [],
+        "education": [], "raw_text": text[:500]
+    }
+
+    for line in lines[:5]:
+        if line.strip() and len(line.strip()) < 50:
+            cv_data["name"] = line.strip()
+            break
+
+    for line in text.split('\n'):
+        if '@' in line and '.' in line:
+            email = line.strip()
+            if email.count('@') == 1:
+                cv_data["email"] = email
+                break
+
+    for match in re.finditer(r'(\+?1?\s*)?(\d{3}[-.]?\d{3}[-.]?\d{4})', text):
+        cv_data["phone"] = match.group(0)
+        break
+
+    for line in lines:
+        if any(k in line.lower() for k in ['bs ', 'ba ', 'ms ', 'ma ', 'phd', 'mba', 'degree', 'certificate']):
+            cv_data["degree"] = line.strip()
+
+    for line in lines:
+        if any(k in line.lower() for k in ['university', 'college', 'institute', 'school']):
+            cv_data["university"] = line.strip()
+
+    for line in lines:
+        line_lower = line.lower()
+        for keyword in ['engineer', 'developer', 'manager', 'director', 'lead', 'analyst', 'specialist']:
+            if keyword in line_lower and len(line.strip()) < 100:
+                if not cv_data["current_role"]:
+                    cv_data["current_role"] = line.strip()
+                cv_data["experience"].append({"role": line.strip(), "company": "Unknown",
+                                              "duration": "N/A", "description": ""})
+                break
+
+    skill_keywords = ['python', 'java', 'javascript', 'sql', 'aws', 'kubernetes', 'git',
+                      'react', 'django', 'tensorflow', 'pytorch', 'machine learning', 'ai', 'ml']
+    for line in lines:
+        line_lower = line.lower()
+        for skill in skill_keywords:
+            # Compares the lowercase keyword to title-cased entries, so repeats are appended again
+            if skill in line_lower and skill not in cv_data["skills"]:
+                cv_data["skills"].append(skill.title())
+
+    soft_skills_keywords = ['leadership', 'communication', 'problem-solving', 'teamwork',
+                            'collaboration', 'creativity', 'adaptability', 'mentoring', 'presentation']
+    for line in lines:
+        line_lower = line.lower()
+        for skill in soft_skills_keywords:
+            if skill in line_lower and skill not in cv_data["soft_skills"]:
+                cv_data["soft_skills"].append(skill.title())
+
+    for line in lines:
+        if 'year' in line.lower():
+            numbers = re.findall(r'\d+', line)
+            if numbers:
+                cv_data["years_experience"] = max(cv_data["years_experience"], int(numbers[0]))
+
+    return cv_data
+
+
+def random_texts(seed, n):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        lines = [" ".join(rng.sample(WORDS, rng.randint(0, 4))) if rng.random() < 0.9 else ""
+                 for _ in range(rng.randint(0, 25))]
+        texts.append(("\n" if rng.random() < 0.9 else "\r\n").join(lines))
+    return texts
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_single_pass_matches_baseline_on_random_texts(seed):
+    for text in random_texts(seed, 200):
+        assert CVParser._extract_structured_data(text) == baseline_extract(text), text
+
+
+@pytest.mark.parametrize("text", ["", "\n\n", "Jane Doe\njane@doe.com\n7 years python python\n",
+                                  "İstanbul java\nJAVASCRIPT and Java\nMachine Learning lead, 12 years"])
+def test_single_pass_matches_baseline_on_edge_cases(text):
+    assert CVParser._extract_structured_data(text) == baseline_extract(text)
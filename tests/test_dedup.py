@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from processors.dedup import (
+    DEFAULT_THRESHOLD, candidate_signature, dedup_candidates, find_duplicate_clusters, minhash, shingles, similarity
+)
+from processors.simple_matcher import match_candidates
+
+WORDS = ["python", "engineer", "data", "pipelines", "cloud", "team", "lead", "sql", "aws", "docker",
+         "mentoring", "analytics", "startup", "platform", "api", "design", "testing", "agile"]
+
+
+def cv(name, text, **fields):
+    return dict({"name": name, "raw_text": text, "skills": [], "soft_skills": [], "experience": []}, **fields)
+
+
+def random_text(rng, n=120):
+    return " ".join(rng.choice(WORDS) + str(rng.randint(0, 50)) for _ in range(n))
+
+
+def jaccard(a, b):
+    x, y = set(shingles(a)), set(shingles(b))
+    return len(x & y) / len(x | y)
+
+
+def test_signature_is_stable_and_case_insensitive():
+    assert (minhash("Senior Python Engineer") == minhash("senior python  ENGINEER")).all()
+    assert minhash("") is None and minhash("  !! ") is None
+    assert candidate_signature(cv("", "")) is None
+
+
+def test_similarity_estimates_jaccard():
+    rng = random.Random(3)
+    base = random_text(rng).split()
+    for changed in (5, 20, 60):
+        other = list(base)
+        for idx in rng.sample(range(len(other)), changed):
+            other[idx] = "edited"
+        a, b = " ".join(base), " ".join(other)
+        assert similarity(minhash(a), minhash(b)) == pytest.approx(jaccard(a, b), abs=0.2)
+
+
+def test_threshold_decides_what_collapses():
+    rng = random.Random(5)
+    text = random_text(rng)
+    words = text.split()
+    for idx in (10, 40, 70, 100):
+        words[idx] = "edited"
+    edited = " ".join(words)
+
+    candidates = [cv("Ana", text), cv("Ana", random_text(rng)), cv("Ana", text + " extra words"), cv("Ana", edited)]
+    assert 0.8 <= similarity(candidate_signature(candidates[0]), candidate_signature(candidates[3])) < 0.9
+    assert dedup_candidates(candidates) == [[0, 2, 3], [1]]
+    assert dedup_candidates(candidates, threshold=0.95) == [[0, 2], [1], [3]]
+
+
+def test_clusters_are_transitive_and_keep_the_earliest_first():
+    rng = random.Random(11)
+    words = random_text(rng, 200).split()
+    a = " ".join(words)
+    b = " ".join(words[:-10] + ["b"] * 10)
+    c = " ".join(words[:-10] + ["b"] * 5 + ["c"] * 5)
+    signatures = [minhash(c), None, minhash(a), minhash(b)]
+    assert find_duplicate_clusters(signatures, threshold=0.85) == [[0, 2, 3], [1]]
+
+
+def test_parsed_and_json_cvs_compare_alike():
+    fields = {"email": "ana@example.com", "skills": ["Python", "SQL"], "experience": [{"role": "Lead engineer"}]}
+    parsed = cv("Ana", "Ana\nana@example.com\nLead engineer\nPython SQL", **fields)
+    uploaded = cv("Ana", "", **fields)
+    assert "text_signature" not in parsed
+    assert similarity(candidate_signature(parsed), candidate_signature(uploaded)) >= 0.5
+
+
+def test_match_candidates_lists_duplicates():
+    rng = random.Random(8)
+    text = random_text(rng)
+    company = {"values": ["Ownership"], "focus_skills": ["Python"]}
+    candidates = [cv("Ana", text), cv("Ana (resent)", text + " thanks"), cv("Ben", random_text(rng))]
+
+    results = match_candidates(company, candidates, dedup=True, dedup_threshold=DEFAULT_THRESHOLD,
+                               llm_provider="mock", analysis_mode="fused")
+    assert sorted(r["name"] for r in results) == ["Ana", "Ben"]
+    ana = next(r for r in results if r["name"] == "Ana")
+    assert [d["name"] for d in ana["duplicates"]] == ["Ana (resent)"]
+    assert ana["duplicates"][0]["index"] == 1
+    assert "text_signature" not in ana
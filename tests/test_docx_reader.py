@@ -0,0 +1,71 @@
+import io
+import zipfile
+
+import pytest
+
+from processors.cv_parser import CVParser
+from processors.docx_reader import extract_docx_text, iter_docx_paragraphs
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def make_docx(body: str) -> bytes:
+    """DOCX package holding just word/document.xml with the given body XML"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml",
+                         f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+        archive.writestr("word/media/image1.png", b"\x89PNG" + b"\0" * 1024)
+    return buffer.getvalue()
+
+
+def test_paragraphs_runs_tabs_and_breaks():
+    content = make_docx(
+        "<w:p><w:r><w:t>Jane</w:t></w:r><w:r><w:t xml:space='preserve'> Doe</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>Skills</w:t><w:tab/><w:t>Python</w:t><w:br/><w:t>SQL</w:t></w:r></w:p>"
+        "<w:p/>"
+    )
+    assert list(iter_docx_paragraphs(io.BytesIO(content))) == ["Jane Doe", "Skills\tPython\nSQL", ""]
+
+
+def test_tables_and_text_boxes_in_document_order():
+    content = make_docx(
+        "<w:p><w:r><w:t>Before</w:t></w:r></w:p>"
+        "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell A</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>Cell B</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        "<w:p><w:r><w:t>Outer</w:t><w:txbxContent><w:p><w:r><w:t>Boxed</w:t></w:r></w:p></w:txbxContent>"
+        "<w:t> text</w:t></w:r></w:p>"
+    )
+    assert extract_docx_text(io.BytesIO(content)) == "Before\nCell A\nCell B\nBoxed\nOuter text\n"
+
+
+def test_parser_uses_the_streamed_text():
+    content = make_docx("<w:p><w:r><w:t>Jane Doe</w:t></w:r></w:p>"
+                        "<w:p><w:r><w:t>Senior Python Engineer, 6 years</w:t></w:r></w:p>")
+    cv = CVParser.parse_bytes("jane.docx", content)
+    assert cv["name"] == "Jane Doe"
+    assert cv["skills"] == ["Python"]
+    assert cv["years_experience"] == 6
+
+
+def test_matches_python_docx():
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    run = document.add_paragraph().add_run("Lead engineer")
+    run.add_break()
+    run.add_text("Python, SQL")
+    table = document.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "MBA"
+    table.cell(0, 1).text = "State University"
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    # Table last, so python-docx's paragraphs-then-tables order matches document order
+    expected = "".join(p.text + "\n" for p in document.paragraphs) + "MBA\nState University\n"
+    assert extract_docx_text(io.BytesIO(buffer.getvalue())) == expected
+
+
+def test_non_docx_content_is_not_parsed():
+    assert CVParser.parse_bytes("broken.docx", b"not a zip file") == {}
@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from core.llm_provider import LLMProvider, clear_llm_registry
+from processors.simple_matcher import EnhancedMatcher
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+CV = {"name": "Ana", "email": "ana@example.com", "years_experience": 4,
+      "skills": ["Python", "SQL"], "soft_skills": ["Communication"], "experience": []}
+
+
+class StubProvider(LLMProvider):
+    provider_name = "stub"
+
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    def generate_text(self, prompt):
+        self.prompts.append(prompt)
+        return ""
+
+    def extract_json(self, prompt, schema=None):
+        self.prompts.append(prompt)
+        return self.response
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_llm_registry()
+    yield
+    clear_llm_registry()
+
+
+@pytest.fixture
+def company():
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_fused_mode_makes_one_call_per_candidate(company):
+    matcher = EnhancedMatcher(company, analysis_mode="fused", llm_provider="mock")
+    matcher.llm.reset_stats()
+
+    result = matcher.analyze_candidate(CV)
+    assert result["method"] == "ai_fused"
+    assert matcher.llm.stats()["calls"] == 1
+
+
+def test_missing_sections_fall_back_individually(company):
+    matcher = EnhancedMatcher(company, analysis_mode="fused", llm_provider="mock")
+    matcher.llm = StubProvider({"culture": {"score": 90, "aligned_values": ["Innovation"]},
+                                "feedback": "Strong fit"})
+
+    result = matcher.analyze_candidate(CV)
+    assert len(matcher.llm.prompts) == 1
+    assert result["method"] == "ai_fused"
+    assert result["feedback"] == "Strong fit"
+    assert result["culture_score"] == 90
+    assert result["culture_detail"]["aligned"] == ["Innovation"]
+    assert result["skills_detail"] == matcher._manual_skills_analysis(CV)
+
+
+def test_empty_response_falls_back_to_manual(company):
+    matcher = EnhancedMatcher(company, analysis_mode="fused", llm_provider="mock")
+    matcher.llm = StubProvider({})
+
+    assert matcher.analyze_candidate(CV)["method"] == "enhanced_manual"
+
+
+def test_unknown_mode_is_rejected(company):
+    with pytest.raises(ValueError):
+        EnhancedMatcher(company, analysis_mode="bogus", llm_provider="mock")
@@ -0,0 +1,43 @@
+import json
+import os
+
+import pytest
+
+from processors import job_runner
+from processors.job_runner import DONE, JobRunner, load_job, plain_result
+from processors.simple_matcher import MatchResult
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+CANDIDATES = [
+    {"name": "Ana", "years_experience": 6, "skills": ["Python", "SQL"], "soft_skills": ["Leadership"], "experience": []},
+    {"name": "Ben", "years_experience": 2, "skills": ["Java"], "soft_skills": ["Communication"], "experience": []},
+]
+
+
+@pytest.fixture
+def company():
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("provider", ["mock", None])
+def test_unopened_feedback_survives_persistence(tmp_path, company, monkeypatch, provider):
+    if provider is None:
+        # No LLM: manual analysis and manual feedback
+        monkeypatch.setattr("processors.simple_matcher.get_llm_instance", lambda *args: None)
+    runner = JobRunner(max_workers=1, persist_dir=str(tmp_path))
+    job_id = runner.submit(company, CANDIDATES, lazy_feedback=True, llm_provider=provider)
+    job = runner.get(job_id)
+    assert job.wait(30) and job.status == DONE
+
+    assert plain_result(job.ranked()[0])["feedback"] is None
+    job_runner._stored_jobs.clear()
+    stored = load_job(str(tmp_path), job_id)
+    result = stored.ranked()[0]
+    assert isinstance(result, MatchResult)
+    assert "feedback_source" not in result
+    assert result["feedback"]
+    assert result["feedback"] == job.ranked()[0]["feedback"]
+    assert "company_profile" not in stored.status_dict()
+    runner.shutdown()
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from utils.keyword_scanner import KeywordScanner
+
+
+def naive_scan(keywords, text):
+    return {keyword for keyword in keywords if keyword and keyword in text}
+
+
+def test_reports_overlapping_matches():
+    scanner = KeywordScanner(["java", "javascript", "sql"])
+    assert scanner.scan("senior javascript developer") == {"java", "javascript"}
+    assert scanner.scan("nosql") == {"sql"}
+    assert scanner.scan("") == set()
+
+
+def test_ignores_empty_and_duplicate_keywords():
+    scanner = KeywordScanner(["", "ai", "ai"])
+    assert scanner.keywords == ("ai",)
+    assert scanner.scan("maintain") == {"ai"}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_naive_substring_scan(seed):
+    rng = random.Random(seed)
+    alphabet = "abc"
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 15))]
+    scanner = KeywordScanner(keywords)
+
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet + " ") for _ in range(rng.randint(0, 40)))
+        assert scanner.scan(text) == naive_scan(keywords, text), (keywords, text)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+
+from core.llm_cache import CachedLLMProvider, LLMResponseCache
+from core.llm_provider import LLMProvider
+
+
+class CountingProvider(LLMProvider):
+    provider_name = "counting"
+    model = "count-1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_text(self, prompt: str) -> str:
+        self.calls += 1
+        return f"answer to {prompt}"
+
+    def extract_json(self, prompt: str, schema=None):
+        self.calls += 1
+        return {} if "fail" in prompt else {"prompt": prompt}
+
+
+@pytest.fixture
+def disk_path(tmp_path):
+    return str(tmp_path / "llm.sqlite")
+
+
+def test_repeated_prompt_is_served_from_memory():
+    provider = CountingProvider()
+    cached = CachedLLMProvider(provider, LLMResponseCache())
+
+    assert cached.generate_text("hello") == cached.generate_text("hello") == "answer to hello"
+    assert provider.calls == 1
+    stats = cached.cache.stats()
+    assert (stats["misses"], stats["memory_hits"], stats["writes"]) == (1, 1, 1)
+
+
+def test_key_separates_kind_and_schema():
+    provider = CountingProvider()
+    cached = CachedLLMProvider(provider, LLMResponseCache())
+
+    cached.generate_text("same")
+    cached.extract_json("same")
+    cached.extract_json("same", {"type": "object"})
+    assert provider.calls == 3
+
+
+def test_empty_json_is_not_cached():
+    provider = CountingProvider()
+    cached = CachedLLMProvider(provider, LLMResponseCache())
+
+    assert cached.extract_json("fail") == {}
+    assert cached.extract_json("fail") == {}
+    assert provider.calls == 2
+
+
+def test_disk_tier_survives_a_new_cache(disk_path):
+    first = CachedLLMProvider(CountingProvider(), LLMResponseCache(path=disk_path))
+    first.extract_json("profile")
+
+    provider = CountingProvider()
+    second = CachedLLMProvider(provider, LLMResponseCache(path=disk_path))
+    assert second.extract_json("profile") == {"prompt": "profile"}
+    assert provider.calls == 0
+    assert second.cache.stats()["disk_hits"] == 1
+
+    # Promoted to memory: the next lookup skips SQLite
+    second.extract_json("profile")
+    assert second.cache.stats()["memory_hits"] == 1
+
+
+def test_entries_expire_after_ttl(disk_path, monkeypatch):
+    provider = CountingProvider()
+    cached = CachedLLMProvider(provider, LLMResponseCache(path=disk_path, ttl_seconds=60))
+    cached.generate_text("hello")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    cached.generate_text("hello")
+    assert provider.calls == 2
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = LLMResponseCache(memory_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_async_calls_use_both_tiers(disk_path):
+    provider = CountingProvider()
+    cached = CachedLLMProvider(provider, LLMResponseCache(path=disk_path))
+
+    async def calls():
+        return [await cached.agenerate_text("hi"), await cached.agenerate_text("hi")]
+
+    assert asyncio.run(calls()) == ["answer to hi", "answer to hi"]
+    assert provider.calls == 1
+    assert LLMResponseCache(path=disk_path).disk.info()["entries"] == 1
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+from core.llm_cache import CachedLLMProvider
+from core.llm_provider import clear_llm_registry, get_llm
+from utils.event_loop import get_background_loop, run_sync
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_llm_registry()
+    yield
+    clear_llm_registry()
+
+
+def test_cached_and_uncached_share_one_provider():
+    plain = get_llm("mock", None, use_cache=False)
+    cached = get_llm("mock", None, use_cache=True)
+    assert isinstance(cached, CachedLLMProvider)
+    assert cached.provider is plain
+
+
+def test_run_sync_reuses_one_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is run_sync(current_loop()) is get_background_loop()
+
+
+def test_registry_is_keyed_on_provider_key_and_model():
+    default = get_llm("mock", None, use_cache=False)
+    assert get_llm("mock", None, use_cache=False) is default
+    assert get_llm("mock", "other-key", use_cache=False) is not default
+    other_model = get_llm("mock", None, model="mock-2", use_cache=False)
+    assert other_model is not default and other_model.model == "mock-2"
+
+    clear_llm_registry()
+    assert get_llm("mock", None, use_cache=False) is not default
+
+
+def test_unknown_provider_is_rejected():
+    with pytest.raises(ValueError):
+        get_llm("nope", None)
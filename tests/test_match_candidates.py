@@ -0,0 +1,30 @@
+import asyncio
+import json
+import os
+
+from processors.simple_matcher import match_candidates
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+CANDIDATES = [
+    {"name": "Ana", "skills": ["Python", "SQL"], "soft_skills": ["Communication"], "experience": []},
+    {"name": "Ben", "skills": ["Java"], "soft_skills": ["Leadership"], "experience": []},
+]
+
+
+def load_company():
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_match_candidates_without_loop():
+    results = match_candidates(load_company(), CANDIDATES, llm_provider="mock")
+    assert [r["rank"] for r in results] == [1, 2]
+
+
+def test_match_candidates_inside_running_loop():
+    async def caller():
+        return match_candidates(load_company(), CANDIDATES, llm_provider="mock")
+
+    results = asyncio.run(caller())
+    assert len(results) == 2
@@ -0,0 +1,58 @@
+import json
+import pickle
+
+from processors.simple_matcher import MatchResult
+
+
+def make_result(calls):
+    def load():
+        calls.append(1)
+        return "Dear candidate"
+    return MatchResult({"name": "Ana", "overall_score": 80, "feedback": None}, feedback_loader=load)
+
+
+def test_pending_feedback_is_not_in_dict_storage():
+    result = make_result([])
+    assert not result.feedback_ready
+    assert "feedback" not in dict(dict.items(result))
+    assert "feedback" in result
+    assert len(result) == 3
+
+
+def test_copies_resolve_feedback():
+    for copy in (lambda r: dict(r), lambda r: {**r}, lambda r: r.to_dict(),
+                 lambda r: pickle.loads(pickle.dumps(r))):
+        calls = []
+        data = copy(make_result(calls))
+        assert type(data) is dict
+        assert data["feedback"] == "Dear candidate"
+        assert calls == [1]
+
+
+def test_json_dumps_resolves_feedback():
+    data = json.loads(json.dumps(make_result([])))
+    assert data == {"name": "Ana", "overall_score": 80, "feedback": "Dear candidate"}
+
+
+def test_feedback_is_generated_once():
+    calls = []
+    result = make_result(calls)
+    assert result["feedback"] == "Dear candidate"
+    assert result.get("feedback") == "Dear candidate"
+    assert result.feedback_ready
+    assert calls == [1]
+
+
+def test_setting_feedback_drops_loader():
+    calls = []
+    result = make_result(calls)
+    result["feedback"] = "Manual"
+    assert result.feedback_ready
+    assert dict(result)["feedback"] == "Manual"
+    assert calls == []
+
+
+def test_repr_never_shows_sentinel():
+    result = make_result([])
+    assert "object at" not in repr(result)
+    assert result == {"name": "Ana", "overall_score": 80}
@@ -0,0 +1,43 @@
+import pytest
+
+from core.config import settings
+from core.llm_provider import MockLLMError, MockProvider, MockRateLimitError, clear_llm_registry, get_llm
+
+
+@pytest.fixture
+def faulty_mock(monkeypatch):
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(settings, "mock_latency_distribution", "fixed")
+    monkeypatch.setattr(settings, "mock_latency_ms", 1.0)
+    monkeypatch.setattr(settings, "mock_error_rate", 0.3)
+    monkeypatch.setattr(settings, "mock_rate_limit_rate", 0.2)
+    monkeypatch.setattr(settings, "mock_seed", 7)
+    clear_llm_registry()
+    yield get_llm("mock", None)
+    clear_llm_registry()
+
+
+def test_mock_bypasses_response_cache(faulty_mock):
+    assert isinstance(faulty_mock, MockProvider)
+
+
+def test_repeated_calls_still_draw_latency_and_errors(faulty_mock):
+    responses = set()
+    for _ in range(50):
+        try:
+            responses.add(faulty_mock.generate_text("Summarize this candidate"))
+        except (MockLLMError, MockRateLimitError):
+            pass
+
+    stats = faulty_mock.stats()
+    assert stats["calls"] == 50
+    assert stats["errors"] > 0
+    assert stats["rate_limited"] > 0
+    assert stats["latency_seconds"] > 0
+    # Deterministic per prompt
+    assert len(responses) == 1
+
+
+def test_cached_mock_still_reports_stats(faulty_mock):
+    provider = get_llm("mock", None, use_cache=True)
+    assert provider.stats()["calls"] == 0
@@ -0,0 +1,84 @@
+import io
+
+import pytest
+
+from core.config import settings
+from processors import pdf_backends
+from processors.pdf_backends import DEFAULT_BACKEND, PROBE_CHUNK_SIZE, PDFBackend, get_pdf_backend, has_text_layer
+from processors.pdf_benchmark import iter_pdfs, main, run_benchmark
+
+
+class TextBackend(PDFBackend):
+    name = "text"
+
+    def iter_pages(self, stream, max_pages=None):
+        yield stream.read().decode("latin-1")
+
+
+class FirstWordBackend(PDFBackend):
+    name = "first-word"
+
+    def iter_pages(self, stream, max_pages=None):
+        yield stream.read().decode("latin-1").split()[0]
+
+
+class MissingBackend(PDFBackend):
+    name = "missing"
+    module = "no_such_pdf_library"
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    for backend in (TextBackend, FirstWordBackend, MissingBackend):
+        monkeypatch.setitem(pdf_backends.BACKENDS, backend.name, backend)
+    monkeypatch.setattr(pdf_backends, "_instances", {})
+
+
+def test_backends_are_reused_per_name():
+    assert isinstance(get_pdf_backend("TEXT"), TextBackend)
+    assert get_pdf_backend("text") is get_pdf_backend("text")
+
+
+def test_configured_backend_is_the_default(monkeypatch):
+    monkeypatch.setattr(settings, "pdf_backend", "first-word")
+    assert isinstance(get_pdf_backend(), FirstWordBackend)
+
+
+@pytest.mark.parametrize("name", ["unknown", "missing"])
+def test_unknown_or_missing_backend_falls_back(name):
+    assert get_pdf_backend(name).name == DEFAULT_BACKEND
+
+
+def test_text_layer_probe_sees_markers_across_chunks():
+    split = b"x" * (PROBE_CHUNK_SIZE - 3) + b"/Font" + b"x" * 10
+    stream = io.BytesIO(split)
+    stream.seek(5)
+    assert has_text_layer(stream)
+    assert stream.tell() == 5
+
+    assert has_text_layer(io.BytesIO(b"x" * PROBE_CHUNK_SIZE + b"/ObjStm"))
+    assert not has_text_layer(io.BytesIO(b"x" * (PROBE_CHUNK_SIZE * 2)))
+
+
+def test_benchmark_compares_against_the_reference(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"python sql lead engineer")
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.PDF").write_bytes(b"aws kubernetes")
+    (tmp_path / "notes.txt").write_bytes(b"ignored")
+
+    paths = iter_pdfs(str(tmp_path))
+    assert [path.rsplit("/", 1)[-1] for path in paths] == ["a.pdf", "b.PDF"]
+
+    report = run_benchmark(paths, ["text", "first-word"], reference="text")
+    assert report["text"]["files"] == 2 and report["text"]["failed"] == 0
+    assert report["text"]["char_ratio"] is None
+    assert report["first-word"]["char_ratio"] == round((6 / 24 + 3 / 14) / 2, 3)
+    assert report["first-word"]["token_jaccard"] == round((1 / 4 + 1 / 2) / 2, 3)
+    assert report["first-word"]["skills_agreement"] == 0.5
+
+
+def test_benchmark_cli_rejects_unknown_backends(tmp_path, capsys):
+    assert main([str(tmp_path), "--backends", "nope"]) == 2
+    assert "Unknown backend" in capsys.readouterr().err
+    assert main([str(tmp_path), "--backends", "text"]) == 1
+
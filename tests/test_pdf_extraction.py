@@ -0,0 +1,98 @@
+import io
+
+import pytest
+
+from core.config import settings
+from processors import pdf_backends
+from processors.cv_parser import CVParser
+from processors.pdf_backends import PDFBackend
+
+
+def make_pdf(pages):
+    """Minimal PDF with one Helvetica text line per page"""
+    n = len(pages)
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>",
+               "<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join("%d 0 R" % (4 + 2 * i) for i in range(n)), n),
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    for i, text in enumerate(pages):
+        stream = "BT /F1 12 Tf 72 720 Td (%s) Tj ET" % text
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                       "/Resources << /Font << /F1 3 0 R >> >> >>" % (5 + 2 * i))
+        objects.append("<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body.encode("latin-1")))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+class CountingBackend(PDFBackend):
+    """Serves fixed pages and records how many were pulled"""
+
+    name = "counting"
+    pages = ["a" * 10, "b" * 10, "c" * 10, "d" * 10]
+
+    def __init__(self):
+        self.pulled = 0
+
+    def iter_pages(self, stream, max_pages=None):
+        for page_number, page in enumerate(self.pages):
+            if max_pages and page_number >= max_pages:
+                break
+            self.pulled += 1
+            yield page
+
+
+@pytest.fixture
+def counting(monkeypatch):
+    monkeypatch.setitem(pdf_backends.BACKENDS, CountingBackend.name, CountingBackend)
+    monkeypatch.setattr(pdf_backends, "_instances", {})
+    return pdf_backends.get_pdf_backend(CountingBackend.name)
+
+
+PDF_WITH_FONT = b"%PDF-1.4\n<< /Type /Font >>\n%%EOF\n"
+
+
+def test_page_budget(counting):
+    text = CVParser.extract_pdf_text(None, PDF_WITH_FONT, max_pages=2, max_chars=0, backend="counting")
+    assert text == "a" * 10 + "b" * 10
+    assert counting.pulled == 2
+
+
+def test_char_budget_stops_extraction_early(counting):
+    text = CVParser.extract_pdf_text(None, PDF_WITH_FONT, max_pages=0, max_chars=15, backend="counting")
+    assert text == "a" * 10 + "b" * 5
+    assert counting.pulled == 2
+
+
+def test_budgets_default_to_settings(counting, monkeypatch):
+    monkeypatch.setattr(settings, "pdf_max_pages", 3)
+    monkeypatch.setattr(settings, "pdf_max_chars", 0)
+    assert len(CVParser.extract_pdf_text(None, PDF_WITH_FONT, backend="counting")) == 30
+
+
+def test_pdf_without_text_layer_is_skipped(counting):
+    scanned = b"%PDF-1.4\n<< /Type /XObject /Subtype /Image >>\n%%EOF\n"
+    assert CVParser.extract_pdf_text(None, scanned, backend="counting") == ""
+    assert counting.pulled == 0
+
+
+def test_pypdf2_extracts_within_budget():
+    pytest.importorskip("PyPDF2")
+    content = make_pdf(["Jane Doe", "Python engineer", "Page three"])
+
+    assert CVParser.extract_pdf_text(None, content, max_pages=0, max_chars=0, backend="pypdf2") == \
+        "Jane DoePython engineerPage three"
+    assert CVParser.extract_pdf_text(None, content, max_pages=2, max_chars=0, backend="pypdf2") == \
+        "Jane DoePython engineer"
+    # Pages are joined as-is, as the original PyPDF2 loop did
+    assert CVParser.parse_bytes("jane.pdf", content) == \
+        CVParser._extract_structured_data("Jane DoePython engineerPage three")
@@ -0,0 +1,30 @@
+from core.config import settings
+from processors.job_runner import results_key
+
+COMPANY = {"company_name": "Acme", "values": ["Ownership"], "created_at": "2024-01-01T00:00:00"}
+CVS = [{"name": "Ana", "skills": ["Python"]}]
+
+
+def test_same_inputs_reuse_the_key():
+    assert results_key(COMPANY, CVS) == results_key(dict(COMPANY), [dict(CVS[0])])
+
+
+def test_profile_timestamp_is_ignored():
+    resaved = dict(COMPANY, created_at="2025-06-30T12:00:00")
+    assert results_key(resaved, CVS) == results_key(COMPANY, CVS)
+
+
+def test_changed_inputs_change_the_key():
+    key = results_key(COMPANY, CVS)
+    assert results_key(dict(COMPANY, values=["Speed"]), CVS) != key
+    assert results_key(COMPANY, CVS + [{"name": "Ben"}]) != key
+    assert results_key(None, CVS) != key
+
+
+def test_provider_settings_change_the_key(monkeypatch):
+    key = results_key(COMPANY, CVS)
+    monkeypatch.setattr(settings, "analysis_mode", "fused" if settings.analysis_mode != "fused" else "multi")
+    assert results_key(COMPANY, CVS) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(settings, "shortlist_size", settings.shortlist_size + 10)
+    assert results_key(COMPANY, CVS) != key
@@ -0,0 +1,58 @@
+import json
+import os
+
+import main
+from processors.stream_scoring import ScoreSummary
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+
+def write_cvs(directory, count):
+    for i in range(count):
+        (directory / f"cv{i}.txt").write_text(f"Person {i}\np{i}@example.com\n{i} years python sql\nSenior Engineer\n")
+    (directory / "broken.json").write_text("{not json")
+
+
+def run_score(tmp_path, *extra):
+    cvs = tmp_path / "cvs"
+    cvs.mkdir()
+    write_cvs(cvs, 5)
+    out = tmp_path / "results.jsonl"
+    code = main.main(["score", "--company", COMPANY_PATH, "--cvs", str(cvs), "--out", str(out),
+                      "--provider", "mock", "--workers", "0", *extra])
+    return code, [json.loads(line) for line in out.read_text().splitlines()]
+
+
+def test_score_writes_one_jsonl_record_per_file(tmp_path):
+    code, records = run_score(tmp_path)
+    assert code == 0
+    assert len(records) == 6
+    ok = [r for r in records if r["ok"]]
+    assert sorted(r["name"] for r in ok) == [f"Person {i}" for i in range(5)]
+    assert all("overall_score" in r and "feedback" not in r for r in ok)
+    failed = [r for r in records if not r["ok"]]
+    assert [r["file"].endswith("broken.json") for r in failed] == [True]
+
+
+def test_score_with_feedback(tmp_path):
+    code, records = run_score(tmp_path, "--feedback")
+    assert code == 0
+    assert all(r["feedback"] for r in records if r["ok"])
+
+
+def test_score_top_zero(tmp_path, capsys):
+    code, records = run_score(tmp_path, "--top", "0")
+    assert code == 0
+    assert len(records) == 6
+    assert "Top candidates" not in capsys.readouterr().err
+
+
+def test_summary_keeps_top_k():
+    summary = ScoreSummary(top_k=2)
+    for score in (10, 50, 30, 50):
+        summary.add({"ok": True, "overall_score": score, "name": str(score), "file": f"{score}.txt"})
+    summary.add({"ok": False})
+    data = summary.to_dict()
+    assert (data["scored"], data["failed"]) == (4, 1)
+    assert [entry["overall_score"] for entry in data["top"]] == [50, 50]
+    assert ScoreSummary(top_k=0).top() == []
@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+from core.llm_provider import clear_llm_registry, get_llm
+from processors.simple_matcher import match_candidates, select_shortlist
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+
+def cv(name, n_skills):
+    return {"name": name, "email": f"{name.lower()}@example.com", "years_experience": 2,
+            "skills": [f"Skill{i}" for i in range(n_skills)], "soft_skills": [], "experience": []}
+
+
+CANDIDATES = [cv("Ana", 1), cv("Ben", 5), cv("Cleo", 3), cv("Dan", 0), cv("Eve", 5)]
+
+
+@pytest.fixture
+def company():
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def mock_llm():
+    clear_llm_registry()
+    llm = get_llm("mock", None)
+    llm.reset_stats()
+    yield llm
+    clear_llm_registry()
+
+
+def test_select_shortlist_orders_by_score_then_input():
+    scores = [70, 90, 80, 40, 90]
+    assert select_shortlist(scores, size=3) == [1, 4, 2]
+    assert select_shortlist(scores, min_score=75) == [1, 4, 2]
+    assert select_shortlist(scores, size=5, min_score=80) == [1, 4, 2]
+    assert select_shortlist(scores, size=0) == []
+
+
+def test_only_the_shortlist_reaches_the_llm(company, mock_llm):
+    results = match_candidates(company, CANDIDATES, analysis_mode="fused", shortlist_size=2, llm_provider="mock")
+
+    assert mock_llm.stats()["calls"] == 2
+    assert [r["tier"] for r in results] == ["shortlist", "shortlist", "screened", "screened", "screened"]
+    assert {r["name"] for r in results[:2]} == {"Ben", "Eve"}
+    assert [r["name"] for r in results[2:]] == ["Cleo", "Ana", "Dan"]
+    assert [r["rank"] for r in results] == [1, 2, 3, 4, 5]
+
+
+def test_progress_counts_screening_and_shortlist_calls(company, mock_llm):
+    calls = []
+    match_candidates(company, CANDIDATES, analysis_mode="fused", shortlist_size=2, llm_provider="mock",
+                     on_result=lambda position, analysis, expected: calls.append((position, expected)))
+
+    assert len(calls) == 7
+    assert {expected for _, expected in calls} == {7}
+    assert [position for position, _ in calls[:5]] == [0, 1, 2, 3, 4]
+    assert sorted(position for position, _ in calls[5:]) == [1, 4]
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+from core.llm_provider import LLMProvider
+from processors.simple_matcher import EnhancedMatcher
+from utils.stage_graph import StageGraph
+
+COMPANY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "sample_companies", "tech_startup.json")
+
+
+def boom(**kwargs):
+    raise RuntimeError("stage failed")
+
+
+def build(skills=lambda: "skills", skills_fallback=None):
+    graph = StageGraph()
+    graph.add("skills", skills, fallback=skills_fallback)
+    graph.add("culture", lambda: "culture")
+    graph.add("feedback", lambda skills, culture: f"{skills}+{culture}", depends_on=("skills", "culture"))
+    return graph
+
+
+def test_dependencies_receive_results():
+    assert build().run() == {"skills": "skills", "culture": "culture", "feedback": "skills+culture"}
+
+
+def test_fallback_replaces_a_failed_stage():
+    graph = build(skills=boom, skills_fallback=lambda: "manual skills")
+    assert graph.run()["feedback"] == "manual skills+culture"
+
+
+def test_fallback_gets_the_dependency_results():
+    graph = StageGraph()
+    graph.add("skills", lambda: "skills")
+    graph.add("feedback", boom, depends_on=("skills",), fallback=lambda skills: f"manual {skills}")
+    assert graph.run()["feedback"] == "manual skills"
+
+
+def test_failure_without_fallback_propagates():
+    with pytest.raises(RuntimeError):
+        build(skills=boom).run()
+
+
+def test_async_run_uses_fallbacks():
+    async def failing():
+        raise RuntimeError("stage failed")
+
+    async def culture():
+        return "culture"
+
+    graph = StageGraph()
+    graph.add("skills", failing, fallback=lambda: "manual skills")
+    graph.add("culture", culture)
+    graph.add("feedback", lambda skills, culture: f"{skills}+{culture}", depends_on=("skills", "culture"))
+    assert asyncio.run(graph.arun())["feedback"] == "manual skills+culture"
+
+
+def test_async_failure_without_fallback_propagates():
+    with pytest.raises(RuntimeError):
+        asyncio.run(build(skills=boom).arun())
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet():
+        barrier.wait()
+        return True
+
+    graph = StageGraph().add("a", meet).add("b", meet)
+    assert graph.run() == {"a": True, "b": True}
+
+
+def test_rejects_unknown_dependencies_cycles_and_duplicates():
+    with pytest.raises(ValueError):
+        StageGraph().add("a", lambda b: b, depends_on=("b",)).run()
+    with pytest.raises(ValueError):
+        StageGraph().add("a", lambda b: b, depends_on=("b",)).add("b", lambda a: a, depends_on=("a",)).run()
+    with pytest.raises(ValueError):
+        StageGraph().add("a", lambda: 1).add("a", lambda: 2)
+
+
+def test_matcher_stages_fall_back_to_manual_analysis():
+    class FailingProvider(LLMProvider):
+        provider_name = "failing"
+
+        def generate_text(self, prompt):
+            raise RuntimeError("provider down")
+
+        def extract_json(self, prompt, schema=None):
+            raise RuntimeError("provider down")
+
+    with open(COMPANY_PATH, "r", encoding="utf-8") as f:
+        company = json.load(f)
+    cv = {"name": "Ana", "skills": ["Python"], "soft_skills": ["Communication"], "experience": []}
+
+    matcher = EnhancedMatcher(company, lazy_feedback=False, llm_provider="mock")
+    matcher.llm = FailingProvider()
+    result = matcher._ai_analysis(cv)
+
+    assert result["method"] == "ai"
+    assert result["skills_detail"] == matcher._manual_skills_analysis(cv)
+    assert result["soft_skills_detail"] == matcher._manual_soft_skills_analysis(cv)
+    assert result["feedback"]
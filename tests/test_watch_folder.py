@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from processors.candidate_store import CandidateStore
+from processors.watch_folder import FolderWatcher
+
+
+def write_cv(directory, name, person):
+    path = directory / name
+    path.write_text(f"{person}\n{person.split()[0].lower()}@example.com\n5 years python\n")
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandidateStore(str(tmp_path / "pool"))
+
+
+def watcher_for(tmp_path, store, directory):
+    return FolderWatcher(str(directory), store=store, manifest_path=str(tmp_path / "manifest.sqlite"),
+                         max_workers=0)
+
+
+def test_manifest_diffing(tmp_path, store):
+    folder = tmp_path / "drop"
+    folder.mkdir()
+    ana = write_cv(folder, "ana.txt", "Ana Silva")
+    ben = write_cv(folder, "ben.txt", "Ben Okafor")
+    watcher = watcher_for(tmp_path, store, folder)
+
+    first = watcher.sync()
+    assert (first["added"], first["parsed"]) == (2, 2)
+    assert len(store) == 2
+
+    # Nothing changed: nothing parsed
+    again = watcher.sync()
+    assert (again["added"], again["changed"], again["removed"], again["unchanged"]) == (0, 0, 0, 2)
+
+    # Touched but identical content: not re-parsed
+    os.utime(ana, ns=(1, 1))
+    touched = watcher.sync()
+    assert (touched["changed"], touched["parsed"], touched["unchanged"]) == (0, 0, 2)
+
+    # Edited: replaces the stored version
+    write_cv(folder, "ben.txt", "Benjamin Okafor")
+    edited = watcher.sync()
+    assert (edited["changed"], edited["parsed"]) == (1, 1)
+    assert sorted(cv["name"] for cv in store.candidates()) == ["Ana Silva", "Benjamin Okafor"]
+
+    # Deleted: tombstoned
+    ben.unlink()
+    removed = watcher.sync()
+    assert removed["removed"] == 1
+    assert [cv["name"] for cv in store.candidates()] == ["Ana Silva"]
+    watcher.close()
+
+
+def test_two_folders_with_the_same_file_name(tmp_path, store):
+    first_dir, second_dir = tmp_path / "a", tmp_path / "b"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    first_cv = write_cv(first_dir, "cv.txt", "Ana Silva")
+    write_cv(second_dir, "cv.txt", "Ben Okafor")
+
+    first = watcher_for(tmp_path, store, first_dir)
+    second = watcher_for(tmp_path, store, second_dir)
+    first.sync()
+    second.sync()
+    assert sorted(cv["name"] for cv in store.candidates()) == ["Ana Silva", "Ben Okafor"]
+
+    first_cv.unlink()
+    first.sync()
+    assert [cv["name"] for cv in store.candidates()] == ["Ben Okafor"]
+    first.close()
+    second.close()
@@ -3,10 +3,19 @@
 import streamlit as st
 from core.config import settings
 from core.llm_provider import get_llm
-from processors.cv_parser import parse_cv_streamlit
+from processors.archive_ingest import count_archive_members, expand_archives, is_archive
+from processors.bulk_ingest import parse_many
+from processors.candidate_store import get_candidate_store
+from processors.job_runner import DONE, get_job_runner, results_key
+from utils.cache import LRUCache
 import json
+import os
+import time
 from datetime import datetime
 
+# Seconds between refreshes while a matching job is running
+JOB_POLL_SECONDS = 1.0
+
 # Page config
 st.set_page_config(
     page_title="Inter-Sight",
@@ -57,13 +66,21 @@ def get_llm_instance():
         st.error(f"Failed to initialize LLM: {e}")
         return None
 
+# Matching job ids shared across sessions, keyed by results_key()
+@st.cache_resource
+def get_results_cache():
+    return LRUCache(max_entries=32)
+
 # Initialize session state
 if "company" not in st.session_state:
     st.session_state.company = None
 if "cvs" not in st.session_state:
     st.session_state.cvs = []
-if "results" not in st.session_state:
-    st.session_state.results = None
+if "job_id" not in st.session_state:
+    # The job id lives in the URL, so a browser refresh reconnects to the running job
+    st.session_state.job_id = (st.experimental_get_query_params().get("job") or [None])[0]
+if "results_key" not in st.session_state:
+    st.session_state.results_key = None
 
 # Header
 st.markdown("<div class='title-gradient'>🎯 Inter-Sight</div>", unsafe_allow_html=True)
@@ -134,13 +151,13 @@ with tab2:
         
         with col1:
             st.subheader("Upload CV Files")
-            st.markdown("**Accepted formats:** PDF, DOCX, TXT, JSON")
+            st.markdown("**Accepted formats:** PDF, DOCX, TXT, JSON, or ZIP/TAR archives of them")
             
             uploaded_files = st.file_uploader(
                 "Choose CV files",
-                type=["pdf", "docx", "doc", "txt", "json"],
+                type=["pdf", "docx", "doc", "txt", "json", "zip", "tar", "gz", "tgz"],
                 accept_multiple_files=True,
-                help="Upload CV files in any format (PDF, Word, TXT, JSON)"
+                help="Upload CV files in any format (PDF, Word, TXT, JSON), or an archive exported from your ATS"
             )
             
             if uploaded_files:
@@ -153,29 +170,62 @@ with tab2:
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    for idx, file in enumerate(files_list):
-                        try:
-                            status_text.text(f"Processing {file.name}...")
-                            cv_data = parse_cv_streamlit(file)
-                            
-                            if cv_data and "name" in cv_data:
-                                st.session_state.cvs.append(cv_data)
-                                st.success(f"✅ {file.name} - Extracted: {cv_data.get('name', 'Unknown')}")
-                            else:
-                                st.warning(f"⚠️ {file.name} - Could not parse")
-                        except Exception as e:
-                            st.error(f"❌ Error loading {file.name}: {e}")
+                    # Parse in parallel across worker processes, in upload order;
+                    # archives are streamed member by member, never unpacked to disk
+                    uploads = [(file.name, file.getvalue()) for file in files_list]
+                    total = 0
+                    for name, content in uploads:
+                        count = count_archive_members(content, name) if is_archive(name) else 1
+                        total = None if count is None or total is None else total + count
+                    workers = settings.ingest_workers or os.cpu_count() or 1
+                    results = parse_many(
+                        expand_archives(uploads),
+                        max_workers=min(total, workers) if total else workers,
+                        timeout=settings.ingest_timeout_seconds
+                    )
+                    
+                    # CVs of this upload and their file names, for the talent pool
+                    parsed, sources = [], []
+                    for idx, result in enumerate(results):
+                        status_text.text(f"Processed {result.name}...")
                         
-                        progress_bar.progress((idx + 1) / len(files_list))
+                        if result.ok and "name" in result.data:
+                            st.session_state.cvs.append(result.data)
+                            parsed.append(result.data)
+                            sources.append(result.name)
+                            st.success(f"✅ {result.name} - Extracted: {result.data.get('name', 'Unknown')}")
+                        elif result.error == "Could not parse" or result.ok:
+                            st.warning(f"⚠️ {result.name} - Could not parse")
+                        else:
+                            st.error(f"❌ Error loading {result.name}: {result.error}")
+                        
+                        if total:
+                            progress_bar.progress(min(1.0, (idx + 1) / total))
                     
                     status_text.empty()
                     progress_bar.empty()
                     
                     if st.session_state.cvs:
+                        store = get_candidate_store()
+                        if store is not None and parsed:
+                            try:
+                                store.append(parsed, sources=sources)
+                            except Exception as e:
+                                st.warning(f"⚠️ Could not save CVs to the talent pool: {e}")
                         st.success(f"✅ Successfully loaded {len(st.session_state.cvs)} CVs")
                         st.balloons()
         
         with col2:
+            store = get_candidate_store()
+            if store is not None:
+                st.subheader("Talent Pool")
+                pool_size = len(store)
+                st.write(f"📚 {pool_size} candidate(s) from previous uploads")
+                min_years = st.number_input("Minimum years of experience", min_value=0, value=0, step=1)
+                if st.button("📚 Load Talent Pool", use_container_width=True, disabled=pool_size == 0):
+                    st.session_state.cvs = store.candidates(min_years=min_years or None)
+                    st.success(f"✅ Loaded {len(st.session_state.cvs)} CVs from the talent pool")
+            
             st.subheader("Sample CVs")
             if st.button("📋 Load Sample CVs", use_container_width=True):
                 # Load sample data
@@ -222,22 +272,55 @@ with tab2:
 with tab3:
     st.header("Results & Intelligent Matching")
     
-    if not st.session_state.company:
+    runner = get_job_runner()
+    job = runner.get(st.session_state.job_id) if st.session_state.job_id else None
+    poll_job = False
+    
+    if job is None and not st.session_state.company:
         st.info("👈 Create company profile first")
-    elif not st.session_state.cvs:
+    elif job is None and not st.session_state.cvs:
         st.info("👈 Upload CVs first")
     else:
-        st.success(f"✅ Analyzing {len(st.session_state.cvs)} candidates with AI...")
-        
-        # Run intelligent matching
+        # Matching runs as a background job; a new one is submitted only when
+        # inputs change or on explicit request, and this page polls its progress
         try:
-            from processors.simple_matcher import match_candidates
+            if st.session_state.company and st.session_state.cvs:
+                key = results_key(st.session_state.company, st.session_state.cvs)
+                results_cache = get_results_cache()
+                reanalyze = st.button("🔄 Re-analyze", help="Run the matching again for the current inputs")
+                
+                if reanalyze or job is None or st.session_state.results_key != key:
+                    job_id = None if reanalyze else results_cache.get(key)
+                    job = runner.get(job_id) if job_id else None
+                    
+                    if job is None or (job.finished and job.status != DONE):
+                        job_id = runner.submit(
+                            st.session_state.company,
+                            st.session_state.cvs,
+                            key=key,
+                            analysis_mode=settings.analysis_mode,
+                            shortlist_size=settings.shortlist_size or None,
+                            lazy_feedback=settings.lazy_feedback,
+                            dedup=settings.dedup_enabled,
+                            dedup_threshold=settings.dedup_threshold
+                        )
+                        results_cache.set(key, job_id)
+                        job = runner.get(job_id)
+                    
+                    st.session_state.job_id = job_id
+                    st.session_state.results_key = key
+                    st.experimental_set_query_params(job=job_id)
             
-            st.success(f"🤖 Running AI analysis on {len(st.session_state.cvs)} candidates...")
+            if job.finished and job.status != DONE:
+                raise RuntimeError(job.error or f"Matching job {job.status}")
             
-            ranked = match_candidates(st.session_state.company, st.session_state.cvs)
+            ranked = job.ranked()
+            if job.finished:
+                st.success(f"✅ Analyzed {len(ranked)} candidates")
+            else:
+                st.progress(job.progress, text=f"🤖 Running AI analysis... {job.completed}/{job.expected} done")
             
-            st.markdown("### 🏆 Ranked Candidates")
+            st.markdown("### 🏆 Ranked Candidates" if job.finished else "### ⏳ Ranking So Far")
             
             for candidate in ranked:
                 col1, col2, col3 = st.columns([1, 3, 1])
@@ -254,6 +337,9 @@ with tab3:
                 with col2:
                     st.markdown(f"### #{candidate.get('rank')} - {candidate.get('name')}")
                     st.write(candidate.get('ranking'))
+                    if candidate.get("duplicates"):
+                        names = ", ".join(d["name"] or "Unknown" for d in candidate["duplicates"])
+                        st.caption(f"🗂️ Also applied with {len(candidate['duplicates'])} near-duplicate CV(s): {names}")
                 
                 with col3:
                     if st.button("👁️ Details", key=f"details_{candidate.get('name')}"):
@@ -273,6 +359,8 @@ with tab3:
                         
                         st.write("**Feedback:**")
                         st.write(candidate.get('feedback'))
+            
+            poll_job = not job.finished
 
         except Exception as e:
             st.error(f"Error: {str(e)}")
@@ -301,3 +389,8 @@ with tab3:
 st.markdown("---")
 st.markdown("🚀 **Inter-Sight** - Intelligent feedback for smarter hiring")
 st.markdown(f"*Version 1.0 | Built for Hack-Nation 2025*")
+
+# Re-run once the page is drawn to pick up the job's newest results
+if poll_job:
+    time.sleep(JOB_POLL_SECONDS)
+    st.rerun()
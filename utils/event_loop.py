@@ -0,0 +1,54 @@
+"""Background Event Loop - one long-lived asyncio loop for blocking callers"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop running on a daemon thread
+
+    Async SDK clients are bound to the loop that created them, so running
+    every blocking entry point on this one loop lets them be created once
+    and reused, instead of leaking a client per asyncio.run() call.
+    """
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-loop", daemon=True)
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """
+    Run a coroutine on the background loop and block until it finishes
+
+    Works from any thread, including one with its own running loop (that
+    loop is blocked meanwhile - async code should await the coroutine).
+    If the caller is interrupted (e.g. Ctrl-C) the coroutine is cancelled.
+    """
+    loop = get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync called from the background loop; await the coroutine instead")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
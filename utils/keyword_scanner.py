@@ -0,0 +1,76 @@
+"""Keyword Scanner - Aho-Corasick multi-pattern substring matching"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordScanner:
+    """
+    Find every keyword occurring in a text in a single pass
+
+    Builds an Aho-Corasick automaton once; scanning is linear in the text
+    length regardless of how many keywords are registered, and reports
+    overlapping matches (e.g. both "java" and "javascript").
+
+    Example:
+        scanner = KeywordScanner(["java", "javascript", "sql"])
+        scanner.scan("senior javascript developer")  # {"java", "javascript"}
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._build()
+
+    def _build(self):
+        # Trie of all keywords
+        for keyword in self.keywords:
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = nxt
+            self._output[state] = self._output[state] + (keyword,)
+
+        # Breadth-first failure links; outputs inherit along them
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._output[self._fail[nxt]]:
+                    self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def scan(self, text: str) -> Set[str]:
+        """Set of keywords that occur in text (case-sensitive)"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        root = goto[0]
+
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            if state == 0:
+                state = root.get(ch, 0)
+            else:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return found
@@ -0,0 +1,138 @@
+"""Stage Graph - run independent pipeline stages concurrently"""
+
+import asyncio
+import inspect
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """A named unit of work with dependencies and an optional fallback"""
+
+    def __init__(self, name: str, func: Callable, depends_on: Iterable[str] = (),
+                 fallback: Optional[Callable] = None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.fallback = fallback
+
+
+class StageGraph:
+    """
+    Small DAG executor for per-candidate analysis stages
+
+    Each stage is called with the results of its dependencies as keyword
+    arguments. Stages whose dependencies are satisfied run concurrently,
+    either on a thread pool (run) or as asyncio tasks (arun). If a stage
+    raises, its fallback is called with the same arguments instead.
+
+    Example:
+        graph = StageGraph()
+        graph.add("skills", analyze_skills)
+        graph.add("culture", analyze_culture)
+        graph.add("feedback", write_feedback, depends_on=("skills", "culture"))
+        results = graph.run()
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: Callable, depends_on: Iterable[str] = (),
+            fallback: Optional[Callable] = None) -> "StageGraph":
+        """Register a stage (returns self for chaining)"""
+        if name in self._stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self._stages[name] = Stage(name, func, depends_on, fallback)
+        return self
+
+    def run(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Execute the graph on a thread pool and return results by stage name"""
+        order = self._topological_order()
+        results: Dict[str, Any] = {}
+        pending = list(order)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(order) or 1) as executor:
+            while pending or running:
+                for stage in [s for s in pending if all(d in results for d in s.depends_on)]:
+                    pending.remove(stage)
+                    kwargs = {d: results[d] for d in stage.depends_on}
+                    running[executor.submit(self._call, stage, kwargs)] = stage
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    results[stage.name] = future.result()
+
+        return results
+
+    async def arun(self) -> Dict[str, Any]:
+        """Execute the graph as asyncio tasks; sync stage functions run in threads"""
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: Stage) -> Any:
+            kwargs = {d: await tasks[d] for d in stage.depends_on}
+            try:
+                return await self._acall(stage.func, kwargs)
+            except Exception as e:
+                if stage.fallback is None:
+                    raise
+                logger.warning(f"Stage '{stage.name}' failed, using fallback: {e}")
+                return await self._acall(stage.fallback, kwargs)
+
+        for stage in self._topological_order():
+            tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+
+        try:
+            values = await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return dict(zip(tasks.keys(), values))
+
+    @staticmethod
+    def _call(stage: Stage, kwargs: Dict) -> Any:
+        try:
+            return stage.func(**kwargs)
+        except Exception as e:
+            if stage.fallback is None:
+                raise
+            logger.warning(f"Stage '{stage.name}' failed, using fallback: {e}")
+            return stage.fallback(**kwargs)
+
+    @staticmethod
+    async def _acall(func: Callable, kwargs: Dict) -> Any:
+        if inspect.iscoroutinefunction(func):
+            return await func(**kwargs)
+        result = await asyncio.to_thread(func, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def _topological_order(self) -> List[Stage]:
+        """Stages ordered so dependencies come first; rejects unknown deps and cycles"""
+        order: List[Stage] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(name: str, parent: Optional[str]):
+            if name not in self._stages:
+                raise ValueError(f"Stage '{parent}' depends on unknown stage '{name}'")
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            state[name] = 1
+            for dep in self._stages[name].depends_on:
+                visit(dep, name)
+            state[name] = 2
+            order.append(self._stages[name])
+
+        for name in self._stages:
+            visit(name, None)
+
+        return order